@@ -14,7 +14,11 @@ Usage:
     python manage_positions.py --export  # Save report to file
 """
 
+import os
 import sys
+import json
+import hashlib
+import pickle
 import logging
 import argparse
 from datetime import datetime
@@ -29,11 +33,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Parsed copies of --entry-dates JSON files
+ENTRY_DATES_CACHE_DIR = Path('./data/cache/entry_dates')
+
+
+def load_entry_dates(path):
+    """Load a ticker -> entry datetime lookup.
+
+    Accepts a .parquet file (columns: ticker, entry_date), a .pkl file with a
+    pre-typed dict, or the original JSON mapping of ISO date strings. JSON is
+    parsed once and persisted under ./data/cache; later runs load the pickle
+    directly while the JSON is unchanged.
+
+    Args:
+        path: Path to the entry dates file
+
+    Returns:
+        Dict mapping ticker to entry datetime
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == '.parquet':
+        import pandas as pd
+        dates = pd.read_parquet(path).set_index('ticker')['entry_date']
+        return {ticker: ts.to_pydatetime() for ticker, ts in pd.to_datetime(dates).items()}
+
+    if suffix in ('.pkl', '.pickle'):
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    # Derived cache lives in our own cache dir (never next to the user's
+    # file), keyed by the JSON's resolved path and validated against its
+    # size and mtime rather than trusting whatever .pkl is newer
+    resolved = path.resolve()
+    stat = resolved.stat()
+    source_key = (stat.st_size, stat.st_mtime_ns)
+    digest = hashlib.sha1(str(resolved).encode()).hexdigest()[:16]
+    cache_path = ENTRY_DATES_CACHE_DIR / f"entry_dates_{digest}.pkl"
+
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached.get('source') == source_key:
+            return cached['entry_dates']
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+        logger.debug(f"Entry date cache miss for {path}: {e}")
+
+    with open(path, 'r') as f:
+        dates_data = json.load(f)
+    entry_dates = dict(zip(dates_data.keys(), map(datetime.fromisoformat, dates_data.values())))
+
+    try:
+        ENTRY_DATES_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'source': source_key, 'entry_dates': entry_dates}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not persist entry date cache: {e}")
+
+    return entry_dates
+
 
 def main():
     parser = argparse.ArgumentParser(description='Position Management with Stop Loss Recommendations')
     parser.add_argument('--export', action='store_true', help='Export report to file')
-    parser.add_argument('--entry-dates', type=str, help='JSON file with entry dates (optional)')
+    parser.add_argument('--entry-dates', type=str, help='Entry dates file: .json, .pkl, or .parquet (optional)')
+    parser.add_argument('--no-cache', action='store_true', help='Fetch fresh price data instead of using cached data')
     args = parser.parse_args()
 
     if not ROBINHOOD_AVAILABLE:
@@ -70,11 +138,15 @@ def main():
         print(f"\nERROR: {e}\n")
         sys.exit(1)
 
-    # Login to Robinhood (will prompt for password and SMS MFA)
-    print("Logging in to Robinhood...")
-    if not fetcher.login():
-        print("\n✗ Login failed. Check credentials.")
-        sys.exit(1)
+    # Reuse a cached session token if still valid; otherwise log in
+    # (will prompt for password and SMS MFA)
+    if fetcher.restore_session():
+        print("✓ Reusing cached Robinhood session")
+    else:
+        print("Logging in to Robinhood...")
+        if not fetcher.login():
+            print("\n✗ Login failed. Check credentials.")
+            sys.exit(1)
 
     try:
         # Fetch positions
@@ -92,16 +164,8 @@ def main():
         # Load entry dates if provided
         entry_dates = None
         if args.entry_dates:
-            import json
             try:
-                with open(args.entry_dates, 'r') as f:
-                    dates_data = json.load(f)
-                    # Convert string dates to datetime
-                    from datetime import datetime as dt
-                    entry_dates = {
-                        ticker: dt.fromisoformat(date_str)
-                        for ticker, date_str in dates_data.items()
-                    }
+                entry_dates = load_entry_dates(args.entry_dates)
                 print(f"✓ Loaded entry dates for {len(entry_dates)} tickers\n")
             except Exception as e:
                 print(f"⚠️  Could not load entry dates: {e}")
@@ -109,7 +173,7 @@ def main():
 
         # Analyze positions
         print("Analyzing positions and calculating stop recommendations...\n")
-        manager = PositionManager()
+        manager = PositionManager(use_cache=not args.no_cache)
         analysis = manager.analyze_portfolio(positions, entry_dates)
 
         # Generate report
@@ -17,11 +17,21 @@ Usage:
 """
 
 import argparse
+import io
 import logging
+import os
+import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
 from src.data.universe_fetcher import USStockUniverseFetcher
 from src.screening.optimized_batch_processor import OptimizedBatchProcessor
 from src.screening.benchmark import (
@@ -32,6 +42,7 @@ from src.screening.benchmark import (
 )
 from src.screening.signal_engine import score_buy_signal, score_sell_signal
 from src.data.enhanced_fundamentals import EnhancedFundamentalsFetcher
+from src.data.http_session import create_pooled_session
 
 logging.basicConfig(
     level=logging.INFO,
@@ -39,29 +50,377 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True, frozen=True)
+class ScanConfig:
+    """Resolved scan settings (CLI args after presets are applied)."""
+
+    workers: int
+    delay: float
+    use_fmp: bool
+    git_storage: bool
+    resume: bool
+    clear_progress: bool
+    test_mode: bool
+    min_price: float
+    min_volume: int
+    output_dir: str = "./data/daily_scans"
+    debug: bool = False
+    no_cache: bool = False
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> 'ScanConfig':
+        """Freeze an argparse Namespace into a ScanConfig."""
+        return cls(
+            workers=args.workers,
+            delay=args.delay,
+            use_fmp=args.use_fmp,
+            git_storage=args.git_storage,
+            resume=args.resume,
+            clear_progress=args.clear_progress,
+            test_mode=args.test_mode,
+            min_price=args.min_price,
+            min_volume=args.min_volume,
+            output_dir=args.output_dir,
+            debug=args.debug,
+            no_cache=args.no_cache
+        )
+
+
+# Analyses per pickled task sent to each scoring process
+SCORING_CHUNKSIZE = 64
+
+# Concurrent fundamental snapshot fetches while scoring continues
+SNAPSHOT_WORKERS = 8
+
+# SPY daily bars persisted between scans (refreshed incrementally)
+SPY_CACHE_PATH = Path("./data/cache/spy_prices.pkl")
+
+
+def _load_or_update_spy(cache_path=SPY_CACHE_PATH, session=None):
+    """Load SPY daily bars from disk, fetching only bars newer than the cache.
+
+    SPY gains at most one bar per day, so re-downloading a full year every
+    scan is wasted. The last cached bar is re-fetched too, in case it was an
+    intraday partial bar.
+
+    Args:
+        cache_path: Pickle file holding the cached SPY DataFrame
+        session: Optional shared HTTP session
+
+    Returns:
+        SPY OHLCV DataFrame (~1 year, DatetimeIndex) or None on failure
+    """
+    cached = None
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load SPY cache: {e}")
+
+    if cached is not None and not cached.empty and cached.index[-1].date() >= datetime.now().date():
+        logger.info(f"SPY cache current ({len(cached)} days), skipping fetch")
+        return cached
+
+    try:
+        spy = yf.Ticker('SPY', session=session)
+        if cached is None or cached.empty:
+            fresh = spy.history(period='1y', interval='1d')
+        else:
+            fresh = spy.history(start=cached.index[-1].strftime('%Y-%m-%d'), interval='1d')
+    except Exception as e:
+        logger.warning(f"SPY refresh failed: {e}")
+        return cached
+
+    if not fresh.empty:
+        fresh = fresh[['Open', 'High', 'Low', 'Close', 'Volume']]
+
+    if cached is not None and not cached.empty:
+        combined = pd.concat([cached, fresh])
+        combined = combined[~combined.index.duplicated(keep='last')]
+        combined = combined[combined.index > combined.index[-1] - pd.DateOffset(years=1)]
+    else:
+        combined = fresh
+
+    if combined.empty:
+        return None
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(combined, f)
+    except Exception as e:
+        logger.warning(f"Failed to save SPY cache: {e}")
+
+    logger.info(f"SPY updated: {len(fresh)} new/refreshed days, {len(combined)} cached")
+    return combined
+
+
+def _score_buy_worker(analysis):
+    """Score one Phase 1/2 analysis (top-level so the process pool can pickle it)."""
+    return score_buy_signal(
+        ticker=analysis['ticker'],
+        price_data=analysis['price_data'],
+        current_price=analysis['current_price'],
+        phase_info=analysis['phase_info'],
+        rs_series=analysis['rs_series'],
+        fundamentals=analysis.get('quarterly_data'),  # Pass raw quarterly data, not analyzed
+        vcp_data=analysis.get('vcp_data')
+    )
+
+
+def _score_sell_worker(analysis):
+    """Score one Phase 3/4 analysis (top-level so the process pool can pickle it)."""
+    return score_sell_signal(
+        ticker=analysis['ticker'],
+        price_data=analysis['price_data'],
+        current_price=analysis['current_price'],
+        phase_info=analysis['phase_info'],
+        rs_series=analysis['rs_series'],
+        fundamentals=analysis.get('quarterly_data')  # Pass raw quarterly data, not analyzed
+    )
+
+
+# Per-signal report blocks: optional lines are resolved first, then the whole
+# block is rendered by a single format_map call.
+BUY_SIGNAL_TEMPLATE = (
+    "\n{rule}\n"
+    "{score_emoji} BUY #{rank}: {ticker} | Score: {score}/110\n"
+    "{rule}\n"
+    "Phase: {phase}\n"
+    "{entry_emoji} Entry Quality: {entry_quality}{extra_lines}\n"
+    "\nKey Reasons:{reasons}{snapshot}"
+)
+
+SELL_SIGNAL_TEMPLATE = (
+    "\n{rule}\n"
+    "{score_emoji} SELL #{rank}: {ticker} | Score: {score}/110\n"
+    "{rule}\n"
+    "Phase: {phase} | {severity_emoji} Severity: {severity}{extra_lines}\n"
+    "\nSell Reasons:{reasons}{snapshot}"
+)
+
+REPORT_RULE = '#' * 80
 
-def save_report(results, buy_signals, sell_signals, spy_analysis, breadth, output_dir="./data/daily_scans"):
+
+def _format_buy_signal(rank, signal):
+    """Render one buy signal block for the scan report."""
+    score = signal['score']
+    # Score-based emoji (green/yellow with star for exceptional)
+    if score >= 90:
+        score_emoji = "⭐"  # Exceptional - star
+    elif score >= 70:
+        score_emoji = "🟢"  # Good / very good - green
+    else:
+        score_emoji = "🟡"  # Borderline - yellow
+
+    entry_quality = signal.get('entry_quality', 'Unknown')
+    if entry_quality == 'Good':
+        entry_emoji = "🟢"
+    elif entry_quality == 'Extended':
+        entry_emoji = "🟡"
+    else:
+        entry_emoji = "🔴"
+
+    details = signal.get('details', {})
+    extra = []
+
+    # CRITICAL: Stop loss and R/R ratio
+    if signal.get('stop_loss'):
+        extra.append(f"Stop Loss: ${signal['stop_loss']:.2f}")
+        risk_amt = details.get('risk_amount', 0)
+        reward_amt = details.get('reward_amount', 0)
+        rr_ratio = signal.get('risk_reward_ratio', 0)
+        rr_emoji = "🟢" if rr_ratio >= 2 else "🟡"  # Good/excellent vs poor R/R
+        extra.append(f"{rr_emoji} Risk/Reward: {rr_ratio:.1f}:1 (Risk ${risk_amt:.2f}, Reward ${reward_amt:.2f})")
+
+    if signal.get('breakout_price'):
+        extra.append(f"Breakout: ${signal['breakout_price']:.2f}")
+
+    if 'rs_slope' in details:
+        rs_slope = details['rs_slope']
+        # RS emoji (green = strong, yellow = positive, red = weak)
+        if rs_slope > 0.5:
+            rs_emoji = "🟢"
+        elif rs_slope > 0:
+            rs_emoji = "🟡"
+        else:
+            rs_emoji = "🔴"
+        extra.append(f"{rs_emoji} RS: {rs_slope:.3f}")
+
+    if 'volume_ratio' in details:
+        vol_ratio = details['volume_ratio']
+        if vol_ratio > 1.5:
+            vol_emoji = "🟢"  # High volume
+        elif vol_ratio > 1.0:
+            vol_emoji = "🟡"  # Above average
+        else:
+            vol_emoji = "🔴"  # Low volume
+        extra.append(f"{vol_emoji} Volume: {vol_ratio:.1f}x")
+
+    # VCP pattern details if detected
+    vcp_data = details.get('vcp_data')
+    if vcp_data:
+        vcp_quality = vcp_data.get('quality', 0)
+        if vcp_quality >= 50:
+            if vcp_quality >= 80:
+                vcp_emoji = "⭐"  # Exceptional VCP
+            elif vcp_quality >= 60:
+                vcp_emoji = "🟢"  # Good VCP
+            else:
+                vcp_emoji = "🟡"  # Marginal VCP
+            extra.append(f"{vcp_emoji} VCP: {vcp_data.get('pattern', 'N/A')} (quality: {vcp_quality:.0f}/100)")
+
+    snapshot = signal.get('fundamental_snapshot')
+
+    return BUY_SIGNAL_TEMPLATE.format_map({
+        'rule': REPORT_RULE,
+        'score_emoji': score_emoji,
+        'rank': rank,
+        'ticker': signal['ticker'],
+        'score': score,
+        'phase': signal['phase'],
+        'entry_emoji': entry_emoji,
+        'entry_quality': entry_quality,
+        'extra_lines': ''.join('\n' + line for line in extra),
+        'reasons': ''.join(f"\n  • {reason}" for reason in signal['reasons'][:7]),
+        'snapshot': f"\n{snapshot}" if snapshot else ''
+    })
+
+
+def _format_sell_signal(rank, signal):
+    """Render one sell signal block for the scan report."""
+    score = signal['score']
+    severity = signal['severity']
+
+    # Severity emoji (red/yellow with alarm for critical)
+    if severity == 'critical':
+        severity_emoji = "🚨"
+    elif severity == 'high':
+        severity_emoji = "🔴"
+    else:
+        severity_emoji = "🟡"
+
+    # Score emoji (higher score = more urgent to sell)
+    if score >= 80:
+        score_emoji = "🚨"
+    elif score >= 70:
+        score_emoji = "🔴"
+    else:
+        score_emoji = "🟡"
+
+    extra = []
+    if signal.get('breakdown_level'):
+        extra.append(f"Breakdown: ${signal['breakdown_level']:.2f}")
+
+    details = signal.get('details', {})
+    if 'rs_slope' in details:
+        rs_slope = details['rs_slope']
+        # RS emoji for sell signals (negative is expected)
+        if rs_slope < -0.5:
+            rs_emoji = "🔴"  # Very weak RS
+        elif rs_slope < 0:
+            rs_emoji = "🟡"  # Weak RS
+        else:
+            rs_emoji = "🟢"  # Still positive RS (unusual for sell)
+        extra.append(f"{rs_emoji} RS: {rs_slope:.3f}")
+
+    snapshot = signal.get('fundamental_snapshot')
+
+    return SELL_SIGNAL_TEMPLATE.format_map({
+        'rule': REPORT_RULE,
+        'score_emoji': score_emoji,
+        'rank': rank,
+        'ticker': signal['ticker'],
+        'score': score,
+        'phase': signal['phase'],
+        'severity_emoji': severity_emoji,
+        'severity': severity.upper(),
+        'extra_lines': ''.join('\n' + line for line in extra),
+        'reasons': ''.join(f"\n  • {reason}" for reason in signal['reasons'][:5]),
+        'snapshot': f"\n{snapshot}" if snapshot else ''
+    })
+
+
+def _rank_signals(signals, top_n):
+    """Split signals into the top_n by score and the remaining tickers.
+
+    Uses a DataFrame partial sort (nlargest) rather than sorting every
+    signal dict in Python. Ties keep their original order, matching a
+    stable descending sort.
+
+    Args:
+        signals: Signal dicts with 'ticker' and 'score'
+        top_n: Number of signals to return in full
+
+    Returns:
+        Tuple of (top signal dicts, remaining tickers), both by score descending
+    """
+    if not signals:
+        return [], []
+
+    df = pd.DataFrame({
+        'ticker': [s['ticker'] for s in signals],
+        'score': [s['score'] for s in signals]
+    })
+    top = df.nlargest(top_n, 'score')
+    rest = df.drop(top.index).sort_values('score', ascending=False, kind='stable')
+
+    return [signals[row.Index] for row in top.itertuples()], rest['ticker'].tolist()
+
+
+def _ticker_rows(tickers, per_row=10):
+    """Comma-separated ticker rows, per_row to a line, as one string."""
+    return "\n".join(", ".join(tickers[i:i + per_row]) for i in range(0, len(tickers), per_row))
+
+
+def _publish_latest(filepath, latest_path):
+    """Point latest_path at filepath without writing the report a second time.
+
+    The link is created under a temporary name and renamed over latest_path,
+    so readers tailing "latest" never see it missing or half-written.
+    Hardlink first; symlink if the filesystem refuses hardlinks; a plain
+    copy only as a last resort.
+    """
+    tmp_path = latest_path.with_name(latest_path.name + '.tmp')
+    tmp_path.unlink(missing_ok=True)
+    try:
+        os.link(filepath, tmp_path)
+    except OSError:
+        try:
+            os.symlink(filepath.name, tmp_path)
+        except OSError:
+            with open(filepath, 'rb') as src, open(tmp_path, 'wb', buffering=1 << 20) as dst:
+                dst.write(src.read())
+    os.replace(tmp_path, latest_path)
+
+
+def save_report(cfg, results, buy_signals, sell_signals, spy_analysis, breadth):
     """Save comprehensive report."""
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    output_dir = Path(cfg.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    date_str = datetime.now().strftime('%Y-%m-%d')
+    now = datetime.now()
+    timestamp = now.strftime('%Y%m%d_%H%M%S')
+    date_str = now.strftime('%Y-%m-%d')
 
-    output = []
-    output.append("="*80)
-    output.append("OPTIMIZED FULL MARKET SCAN - ALL US STOCKS")
-    output.append(f"Scan Date: {date_str}")
-    output.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    output.append("="*80)
-    output.append("")
+    buf = io.StringIO()
+    emit = partial(print, file=buf)  # one line + newline per call
+
+    emit("="*80)
+    emit("OPTIMIZED FULL MARKET SCAN - ALL US STOCKS")
+    emit(f"Scan Date: {date_str}")
+    emit(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+    emit("="*80)
+    emit("")
 
     # Stats
-    output.append("SCANNING STATISTICS")
-    output.append("-"*80)
-    output.append(f"Total Universe: {results['total_processed']:,} stocks")
-    output.append(f"Analyzed: {results['total_analyzed']:,} stocks")
-    output.append(f"Processing Time: {results['processing_time_seconds']/60:.1f} minutes")
-    output.append(f"Actual TPS: {results['actual_tps']:.2f}")
+    emit("SCANNING STATISTICS")
+    emit("-"*80)
+    emit(f"Total Universe: {results['total_processed']:,} stocks")
+    emit(f"Analyzed: {results['total_analyzed']:,} stocks")
+    emit(f"Processing Time: {results['processing_time_seconds']/60:.1f} minutes")
+    emit(f"Actual TPS: {results['actual_tps']:.2f}")
 
     error_rate = results['error_rate'] * 100
     if error_rate < 1:
@@ -70,209 +429,74 @@ def save_report(results, buy_signals, sell_signals, spy_analysis, breadth, outpu
         error_emoji = "🟡"
     else:
         error_emoji = "🔴"
-    output.append(f"{error_emoji} Error Rate: {error_rate:.2f}%")
+    emit(f"{error_emoji} Error Rate: {error_rate:.2f}%")
 
     # Buy/Sell signal counts with emoji
     if len(buy_signals) > 0:
-        output.append(f"🟢 Buy Signals: {len(buy_signals)}")
+        emit(f"🟢 Buy Signals: {len(buy_signals)}")
     else:
-        output.append(f"Buy Signals: {len(buy_signals)}")
+        emit(f"Buy Signals: {len(buy_signals)}")
 
     if len(sell_signals) > 0:
-        output.append(f"🔴 Sell Signals: {len(sell_signals)}")
+        emit(f"🔴 Sell Signals: {len(sell_signals)}")
     else:
-        output.append(f"Sell Signals: {len(sell_signals)}")
-    output.append("")
+        emit(f"Sell Signals: {len(sell_signals)}")
+    emit("")
 
     # Benchmark
-    output.append(format_benchmark_summary(spy_analysis, breadth))
-    output.append("")
+    emit(format_benchmark_summary(spy_analysis, breadth))
+    emit("")
 
     # Buy signals
-    output.append("="*80)
-    output.append(f"🟢 TOP BUY SIGNALS (Score >= 70) - {len(buy_signals)} Total")
-    output.append("="*80)
-    output.append("")
+    emit("="*80)
+    emit(f"🟢 TOP BUY SIGNALS (Score >= 70) - {len(buy_signals)} Total")
+    emit("="*80)
+    emit("")
 
+    top_buys, remaining_buys = _rank_signals(buy_signals, 50)
     if buy_signals:
-        for i, signal in enumerate(buy_signals[:50], 1):
-            score = signal['score']
-            # Score-based emoji (green/yellow with star for exceptional)
-            if score >= 90:
-                score_emoji = "⭐"  # Exceptional - star
-            elif score >= 80:
-                score_emoji = "🟢"  # Very good - green
-            elif score >= 70:
-                score_emoji = "🟢"  # Good - green
-            else:
-                score_emoji = "🟡"  # Borderline - yellow
-
-            output.append(f"\n{'#'*80}")
-            output.append(f"{score_emoji} BUY #{i}: {signal['ticker']} | Score: {signal['score']}/110")
-            output.append(f"{'#'*80}")
-            output.append(f"Phase: {signal['phase']}")
-
-            # Entry quality with emoji
-            entry_quality = signal.get('entry_quality', 'Unknown')
-            if entry_quality == 'Good':
-                output.append(f"🟢 Entry Quality: {entry_quality}")
-            elif entry_quality == 'Extended':
-                output.append(f"🟡 Entry Quality: {entry_quality}")
-            else:
-                output.append(f"🔴 Entry Quality: {entry_quality}")
-
-            # CRITICAL: Stop loss and R/R ratio
-            if signal.get('stop_loss'):
-                output.append(f"Stop Loss: ${signal['stop_loss']:.2f}")
-                details = signal.get('details', {})
-                risk_amt = details.get('risk_amount', 0)
-                reward_amt = details.get('reward_amount', 0)
-                rr_ratio = signal.get('risk_reward_ratio', 0)
-                # R/R ratio emoji
-                if rr_ratio >= 3:
-                    rr_emoji = "🟢"  # Excellent R/R
-                elif rr_ratio >= 2:
-                    rr_emoji = "🟢"  # Good R/R
-                else:
-                    rr_emoji = "🟡"  # Poor R/R
-                output.append(f"{rr_emoji} Risk/Reward: {rr_ratio:.1f}:1 (Risk ${risk_amt:.2f}, Reward ${reward_amt:.2f})")
-
-            if signal.get('breakout_price'):
-                output.append(f"Breakout: ${signal['breakout_price']:.2f}")
-
-            details = signal.get('details', {})
-            if 'rs_slope' in details:
-                rs_slope = details['rs_slope']
-                # RS emoji (green = good, yellow = ok, red = bad)
-                if rs_slope > 0.5:
-                    rs_emoji = "🟢"  # Strong RS
-                elif rs_slope > 0:
-                    rs_emoji = "🟡"  # Positive RS
-                else:
-                    rs_emoji = "🔴"  # Weak RS
-                output.append(f"{rs_emoji} RS: {rs_slope:.3f}")
-            if 'volume_ratio' in details:
-                vol_ratio = details['volume_ratio']
-                # Volume emoji
-                if vol_ratio > 1.5:
-                    vol_emoji = "🟢"  # High volume
-                elif vol_ratio > 1.0:
-                    vol_emoji = "🟡"  # Above average
-                else:
-                    vol_emoji = "🔴"  # Low volume
-                output.append(f"{vol_emoji} Volume: {vol_ratio:.1f}x")
-
-            # VCP pattern details if detected
-            vcp_data = details.get('vcp_data')
-            if vcp_data:
-                vcp_quality = vcp_data.get('quality', 0)
-                contractions = vcp_data.get('contractions', 0)
-                pattern = vcp_data.get('pattern', 'N/A')
-
-                if vcp_quality >= 80:
-                    vcp_emoji = "⭐"  # Exceptional VCP
-                elif vcp_quality >= 60:
-                    vcp_emoji = "🟢"  # Good VCP
-                elif vcp_quality >= 50:
-                    vcp_emoji = "🟡"  # Marginal VCP
-                else:
-                    vcp_emoji = "🟡"  # Partial pattern
-
-                if vcp_quality >= 50:
-                    output.append(f"{vcp_emoji} VCP: {pattern} (quality: {vcp_quality:.0f}/100)")
-
-            output.append("\nKey Reasons:")
-            for reason in signal['reasons'][:7]:  # Show 7 instead of 5
-                output.append(f"  • {reason}")
-
-            if signal.get('fundamental_snapshot'):
-                output.append(signal['fundamental_snapshot'])
-
-        if len(buy_signals) > 50:
-            output.append(f"\n{'='*80}")
-            output.append(f"ADDITIONAL BUYS ({len(buy_signals)-50} more)")
-            output.append(f"{'='*80}\n")
-            remaining = [s['ticker'] for s in buy_signals[50:]]
-            for i in range(0, len(remaining), 10):
-                output.append(", ".join(remaining[i:i+10]))
+        for i, signal in enumerate(top_buys, 1):
+            emit(_format_buy_signal(i, signal))
+
+        if remaining_buys:
+            emit(f"\n{'='*80}")
+            emit(f"ADDITIONAL BUYS ({len(remaining_buys)} more)")
+            emit(f"{'='*80}\n")
+            emit(_ticker_rows(remaining_buys))
     else:
-        output.append("✗ NO BUY SIGNALS TODAY")
+        emit("✗ NO BUY SIGNALS TODAY")
 
     # Sell signals
-    output.append(f"\n\n{'='*80}")
-    output.append(f"🔴 TOP SELL SIGNALS (Score >= 60) - {len(sell_signals)} Total")
-    output.append(f"{'='*80}")
-    output.append("")
+    emit(f"\n\n{'='*80}")
+    emit(f"🔴 TOP SELL SIGNALS (Score >= 60) - {len(sell_signals)} Total")
+    emit(f"{'='*80}")
+    emit("")
 
+    top_sells, remaining_sells = _rank_signals(sell_signals, 30)
     if sell_signals:
-        for i, signal in enumerate(sell_signals[:30], 1):
-            score = signal['score']
-            severity = signal['severity']
-
-            # Severity emoji (red/yellow with alarm for critical)
-            if severity == 'critical':
-                severity_emoji = "🚨"  # Critical - alarm
-            elif severity == 'high':
-                severity_emoji = "🔴"  # High - red
-            else:
-                severity_emoji = "🟡"  # Moderate - yellow
-
-            # Score emoji (higher score = more urgent to sell)
-            if score >= 80:
-                score_emoji = "🚨"  # Very urgent - alarm
-            elif score >= 70:
-                score_emoji = "🔴"  # Urgent - red
-            else:
-                score_emoji = "🟡"  # Warning - yellow
-
-            output.append(f"\n{'#'*80}")
-            output.append(f"{score_emoji} SELL #{i}: {signal['ticker']} | Score: {signal['score']}/110")
-            output.append(f"{'#'*80}")
-            output.append(f"Phase: {signal['phase']} | {severity_emoji} Severity: {severity.upper()}")
-            if signal.get('breakdown_level'):
-                output.append(f"Breakdown: ${signal['breakdown_level']:.2f}")
-            details = signal.get('details', {})
-            if 'rs_slope' in details:
-                rs_slope = details['rs_slope']
-                # RS emoji for sell signals (negative is expected)
-                if rs_slope < -0.5:
-                    rs_emoji = "🔴"  # Very weak RS
-                elif rs_slope < 0:
-                    rs_emoji = "🟡"  # Weak RS
-                else:
-                    rs_emoji = "🟢"  # Still positive RS (unusual for sell)
-                output.append(f"{rs_emoji} RS: {rs_slope:.3f}")
-            output.append("\nSell Reasons:")
-            for reason in signal['reasons'][:5]:
-                output.append(f"  • {reason}")
-
-            if signal.get('fundamental_snapshot'):
-                output.append(signal['fundamental_snapshot'])
-
-        if len(sell_signals) > 30:
-            output.append(f"\n{'='*80}")
-            output.append(f"ADDITIONAL SELLS ({len(sell_signals)-30} more)")
-            output.append(f"{'='*80}\n")
-            remaining = [s['ticker'] for s in sell_signals[30:]]
-            for i in range(0, len(remaining), 10):
-                output.append(", ".join(remaining[i:i+10]))
+        for i, signal in enumerate(top_sells, 1):
+            emit(_format_sell_signal(i, signal))
+
+        if remaining_sells:
+            emit(f"\n{'='*80}")
+            emit(f"ADDITIONAL SELLS ({len(remaining_sells)} more)")
+            emit(f"{'='*80}\n")
+            emit(_ticker_rows(remaining_sells))
     else:
-        output.append("✗ NO SELL SIGNALS TODAY")
+        emit("✗ NO SELL SIGNALS TODAY")
 
-    output.append(f"\n\n{'='*80}")
-    output.append("END OF SCAN")
-    output.append(f"{'='*80}\n")
+    emit(f"\n\n{'='*80}")
+    emit("END OF SCAN")
+    buf.write(f"{'='*80}\n")
 
-    report_text = "\n".join(output)
+    report_text = buf.getvalue()
 
-    # Save
-    filepath = Path(output_dir) / f"optimized_scan_{timestamp}.txt"
-    with open(filepath, 'w') as f:
-        f.write(report_text)
+    # Save: encode once, write once, hardlink "latest" to the same inode
+    filepath = output_dir / f"optimized_scan_{timestamp}.txt"
+    with open(filepath, 'wb', buffering=1 << 20) as f:
+        f.write(report_text.encode('utf-8'))
 
-    latest_path = Path(output_dir) / "latest_optimized_scan.txt"
-    with open(latest_path, 'w') as f:
-        f.write(report_text)
+    _publish_latest(filepath, output_dir / "latest_optimized_scan.txt")
 
     logger.info(f"Report saved: {filepath}")
     print(report_text)
@@ -293,6 +517,9 @@ def main():
     parser.add_argument('--min-volume', type=int, default=100000, help='Min volume')
     parser.add_argument('--use-fmp', action='store_true', help='Use FMP for enhanced fundamentals on buy signals')
     parser.add_argument('--git-storage', action='store_true', help='Use Git-based storage for fundamentals (recommended)')
+    parser.add_argument('--output-dir', type=str, default='./data/daily_scans', help='Report directory')
+    parser.add_argument('--debug', action='store_true', help='Log full tracebacks on fatal errors')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the on-disk API response cache')
 
     args = parser.parse_args()
 
@@ -306,14 +533,25 @@ def main():
         args.delay = 0.3
         logger.warning("Aggressive mode: 5 workers, 0.3s delay (~17 TPS) - MAY HIT RATE LIMITS!")
 
-    effective_tps = args.workers / args.delay
-    logger.info(f"Configuration: {args.workers} workers × {1/args.delay:.1f} TPS = ~{effective_tps:.1f} TPS effective")
+    cfg = ScanConfig.from_args(args)
+
+    effective_tps = cfg.workers / cfg.delay
+    logger.info(f"Configuration: {cfg.workers} workers × {1/cfg.delay:.1f} TPS = ~{effective_tps:.1f} TPS effective")
+
+    # One pooled session shared by all workers (keep-alive, no per-ticker TLS handshake)
+    http_session = create_pooled_session(
+        pool_connections=cfg.workers,
+        pool_maxsize=max(32, cfg.workers * 4)
+    )
 
     # Initialize enhanced fundamentals fetcher
-    fundamentals_fetcher = EnhancedFundamentalsFetcher()
-    if args.use_fmp and fundamentals_fetcher.fmp_available:
+    fundamentals_fetcher = EnhancedFundamentalsFetcher(
+        session=http_session,
+        use_cache=not cfg.no_cache
+    )
+    if cfg.use_fmp and fundamentals_fetcher.fmp_available:
         logger.info("FMP enabled - will use for buy signal fundamentals")
-    elif args.use_fmp:
+    elif cfg.use_fmp:
         logger.warning("--use-fmp specified but FMP_API_KEY not set. Using yfinance only.")
 
     try:
@@ -328,29 +566,34 @@ def main():
 
         logger.info(f"Universe: {len(tickers):,} stocks")
 
-        if args.test_mode:
+        if cfg.test_mode:
             tickers = tickers[:100]
             logger.info(f"TEST MODE: {len(tickers)} stocks")
 
         # Initialize processor
         processor = OptimizedBatchProcessor(
-            max_workers=args.workers,
-            rate_limit_delay=args.delay,
-            use_git_storage=args.git_storage
+            max_workers=cfg.workers,
+            rate_limit_delay=cfg.delay,
+            use_git_storage=cfg.git_storage,
+            http_session=http_session
         )
 
-        if args.git_storage:
+        spy_data = _load_or_update_spy(session=http_session)
+        if spy_data is not None:
+            processor.set_spy_data(spy_data)
+
+        if cfg.git_storage:
             logger.info("Git-based fundamental storage enabled - 74% API call reduction!")
 
-        if args.clear_progress:
+        if cfg.clear_progress:
             processor.clear_progress()
 
         # Process
         results = processor.process_batch_parallel(
             tickers,
-            resume=args.resume,
-            min_price=args.min_price,
-            min_volume=args.min_volume
+            resume=cfg.resume,
+            min_price=cfg.min_price,
+            min_volume=cfg.min_volume
         )
 
         if 'error' in results:
@@ -363,60 +606,60 @@ def main():
         breadth = calculate_market_breadth(results['phase_results'])
         signal_rec = should_generate_signals(spy_analysis, breadth)
 
-        # Buy signals
-        buy_signals = []
+        # Score in a process pool: scoring is CPU-bound pandas/NumPy work.
+        # Snapshots (blocking FMP/yfinance calls) are handed to a thread pool
+        # as soon as a signal qualifies, so they overlap with the remaining
+        # scoring and the workers never need the FMP session.
+        analyses = results['analyses']
+        phases = np.fromiter(
+            (a['phase_info']['phase'] for a in analyses), dtype=np.int8, count=len(analyses)
+        )
+        buy_candidates = []
         if signal_rec['should_generate_buys']:
-            for analysis in results['analyses']:
-                if analysis['phase_info']['phase'] in [1, 2]:
-                    signal = score_buy_signal(
-                        ticker=analysis['ticker'],
-                        price_data=analysis['price_data'],
-                        current_price=analysis['current_price'],
-                        phase_info=analysis['phase_info'],
-                        rs_series=analysis['rs_series'],
-                        fundamentals=analysis.get('quarterly_data'),  # Pass raw quarterly data, not analyzed
-                        vcp_data=analysis.get('vcp_data')  # Added VCP data
-                    )
-                    if signal['is_buy']:
-                        # Use FMP for enhanced snapshot if requested and available
-                        signal['fundamental_snapshot'] = fundamentals_fetcher.create_snapshot(
-                            analysis['ticker'],
-                            quarterly_data=analysis.get('quarterly_data', {}),
-                            use_fmp=args.use_fmp
-                        )
-                        buy_signals.append(signal)
-
-        buy_signals = sorted(buy_signals, key=lambda x: x['score'], reverse=True)
-
-        # Sell signals
-        sell_signals = []
+            buy_idx = np.flatnonzero((phases == 1) | (phases == 2))
+            buy_candidates = [analyses[i] for i in buy_idx]
+        sell_candidates = []
         if signal_rec['should_generate_sells']:
-            for analysis in results['analyses']:
-                if analysis['phase_info']['phase'] in [3, 4]:
-                    signal = score_sell_signal(
-                        ticker=analysis['ticker'],
-                        price_data=analysis['price_data'],
-                        current_price=analysis['current_price'],
-                        phase_info=analysis['phase_info'],
-                        rs_series=analysis['rs_series'],
-                        fundamentals=analysis.get('quarterly_data')  # Pass raw quarterly data, not analyzed
-                    )
-                    if signal['is_sell']:
-                        # Add fundamental snapshot
-                        signal['fundamental_snapshot'] = fundamentals_fetcher.create_snapshot(
-                            analysis['ticker'],
-                            quarterly_data=analysis.get('quarterly_data', {}),
-                            use_fmp=args.use_fmp
-                        )
-                        sell_signals.append(signal)
-
-        sell_signals = sorted(sell_signals, key=lambda x: x['score'], reverse=True)
-
-        # Report
-        save_report(results, buy_signals, sell_signals, spy_analysis, breadth)
+            sell_idx = np.flatnonzero((phases == 3) | (phases == 4))
+            sell_candidates = [analyses[i] for i in sell_idx]
+
+        buy_signals = []
+        sell_signals = []
+        snapshot_futures = {}
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor, \
+                ThreadPoolExecutor(max_workers=SNAPSHOT_WORKERS) as snapshot_pool:
+            buy_scored = executor.map(_score_buy_worker, buy_candidates, chunksize=SCORING_CHUNKSIZE)
+            sell_scored = executor.map(_score_sell_worker, sell_candidates, chunksize=SCORING_CHUNKSIZE)
+
+            def submit_snapshot(analysis, signal):
+                future = snapshot_pool.submit(
+                    fundamentals_fetcher.create_snapshot,
+                    analysis['ticker'],
+                    quarterly_data=analysis.get('quarterly_data', {}),
+                    use_fmp=cfg.use_fmp  # FMP for enhanced snapshot if requested and available
+                )
+                snapshot_futures[future] = signal
+
+            # Buy signals
+            for analysis, signal in zip(buy_candidates, buy_scored):
+                if signal['is_buy']:
+                    submit_snapshot(analysis, signal)
+                    buy_signals.append(signal)
+
+            # Sell signals
+            for analysis, signal in zip(sell_candidates, sell_scored):
+                if signal['is_sell']:
+                    submit_snapshot(analysis, signal)
+                    sell_signals.append(signal)
+
+            for future in as_completed(snapshot_futures):
+                snapshot_futures[future]['fundamental_snapshot'] = future.result()
+
+        # Report (ranks signals by score)
+        save_report(cfg, results, buy_signals, sell_signals, spy_analysis, breadth)
 
         # Show FMP usage if enabled
-        if args.use_fmp:
+        if cfg.use_fmp:
             usage = fundamentals_fetcher.get_api_usage()
             logger.info("="*60)
             logger.info("FMP API USAGE")
@@ -439,8 +682,11 @@ def main():
         logger.info("\nInterrupted - progress saved")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        # Tracebacks only on request; the message alone is enough for scheduled runs
+        logger.error(f"Fatal error: {e}", exc_info=cfg.debug)
         sys.exit(1)
+    finally:
+        http_session.close()
 
 
 if __name__ == '__main__':
@@ -20,18 +20,389 @@ Usage:
 import sys
 import logging
 import argparse
-import json
+import multiprocessing as mp
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
+import numpy as np
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Import components once at module load (also what pool workers see)
+try:
+    from src.long_term import compounder_engine as compounder_engine_module
+    from src.long_term import etf_engine as etf_engine_module
+    from src.long_term import metrics as metrics_module
+    from src.long_term.compounder_engine import CompounderEngine
+    from src.long_term.regime_classifier import RegimeClassifier
+    from src.long_term.etf_engine import ETFEngine
+    from src.long_term.etf_universe import ETFUniverse
+    from src.long_term.portfolio_constructor import PortfolioConstructor
+    from src.long_term.report_generator import ReportGenerator
+    from src.long_term.score_cache import (
+        ScoreCache,
+        TickerScoreCache,
+        freeze,
+        input_digest,
+        source_fingerprint,
+    )
+except ImportError as e:
+    logger.error(f"✗ Failed to import components: {e}")
+    raise
+
+# Real data fetchers are optional; without them the scan uses mock data
+try:
+    from src.data.universe_fetcher import USStockUniverseFetcher
+    from src.data.fetcher import YahooFinanceFetcher
+    from src.long_term.data_fetcher import LongTermFundamentalsFetcher
+    REAL_DATA_AVAILABLE = True
+    REAL_DATA_IMPORT_ERROR = None
+except ImportError as e:
+    REAL_DATA_AVAILABLE = False
+    REAL_DATA_IMPORT_ERROR = e
+
+
+# Seconds between data requests (0.5s = 2 requests/second across all workers)
+REQUEST_INTERVAL = 0.5
+
+# Thematic ETF groups scored in STEP 4
+ETF_THEMES = ("ai_cloud", "defense", "energy_transition", "healthcare_innovation", "cybersecurity")
+
+# Theme ID -> display name for the portfolio theme breakdown
+_THEME_DISPLAY = {
+    "ai_cloud": "Ai Cloud",
+    "defense": "Defense",
+    "energy_transition": "Energy Transition",
+    "healthcare_innovation": "Healthcare Innovation",
+    "cybersecurity": "Cybersecurity",
+}
+
+# Disk memo of stock/ETF scores, reused when inputs and engine are unchanged
+SCORE_CACHE_DIR = Path("data/cache/long_term_scores")
+
+# Stock lists as (ticker, name, sector) rows; _stock_dicts builds the dicts
+# on request
+
+# Test-mode stock list
+_TEST_UNIVERSE = (
+    ("AAPL", "Apple", "Technology"),
+    ("MSFT", "Microsoft", "Technology"),
+    ("NVDA", "NVIDIA", "Technology"),
+    ("GOOGL", "Alphabet", "Technology"),
+    ("META", "Meta", "Technology"),
+    ("JPM", "JPMorgan", "Financials"),
+    ("UNH", "United Health", "Healthcare"),
+    ("JNJ", "Johnson & Johnson", "Healthcare"),
+    ("PG", "Procter & Gamble", "Consumer"),
+    ("WMT", "Walmart", "Consumer"),
+)
+
+# Fallback hardcoded stock list (top 50 by market cap)
+_DEFAULT_UNIVERSE = (
+    ("AAPL", "Apple", "Information Technology"),
+    ("MSFT", "Microsoft", "Information Technology"),
+    ("NVDA", "NVIDIA", "Information Technology"),
+    ("GOOGL", "Alphabet", "Information Technology"),
+    ("GOOG", "Alphabet", "Information Technology"),
+    ("META", "Meta", "Information Technology"),
+    ("AMZN", "Amazon", "Consumer Discretionary"),
+    ("TSLA", "Tesla", "Consumer Discretionary"),
+    ("BRK.B", "Berkshire Hathaway", "Financials"),
+    ("JPM", "JPMorgan Chase", "Financials"),
+    ("V", "Visa", "Information Technology"),
+    ("WMT", "Walmart", "Consumer Staples"),
+    ("PG", "Procter & Gamble", "Consumer Staples"),
+    ("JNJ", "Johnson & Johnson", "Healthcare"),
+    ("UNH", "UnitedHealth Group", "Healthcare"),
+    ("XOM", "ExxonMobil", "Energy"),
+    ("CVX", "Chevron", "Energy"),
+    ("LMT", "Lockheed Martin", "Industrials"),
+    ("RTX", "Raytheon Technologies", "Industrials"),
+    ("MA", "Mastercard", "Information Technology"),
+    ("AXP", "American Express", "Financials"),
+    ("BA", "Boeing", "Industrials"),
+    ("CAT", "Caterpillar", "Industrials"),
+    ("GE", "General Electric", "Industrials"),
+    ("IBM", "IBM", "Information Technology"),
+    ("INTC", "Intel", "Information Technology"),
+    ("AMD", "Advanced Micro Devices", "Information Technology"),
+    ("PYPL", "PayPal", "Information Technology"),
+    ("NFLX", "Netflix", "Communication Services"),
+    ("DIS", "Disney", "Communication Services"),
+    ("CRM", "Salesforce", "Information Technology"),
+    ("ADBE", "Adobe", "Information Technology"),
+    ("CSCO", "Cisco Systems", "Information Technology"),
+    ("ACN", "Accenture", "Information Technology"),
+    ("AVGO", "Broadcom", "Information Technology"),
+    ("QCOM", "Qualcomm", "Information Technology"),
+    ("TSM", "Taiwan Semiconductor", "Information Technology"),
+    ("ORCL", "Oracle", "Information Technology"),
+    ("SAP", "SAP SE", "Information Technology"),
+    ("NOW", "ServiceNow", "Information Technology"),
+)
+
+
+def _stock_dicts(rows: Tuple[Tuple[str, str, str], ...]) -> List[Dict]:
+    """Build the stock dicts the scanner passes around from universe rows."""
+    return [{"ticker": ticker, "name": name, "sector": sector} for ticker, name, sector in rows]
+
+
+# Per-process scoring state, set up once by _init_score_worker
+_worker = {}
+
+
+def _init_score_worker(use_real_data: bool, request_interval: float) -> None:
+    """Create the engine and data fetchers once per pool worker.
+
+    Args:
+        use_real_data: Create the price and fundamentals fetchers
+        request_interval: Minimum seconds between this worker's requests
+    """
+    _worker["engine"] = CompounderEngine()
+    _worker["request_interval"] = request_interval
+    _worker["last_request_time"] = 0.0
+
+    if use_real_data:
+        _worker["price_fetcher"] = YahooFinanceFetcher()
+        _worker["fundamentals_fetcher"] = LongTermFundamentalsFetcher()
+
+
+def _safe_get_attr(obj, attr, default):
+    """Safely get attribute from object, converting None to default."""
+    if obj is None:
+        return default
+    val = getattr(obj, attr, default)
+    return default if val is None else val
+
+
+def _real_inputs(ticker: str) -> Optional[Tuple[Dict, Dict]]:
+    """Fetch real fundamentals and price metrics (None if history is too short)."""
+    # Rate limiting - wait between requests
+    elapsed = time.time() - _worker["last_request_time"]
+    if elapsed < _worker["request_interval"]:
+        time.sleep(_worker["request_interval"] - elapsed)
+    _worker["last_request_time"] = time.time()
+
+    # Fetch real price data
+    logger.debug("  Fetching price data for %s...", ticker)
+    price_hist = _worker["price_fetcher"].fetch_price_history(ticker, period='5y')
+
+    if price_hist.empty or len(price_hist) < 200:
+        return None
+
+    # Use last 1 year for analysis
+    price_data_df = price_hist.tail(252) if len(price_hist) > 252 else price_hist
+    current_price = price_data_df['Close'].iloc[-1]
+
+    # Fetch real 5-year fundamentals
+    logger.debug("  Fetching fundamentals for %s...", ticker)
+    fundamentals_obj = _worker["fundamentals_fetcher"].fetch(ticker)
+
+    # Build fundamentals dict with numeric type conversion using LongTermFundamentals attributes
+    # Uses defaults when fundamentals unavailable (no FMP API key)
+    fundamentals = {
+        "revenue_cagr_3yr": float(_safe_get_attr(fundamentals_obj, 'revenue_cagr_3yr', 0.03)),
+        "revenue_cagr_5yr": float(_safe_get_attr(fundamentals_obj, 'revenue_cagr_5yr', 0.03)),
+        "eps_cagr_3yr": float(_safe_get_attr(fundamentals_obj, 'eps_cagr_3yr', 0.05)),
+        "roic": float(_safe_get_attr(fundamentals_obj, 'roic_3yr', 0.12)),
+        "wacc": float(_safe_get_attr(fundamentals_obj, 'wacc', 0.08)),
+        "roic_wacc_spread": float(_safe_get_attr(fundamentals_obj, 'roic_wacc_spread', 0.04)),
+        "fcf_margin": float(_safe_get_attr(fundamentals_obj, 'fcf_margin_3yr', 0.10)),
+        "debt_to_ebitda": float(_safe_get_attr(fundamentals_obj, 'debt_to_ebitda', 2.0)),
+        "interest_coverage": float(_safe_get_attr(fundamentals_obj, 'interest_coverage', 5.0)),
+        "rd_to_sales": 0.05,  # Not always available
+    }
+
+    # Calculate price data metrics
+    price_1yr = price_hist['Close'].iloc[-252] if len(price_hist) > 252 else price_hist['Close'].iloc[0]
+    price_3yr = price_hist['Close'].iloc[-756] if len(price_hist) > 756 else price_hist['Close'].iloc[0]
+    price_5yr = price_hist['Close'].iloc[0]
+
+    returns_1yr = (current_price - price_1yr) / price_1yr if price_1yr > 0 else 0.0
+    returns_3yr = ((current_price / price_3yr) ** (1/3) - 1) if price_3yr > 0 else 0.0
+    returns_5yr = ((current_price / price_5yr) ** (1/5) - 1) if price_5yr > 0 else 0.0
+
+    # 40-week MA (200 days) - with None handling
+    try:
+        ma_40w = float(price_hist['Close'].iloc[-200:].mean()) if len(price_hist) > 200 else float(price_hist['Close'].mean())
+    except (ValueError, TypeError):
+        ma_40w = current_price if current_price else 100.0
+
+    # MA slope - with None handling
+    try:
+        if len(price_hist) > 50:
+            slope_val = (price_hist['Close'].iloc[-1] - price_hist['Close'].iloc[-50]) / price_hist['Close'].iloc[-50]
+            ma_40w_slope = float(slope_val) if slope_val is not None else 0.0
+        else:
+            ma_40w_slope = 0.0
+    except (ValueError, TypeError, ZeroDivisionError):
+        ma_40w_slope = 0.0
+
+    # Months in uptrend - with None handling
+    try:
+        recent_hist = price_hist.iloc[-252:] if len(price_hist) > 252 else price_hist
+        uptrend_count = (recent_hist['Close'] > ma_40w).sum()
+        months_in_uptrend = int(uptrend_count // 20) if uptrend_count else 0
+    except (ValueError, TypeError):
+        months_in_uptrend = 0
+
+    # Calculate max drawdown (3-year window if available)
+    try:
+        recent_hist = price_hist.tail(756) if len(price_hist) > 756 else price_hist
+        running_max = recent_hist['Close'].cummax()
+        drawdown = (recent_hist['Close'] - running_max) / running_max
+        max_drawdown_3yr = float(drawdown.min())  # Most negative value
+    except (ValueError, TypeError):
+        max_drawdown_3yr = -0.30  # Conservative default
+
+    # Assume SPY max drawdown for reference
+    spy_max_drawdown_3yr = -0.15  # Historical average
+
+    # Ensure all values are numeric
+    price_data = {
+        "current_price": float(current_price),
+        "returns_1yr": float(returns_1yr),
+        "returns_3yr": float(returns_3yr),
+        "returns_5yr": float(returns_5yr),
+        "spy_returns_1yr": 0.10,
+        "spy_returns_3yr": 0.08,
+        "spy_returns_5yr": 0.10,
+        "max_drawdown_3yr": float(max_drawdown_3yr),
+        "spy_max_drawdown_3yr": float(spy_max_drawdown_3yr),
+        "price_40w_ma": float(ma_40w),
+        "ma_40w_slope": float(ma_40w_slope),
+        "months_in_uptrend": int(months_in_uptrend),
+    }
+
+    return fundamentals, price_data
+
+
+def _mock_input_columns(tickers: List[str]) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """Deterministic mock fundamentals and price metrics for many tickers at once.
+
+    Only the per-ticker hash seed is computed in Python; every field is one
+    NumPy expression over all tickers (column-wise).
+
+    Returns:
+        Tuple of (fundamentals, price_data) column dicts in ticker order
+    """
+    n = len(tickers)
+    # CRC32 is deterministic across runs (unlike salted hash()) and far cheaper than MD5
+    hash_vals = np.fromiter((zlib.crc32(t.encode()) for t in tickers), dtype=np.uint32, count=n)
+    base_seed = (hash_vals % 100) / 100.0
+    price_seed = ((hash_vals // 100) % 100) / 100.0
+
+    fundamentals_cols = {
+        "revenue_cagr_3yr": 0.05 + (base_seed * 0.20),      # 5-25%
+        "revenue_cagr_5yr": 0.04 + (base_seed * 0.18),      # 4-22%
+        "eps_cagr_3yr": 0.06 + (base_seed * 0.25),          # 6-31%
+        "roic": 0.08 + (base_seed * 0.35),                  # 8-43%
+        "wacc": 0.06 + (base_seed * 0.08),                  # 6-14%
+        "fcf_margin": 0.05 + (base_seed * 0.30),            # 5-35%
+        "debt_to_ebitda": 3.0 - (base_seed * 2.5),          # 0.5-3.0x
+        "interest_coverage": 3.0 + (base_seed * 12),        # 3-15x
+        "rd_to_sales": 0.02 + (base_seed * 0.15),           # 2-17%
+    }
+
+    price_cols = {
+        "current_price": np.full(n, 150),
+        "returns_1yr": -0.10 + (price_seed * 0.50),         # -10% to +40%
+        "returns_3yr": 0.02 + (price_seed * 0.30),          # 2% to 32%
+        "returns_5yr": 0.03 + (price_seed * 0.35),          # 3% to 38%
+        "spy_returns_1yr": np.full(n, 0.10),
+        "spy_returns_3yr": np.full(n, 0.08),
+        "spy_returns_5yr": np.full(n, 0.10),
+        "price_40w_ma": 145 + (price_seed * 30),            # 145-175
+        "ma_40w_slope": -0.05 + (price_seed * 0.15),        # -5% to +10%
+        "months_in_uptrend": (6 + (price_seed * 30)).astype(np.int64),  # 6-36 months
+    }
+
+    return fundamentals_cols, price_cols
+
+
+def _column_rows(cols: Dict[str, np.ndarray]) -> List[Dict]:
+    """Split a dict of equal-length columns into per-row dicts of Python scalars."""
+    keys = list(cols)
+    return [dict(zip(keys, values)) for values in zip(*(col.tolist() for col in cols.values()))]
+
+
+def _score_one(task: Tuple[Dict, Optional[str]]) -> Tuple[str, Optional[Dict], Optional[str], Optional[str]]:
+    """Fetch real data for one stock and score it (runs in a pool worker).
+
+    Scoring is skipped when the fetched inputs match the digest stored for
+    the ticker by a previous run; the parent then reuses its cached score.
+
+    Args:
+        task: Tuple of (stock dict from the universe, cached input digest or None)
+
+    Returns:
+        Tuple of (ticker, score data or None, error type name or None, input
+        digest or None). Score data None with a digest means a cache hit.
+    """
+    stock, cached_digest = task
+    ticker = stock["ticker"]
+    try:
+        inputs = _real_inputs(ticker)
+        if inputs is None:
+            return ticker, None, None, None
+        fundamentals, price_data = inputs
+
+        digest = input_digest((stock, inputs))
+        if digest == cached_digest:
+            return ticker, None, None, digest
+
+        # Score the stock
+        score = _worker["engine"].score_stock(ticker, fundamentals, price_data)
+        if not score:
+            return ticker, None, None, None
+
+        return ticker, {
+            "ticker": ticker,
+            "name": stock["name"],
+            "sector": stock["sector"],
+            "score": score.total_score,
+            "regime": score.regime.name if hasattr(score.regime, 'name') else str(score.regime),
+            "fundamental_score": score.fundamental_score,
+            "rs_persistence_score": score.rs_persistence_score,
+            "trend_durability_score": score.trend_durability_score,
+            "moat_bonus": score.moat_bonus,
+        }, None, digest
+
+    except Exception as e:
+        logger.debug("  ⚠ Failed to score %s: %s: %s", ticker, type(e).__name__, e)
+        return ticker, None, type(e).__name__, None
+
+
+def _select_top(scored: Dict[str, Dict], top_n: int) -> List[Tuple[str, Dict]]:
+    """Highest-scoring (ticker, data) pairs, best first.
+
+    Same result as sorted(scored.items(), key=score, reverse=True)[:top_n]:
+    argpartition finds the cut-off score in O(N), and only the entries at or
+    above it are sorted (stably, so ties keep universe order).
+    """
+    items = list(scored.items())
+    scores = np.fromiter((data["score"] for _, data in items), dtype=np.float64, count=len(items))
+
+    if top_n <= 0:
+        return []
+    if top_n < len(items):
+        cutoff = scores[np.argpartition(scores, -top_n)[-top_n]]
+        candidates = np.flatnonzero(scores >= cutoff)
+    else:
+        candidates = np.arange(len(items))
+
+    order = candidates[np.argsort(-scores[candidates], kind="stable")][:top_n]
+    return [items[i] for i in order]
+
 
 class QuarterlyCompounderScan:
     """Orchestrates quarterly compounder identification."""
@@ -46,45 +417,86 @@ class QuarterlyCompounderScan:
         """
         self.test_mode = test_mode
         self.limit = limit or (10 if test_mode else 500)
+        # Set by get_stock_universe: True only for the standard real-data
+        # universe, the one run allowed to prune the stock score cache
+        self.full_universe = False
+        self._explicit_limit = limit is not None
+
+        # Components are created on first use (see the properties below), so
+        # partial runs and tests only pay for what they touch
+        self.use_real_data = REAL_DATA_AVAILABLE
+        if not REAL_DATA_AVAILABLE:
+            logger.warning(f"⚠ Real data fetchers unavailable ({REAL_DATA_IMPORT_ERROR}) - using mock data")
+
+        logger.info("✓ Scanner initialized")
+
+    @cached_property
+    def compounder_engine(self) -> CompounderEngine:
+        """Stock scoring engine."""
+        return CompounderEngine()
+
+    @cached_property
+    def regime_classifier(self) -> RegimeClassifier:
+        """Long-cycle regime classifier."""
+        return RegimeClassifier()
+
+    @cached_property
+    def etf_universe(self) -> ETFUniverse:
+        """Thematic ETF universe (loads the themes config)."""
+        return ETFUniverse()
+
+    @cached_property
+    def etf_engine(self) -> ETFEngine:
+        """ETF scoring engine."""
+        return ETFEngine(universe=self.etf_universe)
+
+    @cached_property
+    def portfolio_constructor(self) -> PortfolioConstructor:
+        """Portfolio construction with concentration rules."""
+        return PortfolioConstructor()
+
+    @cached_property
+    def report_generator(self) -> ReportGenerator:
+        """Quarterly report writer."""
+        return ReportGenerator()
+
+    @cached_property
+    def universe_fetcher(self) -> Optional["USStockUniverseFetcher"]:
+        """Stock universe fetcher, or None without real data fetchers."""
+        return USStockUniverseFetcher() if REAL_DATA_AVAILABLE else None
+
+    @cached_property
+    def price_fetcher(self) -> Optional["YahooFinanceFetcher"]:
+        """Price history fetcher, or None without real data fetchers."""
+        return YahooFinanceFetcher() if REAL_DATA_AVAILABLE else None
+
+    @cached_property
+    def fundamentals_fetcher(self) -> Optional["LongTermFundamentalsFetcher"]:
+        """Long-term fundamentals fetcher, or None without real data fetchers."""
+        return LongTermFundamentalsFetcher() if REAL_DATA_AVAILABLE else None
+
+    # The score entries themselves are built in this module, so it is part
+    # of both cache fingerprints
+
+    @cached_property
+    def stock_score_cache(self) -> TickerScoreCache:
+        """Disk memo of stock scores, one entry per ticker.
+
+        Mock-data runs get their own file so they never evict real scores.
+        """
+        filename = "stock_scores.pkl" if self.use_real_data else "stock_scores_mock.pkl"
+        return TickerScoreCache(
+            SCORE_CACHE_DIR / filename,
+            source_fingerprint(compounder_engine_module, metrics_module, sys.modules[__name__]),
+        )
 
-        # Import components
-        try:
-            from src.long_term.compounder_engine import CompounderEngine
-            from src.long_term.regime_classifier import RegimeClassifier
-            from src.long_term.etf_engine import ETFEngine
-            from src.long_term.etf_universe import ETFUniverse
-            from src.long_term.portfolio_constructor import PortfolioConstructor
-            from src.long_term.report_generator import ReportGenerator
-
-            self.compounder_engine = CompounderEngine()
-            self.regime_classifier = RegimeClassifier()
-            self.etf_universe = ETFUniverse()
-
-            # Try to import real data fetchers, use fallback if unavailable
-            try:
-                from src.data.universe_fetcher import USStockUniverseFetcher
-                from src.data.fetcher import YahooFinanceFetcher
-                from src.long_term.data_fetcher import LongTermFundamentalsFetcher
-                self.universe_fetcher = USStockUniverseFetcher()
-                self.price_fetcher = YahooFinanceFetcher()
-                self.fundamentals_fetcher = LongTermFundamentalsFetcher()
-                self.use_real_data = True
-            except (ImportError, ModuleNotFoundError) as e:
-                logger.warning(f"⚠ Real data fetchers unavailable ({e}) - using mock data")
-                self.universe_fetcher = None
-                self.price_fetcher = None
-                self.fundamentals_fetcher = None
-                self.use_real_data = False
-
-            self.etf_engine = ETFEngine(universe=self.etf_universe)
-            self.portfolio_constructor = PortfolioConstructor()
-            self.report_generator = ReportGenerator()
-
-            logger.info("✓ All components initialized")
-
-        except ImportError as e:
-            logger.error(f"✗ Failed to import components: {e}")
-            raise
+    @cached_property
+    def etf_score_cache(self) -> ScoreCache:
+        """Disk memo of ETF scores."""
+        return ScoreCache(
+            SCORE_CACHE_DIR / "etf_scores.pkl",
+            source_fingerprint(etf_engine_module, metrics_module, sys.modules[__name__]),
+        )
 
     def get_stock_universe(self) -> List[Dict]:
         """
@@ -100,18 +512,7 @@ class QuarterlyCompounderScan:
 
         if self.test_mode:
             # Use test stocks
-            stocks = [
-                {"ticker": "AAPL", "name": "Apple", "sector": "Technology"},
-                {"ticker": "MSFT", "name": "Microsoft", "sector": "Technology"},
-                {"ticker": "NVDA", "name": "NVIDIA", "sector": "Technology"},
-                {"ticker": "GOOGL", "name": "Alphabet", "sector": "Technology"},
-                {"ticker": "META", "name": "Meta", "sector": "Technology"},
-                {"ticker": "JPM", "name": "JPMorgan", "sector": "Financials"},
-                {"ticker": "UNH", "name": "United Health", "sector": "Healthcare"},
-                {"ticker": "JNJ", "name": "Johnson & Johnson", "sector": "Healthcare"},
-                {"ticker": "PG", "name": "Procter & Gamble", "sector": "Consumer"},
-                {"ticker": "WMT", "name": "Walmart", "sector": "Consumer"},
-            ]
+            stocks = _stock_dicts(_TEST_UNIVERSE)
             logger.info(f"✓ Test mode: Using {len(stocks)} test stocks")
         else:
             # Fetch real stock universe from data sources if available
@@ -121,17 +522,18 @@ class QuarterlyCompounderScan:
                     tickers = self.universe_fetcher.fetch_universe()
                     if not tickers:
                         logger.warning("Could not fetch universe, using fallback list")
-                        stocks = self._get_fallback_stock_universe()[:self.limit]
+                        stocks = self._get_fallback_stock_universe(self.limit)
                     else:
                         # Convert tickers to stock dicts (limit to configured amount)
                         stocks = [{"ticker": t, "name": t, "sector": "Unknown"} for t in tickers[:self.limit]]
+                        self.full_universe = not self._explicit_limit
                         logger.info(f"✓ Fetched {len(stocks)} stocks from universe")
                 except Exception as e:
                     logger.warning(f"Error fetching universe: {e}, using fallback")
-                    stocks = self._get_fallback_stock_universe()[:self.limit]
+                    stocks = self._get_fallback_stock_universe(self.limit)
             else:
                 logger.info("⚠ Real data fetcher unavailable, using fallback stock list")
-                stocks = self._get_fallback_stock_universe()[:self.limit]
+                stocks = self._get_fallback_stock_universe(self.limit)
 
         return stocks
 
@@ -141,50 +543,9 @@ class QuarterlyCompounderScan:
         # Fallback to hardcoded list (in production would fetch from FMP/Yahoo)
         return self._get_fallback_stock_universe()
 
-    def _get_fallback_stock_universe(self) -> List[Dict]:
-        """Fallback hardcoded stock list (top 50 by market cap)."""
-        return [
-            {"ticker": "AAPL", "name": "Apple", "sector": "Information Technology"},
-            {"ticker": "MSFT", "name": "Microsoft", "sector": "Information Technology"},
-            {"ticker": "NVDA", "name": "NVIDIA", "sector": "Information Technology"},
-            {"ticker": "GOOGL", "name": "Alphabet", "sector": "Information Technology"},
-            {"ticker": "GOOG", "name": "Alphabet", "sector": "Information Technology"},
-            {"ticker": "META", "name": "Meta", "sector": "Information Technology"},
-            {"ticker": "AMZN", "name": "Amazon", "sector": "Consumer Discretionary"},
-            {"ticker": "TSLA", "name": "Tesla", "sector": "Consumer Discretionary"},
-            {"ticker": "BRK.B", "name": "Berkshire Hathaway", "sector": "Financials"},
-            {"ticker": "JPM", "name": "JPMorgan Chase", "sector": "Financials"},
-            {"ticker": "V", "name": "Visa", "sector": "Information Technology"},
-            {"ticker": "WMT", "name": "Walmart", "sector": "Consumer Staples"},
-            {"ticker": "PG", "name": "Procter & Gamble", "sector": "Consumer Staples"},
-            {"ticker": "JNJ", "name": "Johnson & Johnson", "sector": "Healthcare"},
-            {"ticker": "UNH", "name": "UnitedHealth Group", "sector": "Healthcare"},
-            {"ticker": "XOM", "name": "ExxonMobil", "sector": "Energy"},
-            {"ticker": "CVX", "name": "Chevron", "sector": "Energy"},
-            {"ticker": "LMT", "name": "Lockheed Martin", "sector": "Industrials"},
-            {"ticker": "RTX", "name": "Raytheon Technologies", "sector": "Industrials"},
-            {"ticker": "MA", "name": "Mastercard", "sector": "Information Technology"},
-            {"ticker": "AXP", "name": "American Express", "sector": "Financials"},
-            {"ticker": "BA", "name": "Boeing", "sector": "Industrials"},
-            {"ticker": "CAT", "name": "Caterpillar", "sector": "Industrials"},
-            {"ticker": "GE", "name": "General Electric", "sector": "Industrials"},
-            {"ticker": "IBM", "name": "IBM", "sector": "Information Technology"},
-            {"ticker": "INTC", "name": "Intel", "sector": "Information Technology"},
-            {"ticker": "AMD", "name": "Advanced Micro Devices", "sector": "Information Technology"},
-            {"ticker": "PYPL", "name": "PayPal", "sector": "Information Technology"},
-            {"ticker": "NFLX", "name": "Netflix", "sector": "Communication Services"},
-            {"ticker": "DIS", "name": "Disney", "sector": "Communication Services"},
-            {"ticker": "CRM", "name": "Salesforce", "sector": "Information Technology"},
-            {"ticker": "ADBE", "name": "Adobe", "sector": "Information Technology"},
-            {"ticker": "CSCO", "name": "Cisco Systems", "sector": "Information Technology"},
-            {"ticker": "ACN", "name": "Accenture", "sector": "Information Technology"},
-            {"ticker": "AVGO", "name": "Broadcom", "sector": "Information Technology"},
-            {"ticker": "QCOM", "name": "Qualcomm", "sector": "Information Technology"},
-            {"ticker": "TSM", "name": "Taiwan Semiconductor", "sector": "Information Technology"},
-            {"ticker": "ORCL", "name": "Oracle", "sector": "Information Technology"},
-            {"ticker": "SAP", "name": "SAP SE", "sector": "Information Technology"},
-            {"ticker": "NOW", "name": "ServiceNow", "sector": "Information Technology"},
-        ]
+    def _get_fallback_stock_universe(self, limit: Optional[int] = None) -> List[Dict]:
+        """Fallback hardcoded stock list (top 50 by market cap), optionally limited."""
+        return _stock_dicts(_DEFAULT_UNIVERSE[:limit])
 
     def _fetch_price_data(self, ticker: str) -> Dict:
         """Fetch price data from yfinance, with fallbacks."""
@@ -221,7 +582,7 @@ class QuarterlyCompounderScan:
                 months_in_uptrend = 0
 
         except Exception as e:
-            logger.debug(f"  ⚠ Could not fetch price data for {ticker}: {e}")
+            logger.debug("  ⚠ Could not fetch price data for %s: %s", ticker, e)
             current_price = 100
             returns_1yr = 0.0
             returns_3yr = 0.0
@@ -267,180 +628,108 @@ class QuarterlyCompounderScan:
         scored_stocks = {}
         failed_scores = 0
         error_reasons = {}  # Track failure reasons
-        last_request_time = 0.0
-
-        for i, stock in enumerate(stocks, 1):
-            ticker = stock["ticker"]
-            try:
-                if self.use_real_data:
-                    # Rate limiting - wait 0.5s between requests
-                    elapsed = time.time() - last_request_time
-                    if elapsed < 0.5:
-                        time.sleep(0.5 - elapsed)
-                    last_request_time = time.time()
-                    # Fetch real price data
-                    logger.debug(f"  Fetching price data for {ticker}...")
-                    price_hist = self.price_fetcher.fetch_price_history(ticker, period='5y')
-
-                    if price_hist.empty or len(price_hist) < 200:
-                        failed_scores += 1
-                        continue
+        results = {}
 
-                    # Use last 1 year for analysis
-                    price_data_df = price_hist.tail(252) if len(price_hist) > 252 else price_hist
-                    current_price = price_data_df['Close'].iloc[-1]
-
-                    # Fetch real 5-year fundamentals
-                    logger.debug(f"  Fetching fundamentals for {ticker}...")
-                    fundamentals_obj = self.fundamentals_fetcher.fetch(ticker)
-
-                    # Extract what we need for compounder scoring (with safe None handling)
-                    def safe_get_attr(obj, attr, default):
-                        """Safely get attribute from object, converting None to default."""
-                        if obj is None:
-                            return default
-                        val = getattr(obj, attr, default)
-                        return default if val is None else val
-
-                    # Build fundamentals dict with numeric type conversion using LongTermFundamentals attributes
-                    # Uses defaults when fundamentals unavailable (no FMP API key)
-                    fundamentals = {
-                        "revenue_cagr_3yr": float(safe_get_attr(fundamentals_obj, 'revenue_cagr_3yr', 0.03)),
-                        "revenue_cagr_5yr": float(safe_get_attr(fundamentals_obj, 'revenue_cagr_5yr', 0.03)),
-                        "eps_cagr_3yr": float(safe_get_attr(fundamentals_obj, 'eps_cagr_3yr', 0.05)),
-                        "roic": float(safe_get_attr(fundamentals_obj, 'roic_3yr', 0.12)),
-                        "wacc": float(safe_get_attr(fundamentals_obj, 'wacc', 0.08)),
-                        "roic_wacc_spread": float(safe_get_attr(fundamentals_obj, 'roic_wacc_spread', 0.04)),
-                        "fcf_margin": float(safe_get_attr(fundamentals_obj, 'fcf_margin_3yr', 0.10)),
-                        "debt_to_ebitda": float(safe_get_attr(fundamentals_obj, 'debt_to_ebitda', 2.0)),
-                        "interest_coverage": float(safe_get_attr(fundamentals_obj, 'interest_coverage', 5.0)),
-                        "rd_to_sales": 0.05,  # Not always available
-                    }
-
-                    # Calculate price data metrics
-                    price_1yr = price_hist['Close'].iloc[-252] if len(price_hist) > 252 else price_hist['Close'].iloc[0]
-                    price_3yr = price_hist['Close'].iloc[-756] if len(price_hist) > 756 else price_hist['Close'].iloc[0]
-                    price_5yr = price_hist['Close'].iloc[0]
-
-                    returns_1yr = (current_price - price_1yr) / price_1yr if price_1yr > 0 else 0.0
-                    returns_3yr = ((current_price / price_3yr) ** (1/3) - 1) if price_3yr > 0 else 0.0
-                    returns_5yr = ((current_price / price_5yr) ** (1/5) - 1) if price_5yr > 0 else 0.0
-
-                    # 40-week MA (200 days) - with None handling
-                    try:
-                        ma_40w = float(price_hist['Close'].iloc[-200:].mean()) if len(price_hist) > 200 else float(price_hist['Close'].mean())
-                    except (ValueError, TypeError):
-                        ma_40w = current_price if current_price else 100.0
-
-                    # MA slope - with None handling
-                    try:
-                        if len(price_hist) > 50:
-                            slope_val = (price_hist['Close'].iloc[-1] - price_hist['Close'].iloc[-50]) / price_hist['Close'].iloc[-50]
-                            ma_40w_slope = float(slope_val) if slope_val is not None else 0.0
+        if self.use_real_data:
+            # Workers fetch and score tickers independently; each worker's delay
+            # is scaled by the pool size so the combined rate stays at one
+            # request per REQUEST_INTERVAL. Inputs are only known after the
+            # fetch, so each task carries the ticker's stored input digest and
+            # only stocks whose fundamentals/prices changed are re-scored.
+            n_stocks = len(stocks)
+            n_workers = max(1, min(mp.cpu_count(), n_stocks))
+            chunksize = max(1, n_stocks // (4 * n_workers))
+            tasks = [(stock, self.stock_score_cache.digest(stock["ticker"])) for stock in stocks]
+            with mp.Pool(
+                n_workers,
+                initializer=_init_score_worker,
+                initargs=(self.use_real_data, REQUEST_INTERVAL * n_workers),
+            ) as pool:
+                for i, (ticker, result, error_type, digest) in enumerate(
+                    pool.imap_unordered(_score_one, tasks, chunksize=chunksize), 1
+                ):
+                    if digest is not None:
+                        if result is None:
+                            result = self.stock_score_cache.lookup(ticker, digest)
                         else:
-                            ma_40w_slope = 0.0
-                    except (ValueError, TypeError, ZeroDivisionError):
-                        ma_40w_slope = 0.0
-
-                    # Months in uptrend - with None handling
-                    try:
-                        recent_hist = price_hist.iloc[-252:] if len(price_hist) > 252 else price_hist
-                        uptrend_count = (recent_hist['Close'] > ma_40w).sum()
-                        months_in_uptrend = int(uptrend_count // 20) if uptrend_count else 0
-                    except (ValueError, TypeError):
-                        months_in_uptrend = 0
-
-                    # Calculate max drawdown (3-year window if available)
-                    try:
-                        recent_hist = price_hist.tail(756) if len(price_hist) > 756 else price_hist
-                        running_max = recent_hist['Close'].cummax()
-                        drawdown = (recent_hist['Close'] - running_max) / running_max
-                        max_drawdown_3yr = float(drawdown.min())  # Most negative value
-                    except (ValueError, TypeError):
-                        max_drawdown_3yr = -0.30  # Conservative default
-
-                    # Assume SPY max drawdown for reference
-                    spy_max_drawdown_3yr = -0.15  # Historical average
-
-                    # Ensure all values are numeric
-                    price_data = {
-                        "current_price": float(current_price),
-                        "returns_1yr": float(returns_1yr),
-                        "returns_3yr": float(returns_3yr),
-                        "returns_5yr": float(returns_5yr),
-                        "spy_returns_1yr": 0.10,
-                        "spy_returns_3yr": 0.08,
-                        "spy_returns_5yr": 0.10,
-                        "max_drawdown_3yr": float(max_drawdown_3yr),
-                        "spy_max_drawdown_3yr": float(spy_max_drawdown_3yr),
-                        "price_40w_ma": float(ma_40w),
-                        "ma_40w_slope": float(ma_40w_slope),
-                        "months_in_uptrend": int(months_in_uptrend),
-                    }
+                            self.stock_score_cache.store(ticker, digest, result)
+                    results[ticker] = result
+                    if result is None:
+                        failed_scores += 1
+                        if error_type:
+                            error_reasons[error_type] = error_reasons.get(error_type, 0) + 1
+
+                    # Progress every 64 stocks at INFO, every 16 at DEBUG
+                    if not (i & 15):
+                        logger.log(
+                            logging.DEBUG if i & 63 else logging.INFO,
+                            "  Progress: %d/%d stocks processed (%d scored)",
+                            i, n_stocks, i - failed_scores,
+                        )
+        else:
+            # Mock inputs are known up front: look them up in the score cache,
+            # then score every miss in one vectorized engine call
+            fundamentals_cols, price_cols = _mock_input_columns([stock["ticker"] for stock in stocks])
+            misses = []
+            digests = []
+            for i, inputs in enumerate(zip(_column_rows(fundamentals_cols), _column_rows(price_cols))):
+                digest = input_digest((stocks[i], inputs))
+                cached = self.stock_score_cache.lookup(stocks[i]["ticker"], digest)
+                if cached is None:
+                    misses.append(i)
+                    digests.append(digest)
                 else:
-                    # Use mock data (hash-based variation per stock)
-                    import hashlib
-                    hash_val = int(hashlib.md5(ticker.encode()).hexdigest(), 16)
-                    base_seed = (hash_val % 100) / 100.0
-
-                    fundamentals = {
-                        "revenue_cagr_3yr": 0.05 + (base_seed * 0.20),      # 5-25%
-                        "revenue_cagr_5yr": 0.04 + (base_seed * 0.18),      # 4-22%
-                        "eps_cagr_3yr": 0.06 + (base_seed * 0.25),          # 6-31%
-                        "roic": 0.08 + (base_seed * 0.35),                  # 8-43%
-                        "wacc": 0.06 + (base_seed * 0.08),                  # 6-14%
-                        "fcf_margin": 0.05 + (base_seed * 0.30),            # 5-35%
-                        "debt_to_ebitda": 3.0 - (base_seed * 2.5),          # 0.5-3.0x
-                        "interest_coverage": 3.0 + (base_seed * 12),        # 3-15x
-                        "rd_to_sales": 0.02 + (base_seed * 0.15),           # 2-17%
-                    }
-
-                    price_seed = ((hash_val // 100) % 100) / 100.0
-                    price_data = {
-                        "current_price": 150,
-                        "returns_1yr": -0.10 + (price_seed * 0.50),         # -10% to +40%
-                        "returns_3yr": 0.02 + (price_seed * 0.30),          # 2% to 32%
-                        "returns_5yr": 0.03 + (price_seed * 0.35),          # 3% to 38%
-                        "spy_returns_1yr": 0.10,
-                        "spy_returns_3yr": 0.08,
-                        "spy_returns_5yr": 0.10,
-                        "price_40w_ma": 145 + (price_seed * 30),            # 145-175
-                        "ma_40w_slope": -0.05 + (price_seed * 0.15),        # -5% to +10%
-                        "months_in_uptrend": int(6 + (price_seed * 30)),    # 6-36 months
-                    }
+                    results[stocks[i]["ticker"]] = cached
 
-                # Score the stock
-                score = self.compounder_engine.score_stock(ticker, fundamentals, price_data)
+            if results:
+                logger.info(f"  Reusing {len(results)} cached scores")
 
-                if score:
-                    scored_stocks[ticker] = {
+            if misses:
+                batch = self.compounder_engine.score_stocks_batch(
+                    {k: v[misses] for k, v in fundamentals_cols.items()},
+                    {k: v[misses] for k, v in price_cols.items()},
+                )
+                columns = {k: v.tolist() for k, v in batch.items()}
+                for j, (i, digest) in enumerate(zip(misses, digests)):
+                    stock = stocks[i]
+                    if not columns["valid"][j]:
+                        results[stock["ticker"]] = None
+                        failed_scores += 1
+                        continue
+                    result = {
+                        "ticker": stock["ticker"],
                         "name": stock["name"],
                         "sector": stock["sector"],
-                        "score": score.total_score,
-                        "regime": score.regime.name if hasattr(score.regime, 'name') else str(score.regime),
-                        "fundamental_score": score.fundamental_score,
-                        "rs_persistence_score": score.rs_persistence_score,
-                        "trend_durability_score": score.trend_durability_score,
-                        "moat_bonus": score.moat_bonus,
+                        "score": columns["total_score"][j],
+                        "regime": columns["regime"][j],
+                        "fundamental_score": columns["fundamental_score"][j],
+                        "rs_persistence_score": columns["rs_persistence_score"][j],
+                        "trend_durability_score": columns["trend_durability_score"][j],
+                        "moat_bonus": columns["moat_bonus"][j],
                     }
-                else:
-                    failed_scores += 1
-
-                if i % 50 == 0:
-                    logger.info(f"  Progress: {i}/{len(stocks)} stocks processed ({len(scored_stocks)} scored)")
-
-            except Exception as e:
-                error_msg = str(e)
-                error_type = type(e).__name__
-                logger.debug(f"  ⚠ Failed to score {ticker}: {error_type}: {error_msg}")
-                error_reasons[error_type] = error_reasons.get(error_type, 0) + 1
-                failed_scores += 1
-
-        logger.info(f"✓ Scored {len(scored_stocks)} stocks ({failed_scores} failed)")
+                    results[stock["ticker"]] = result
+                    self.stock_score_cache.store(stock["ticker"], digest, result)
+
+        # Keep universe order so equal scores rank the same way on every run
+        for stock in stocks:
+            if results.get(stock["ticker"]):
+                scored_stocks[stock["ticker"]] = results[stock["ticker"]]
+
+        # One entry per ticker; tickers that left the universe are dropped,
+        # but only after a full real-data run (test mode, --limit and the
+        # fallback list score a subset and must not evict everyone else)
+        if self.use_real_data and self.full_universe:
+            self.stock_score_cache.prune(stock["ticker"] for stock in stocks)
+        self.stock_score_cache.save()
+
+        logger.info(
+            f"✓ Scored {len(scored_stocks)} stocks ({failed_scores} failed, "
+            f"{self.stock_score_cache.hits} from cache)"
+        )
         if error_reasons:
             logger.info("Failure breakdown:")
             for error_type, count in sorted(error_reasons.items(), key=lambda x: -x[1]):
-                logger.info(f"  {error_type}: {count}")
+                logger.info("  %s: %d", error_type, count)
 
         return scored_stocks
 
@@ -460,11 +749,7 @@ class QuarterlyCompounderScan:
         logger.info(f"STEP 3: SELECT TOP {top_n} STOCKS")
         logger.info("=" * 80)
 
-        sorted_stocks = sorted(
-            scored_stocks.items(),
-            key=lambda x: x[1]["score"],
-            reverse=True,
-        )[:top_n]
+        sorted_stocks = _select_top(scored_stocks, top_n)
 
         top_stocks = {ticker: data for ticker, data in sorted_stocks}
 
@@ -472,8 +757,8 @@ class QuarterlyCompounderScan:
         logger.info("")
         for rank, (ticker, data) in enumerate(sorted_stocks[:10], 1):
             logger.info(
-                f"  {rank:2}. {ticker:6} {data['name']:30} Score: {data['score']:6.1f} "
-                f"({data['regime']})"
+                "  %2d. %-6s %-30s Score: %6.1f (%s)",
+                rank, ticker, data['name'], data['score'], data['regime'],
             )
 
         return top_stocks
@@ -490,45 +775,86 @@ class QuarterlyCompounderScan:
         logger.info("STEP 4: SCORE ETFs")
         logger.info("=" * 80)
 
-        # Get ETFs by theme
-        scored_etfs = {}
+        # Create the shared components before the threads start, so they are
+        # not built once per thread on first access
+        etf_score_cache = self.etf_score_cache
+        _ = self.etf_engine
 
-        for theme in ["ai_cloud", "defense", "energy_transition", "healthcare_innovation", "cybersecurity"]:
-            try:
-                etfs = self.etf_universe.get_etfs_by_theme(theme, filtered=True)
-
-                for etf in etfs:
-                    # Mock price data - varied per ETF based on ticker hash
-                    import hashlib
-                    hash_val = int(hashlib.md5(etf.ticker.encode()).hexdigest(), 16)
-                    price_seed = (hash_val % 100) / 100.0
-
-                    price_data = {
-                        "return_1yr": 0.05 + (price_seed * 0.35),      # 5% to 40%
-                        "return_3yr": 0.02 + (price_seed * 0.26),      # 2% to 28%
-                        "return_5yr": 0.01 + (price_seed * 0.25),      # 1% to 26%
-                        "spy_return_1yr": 0.10,
-                        "spy_return_3yr": 0.08,
-                        "spy_return_5yr": 0.10,
-                    }
+        # Themes are independent, so fetch and score them concurrently; map()
+        # keeps theme order so the merged dict is the same on every run
+        with ThreadPoolExecutor(max_workers=len(ETF_THEMES)) as executor:
+            results = list(executor.map(self._score_one_theme, ETF_THEMES))
+        scored_etfs = {ticker: data for result in results for ticker, data in result.items()}
+
+        etf_score_cache.save()
+        logger.info(f"✓ Scored {len(scored_etfs)} ETFs ({etf_score_cache.hits} from cache)")
+
+        return scored_etfs
+
+    def _score_one_theme(self, theme: str) -> Dict[str, Dict]:
+        """
+        Fetch and score the ETFs of one theme (runs in a thread).
+
+        Args:
+            theme: Theme ID
+
+        Returns:
+            Dict mapping ETF ticker to score data
+        """
+        scored_etfs = {}
+        try:
+            etfs = self.etf_universe.get_etfs_by_theme_df(theme, filtered=True)
+            tailwind = self.etf_universe.get_tailwind_score(theme)
 
-                    score = self.etf_engine.score_etf(etf.__dict__, price_data)
+            # Mock price data - varied per ETF based on ticker hash
+            hash_vals = np.fromiter(
+                (zlib.crc32(t.encode()) for t in etfs["ticker"]), dtype=np.uint32, count=len(etfs)
+            )
+            price_seed = (hash_vals % 100) / 100.0
+            price_cols = {
+                "return_1yr": 0.05 + (price_seed * 0.35),      # 5% to 40%
+                "return_3yr": 0.02 + (price_seed * 0.26),      # 2% to 28%
+                "return_5yr": 0.01 + (price_seed * 0.25),      # 1% to 26%
+                "spy_return_1yr": np.full(len(etfs), 0.10),
+                "spy_return_3yr": np.full(len(etfs), 0.08),
+                "spy_return_5yr": np.full(len(etfs), 0.10),
+            }
 
-                    if score:
-                        scored_etfs[etf.ticker] = {
-                            "name": etf.name,
-                            "theme": theme,
-                            "score": score.total_score,
-                            "theme_purity_score": score.theme_purity_score,
-                            "rs_persistence_score": score.rs_persistence_score,
-                            "efficiency_score": score.efficiency_score,
-                            "tailwind_score": score.tailwind_score,
-                        }
+            # Tailwind comes from the themes config, so it is part of the key
+            metadata_rows = etfs.astype(object).where(etfs.notna(), None).to_dict("records")
+            misses = []
+            cache_keys = []
+            for i, key_parts in enumerate(zip(metadata_rows, _column_rows(price_cols))):
+                key = freeze((*key_parts, tailwind))
+                cached = self.etf_score_cache.get(key)
+                if cached is None:
+                    misses.append(i)
+                    cache_keys.append(key)
+                else:
+                    scored_etfs[metadata_rows[i]["ticker"]] = cached
 
-            except Exception as e:
-                logger.warning(f"  ⚠ Failed to score {theme} ETFs: {e}")
+            if misses:
+                batch = self.etf_engine.score_etfs_batch(
+                    etfs.iloc[misses], {k: v[misses] for k, v in price_cols.items()}
+                )
+                names = etfs["name"].iloc[misses].tolist()
+                for ticker, name, key, row in zip(
+                    batch.index, names, cache_keys, batch.itertuples(index=False)
+                ):
+                    scored_etfs[ticker] = {
+                        "ticker": ticker,
+                        "name": name,
+                        "theme": theme,
+                        "score": row.total_score,
+                        "theme_purity_score": row.theme_purity_score,
+                        "rs_persistence_score": row.rs_persistence_score,
+                        "efficiency_score": row.efficiency_score,
+                        "tailwind_score": row.tailwind_score,
+                    }
+                    self.etf_score_cache.put(key, scored_etfs[ticker])
 
-        logger.info(f"✓ Scored {len(scored_etfs)} ETFs")
+        except Exception as e:
+            logger.warning("  ⚠ Failed to score %s ETFs: %s", theme, e)
 
         return scored_etfs
 
@@ -548,11 +874,7 @@ class QuarterlyCompounderScan:
         logger.info(f"STEP 5: SELECT TOP {top_n} ETFs")
         logger.info("=" * 80)
 
-        sorted_etfs = sorted(
-            scored_etfs.items(),
-            key=lambda x: x[1]["score"],
-            reverse=True,
-        )[:top_n]
+        sorted_etfs = _select_top(scored_etfs, top_n)
 
         top_etfs = {ticker: data for ticker, data in sorted_etfs}
 
@@ -560,7 +882,8 @@ class QuarterlyCompounderScan:
         logger.info("")
         for rank, (ticker, data) in enumerate(sorted_etfs, 1):
             logger.info(
-                f"  {rank:2}. {ticker:6} {data['name']:30} Score: {data['score']:6.1f}"
+                "  %2d. %-6s %-30s Score: %6.1f",
+                rank, ticker, data['name'], data['score'],
             )
 
         return top_etfs
@@ -583,33 +906,18 @@ class QuarterlyCompounderScan:
         logger.info("STEP 6: BUILD PORTFOLIO")
         logger.info("=" * 80)
 
-        # Create lists for portfolio constructor
-        stocks_list = [
-            {
-                "ticker": ticker,
-                "name": data["name"],
-                "score": data["score"],
-                "sector": data["sector"],
-            }
-            for ticker, data in top_stocks.items()
-        ]
-
-        etfs_list = [
-            {
-                "ticker": ticker,
-                "name": data["name"],
-                "score": data["score"],
-                "theme_id": data["theme"],
-            }
-            for ticker, data in top_etfs.items()
-        ]
+        # Score entries already carry ticker and score, which is all the
+        # constructor reads, so they are passed by reference
+        stocks_list = list(top_stocks.values())
+        etfs_list = list(top_etfs.values())
 
         # Create sector map
-        sector_map = {s["ticker"]: s["sector"] for s in stocks_list}
+        sector_map = {ticker: data["sector"] for ticker, data in top_stocks.items()}
 
         # Create theme map (simplified)
         theme_map = {
-            e["ticker"]: e["theme_id"].replace("_", " ").title() for e in etfs_list
+            ticker: _THEME_DISPLAY.get(data["theme"]) or data["theme"].replace("_", " ").title()
+            for ticker, data in top_etfs.items()
         }
 
         try:
@@ -629,11 +937,16 @@ class QuarterlyCompounderScan:
                 return None
 
         except Exception as e:
-            logger.error(f"✗ Error building portfolio: {e}", exc_info=True)
+            # Full traceback is reserved for run(); here only when debugging
+            logger.error("✗ Error building portfolio: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
     def generate_reports(
-        self, portfolio: object, top_stocks: Dict, top_etfs: Dict
+        self,
+        portfolio: object,
+        top_stocks: Dict,
+        top_etfs: Dict,
+        quarter_date: Optional[datetime] = None,
     ) -> Tuple[str, str, str]:
         """
         Generate quarterly reports.
@@ -642,6 +955,7 @@ class QuarterlyCompounderScan:
             portfolio: PortfolioAllocation object
             top_stocks: Dict of top stocks
             top_etfs: Dict of top ETFs
+            quarter_date: Report date (defaults to now)
 
         Returns:
             Tuple of (ownership_report, csv_path, summary)
@@ -651,33 +965,17 @@ class QuarterlyCompounderScan:
         logger.info("STEP 7: GENERATE REPORTS")
         logger.info("=" * 80)
 
-        # Create stock and ETF dicts for report generator
-        stocks_dict = {
-            ticker: {
-                "name": data["name"],
-                "sector": data["sector"],
-                "score": data["score"],
-            }
-            for ticker, data in top_stocks.items()
-        }
-
-        etfs_dict = {
-            ticker: {
-                "name": data["name"],
-                "theme": data["theme"],
-                "score": data["score"],
-            }
-            for ticker, data in top_etfs.items()
-        }
+        if quarter_date is None:
+            quarter_date = datetime.now()
 
-        # Generate ownership report
+        # Generate ownership report. The report generator only reads
+        # name/sector/theme/score, so the scored dicts are passed through as-is
         ownership_report = self.report_generator.generate_ownership_report(
-            portfolio, stocks_dict, etfs_dict
+            portfolio, top_stocks, top_etfs, quarter_date
         )
         logger.info("✓ Ownership report generated")
 
         # Generate allocation CSV
-        quarter_date = datetime.now()
         q = (quarter_date.month - 1) // 3 + 1
         year = quarter_date.year
         csv_filename = f"allocation_model_{year}_Q{q}.csv"
@@ -686,7 +984,7 @@ class QuarterlyCompounderScan:
         Path("data/quarterly_reports").mkdir(parents=True, exist_ok=True)
 
         success = self.report_generator.generate_allocation_csv(
-            portfolio, stocks_dict, etfs_dict, csv_path
+            portfolio, top_stocks, top_etfs, csv_path
         )
 
         if success:
@@ -706,6 +1004,9 @@ class QuarterlyCompounderScan:
         Returns:
             True if successful
         """
+        # One timestamp for the whole run, so every report agrees on the date
+        self.run_start = datetime.now()
+
         try:
             logger.info("")
             logger.info("=" * 80)
@@ -714,7 +1015,7 @@ class QuarterlyCompounderScan:
             if self.test_mode:
                 logger.info("MODE: Test (limited universe)")
             logger.info(f"Stock Limit: {self.limit}")
-            logger.info(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            logger.info(f"Timestamp: {self.run_start.strftime('%Y-%m-%d %H:%M:%S')}")
             logger.info("=" * 80)
 
             # Step 1: Get stock universe
@@ -749,7 +1050,7 @@ class QuarterlyCompounderScan:
 
             # Step 7: Generate reports
             ownership_report, csv_path, summary = self.generate_reports(
-                portfolio, top_stocks, top_etfs
+                portfolio, top_stocks, top_etfs, quarter_date=self.run_start
             )
 
             # Display summary
@@ -763,7 +1064,7 @@ class QuarterlyCompounderScan:
             logger.info(f"Concentration: {portfolio.sector_concentration:.3f}")
             logger.info(f"CSV Export: {csv_path}")
             logger.info("")
-            logger.info("Next Review: " + self.report_generator.get_next_review_date())
+            logger.info("Next Review: " + self.report_generator.get_next_review_date(self.run_start))
             logger.info("")
 
             return True
@@ -13,19 +13,99 @@ Long-term positions (held 1+ years) are excluded to preserve favorable tax treat
 Uses cached price data from daily scans - no additional API calls needed.
 """
 
+import bisect
 import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
+import numpy as np
 import yfinance as yf
 import pandas as pd
 
-from src.screening.phase_indicators import classify_phase
+from src.screening.phase_indicators import phase_levels
 from src.data.git_storage_fetcher import GitStorageFetcher
+from src.data.cache import FileCache, PRICE_TTL
+from src.data.http_session import create_pooled_session
 
 logger = logging.getLogger(__name__)
 
+# Report blocks filled once per summary/position with format()
+_SUMMARY_BLOCK = (
+    "Total Positions: {total_positions}\n"
+    "Need Stop Adjustment: {positions_need_adjustment}\n"
+    "Short-term (<1 year): {short_term_positions}\n"
+    "Long-term (1+ years): {long_term_positions}\n"
+    "Average Gain: {average_gain_pct:+.2f}%"
+)
+_POSITION_HEADER = (
+    "\n" + "#" * 80 + "\n"
+    "POSITION #{0}: {1.ticker}\n"
+    + "#" * 80 + "\n"
+    "Entry: ${1.entry_price:.2f} | Current: ${1.current_price:.2f} | Gain: {1.current_gain_pct:+.2f}%"
+)
+
+# Stop-adjustment tiers for gains of 5%+: (lowest gain, action, description).
+# The partial-exit tiers begin strictly above 19% / 29% gain, where
+# partial_exit_pct = (gain_pct - 15) * 2.5 first exceeds 10 / 35.
+_STOP_TIERS = (
+    (5.0, 'trail_to_breakeven', "TRAIL TO BREAKEVEN"),
+    (10.0, 'trail_to_profit', "TRAIL TO PROFIT"),
+    (math.nextafter(19.0, math.inf), 'take_partial_and_trail', "CONSIDER SELLING {:.0f}%"),
+    (math.nextafter(29.0, math.inf), 'take_major_partial_and_trail_tight', "SELL {:.0f}%"),
+)
+_STOP_TIER_CUTOFFS = tuple(tier[0] for tier in _STOP_TIERS)
+# Action per tier index + 1 (index -1 is a gain below 5%: hold)
+_TIER_ACTIONS = np.array(['hold'] + [tier[1] for tier in _STOP_TIERS], dtype=object)
+
+# Memoized phase_levels results kept per PositionManager before a reset
+LEVELS_CACHE_SIZE = 2048
+
+# Only columns analyze_position reads (kept float64: the stop and support
+# levels shown to the user are computed from them)
+PRICE_COLUMNS = ['High', 'Low', 'Close']
+
+
+def _slim_prices(data: pd.DataFrame) -> pd.DataFrame:
+    """Drop unused columns (Open, Volume, Dividends, ...)."""
+    return data[PRICE_COLUMNS]
+
+
+# One keep-alive session shared by every Ticker this module creates
+_SHARED_SESSION = create_pooled_session()
+
+
+@lru_cache(maxsize=512)
+def _get_ticker(symbol: str) -> yf.Ticker:
+    """Return a process-wide yf.Ticker for symbol (reused across calls)."""
+    return yf.Ticker(symbol, session=_SHARED_SESSION)
+
+
+@dataclass(slots=True)
+class PositionAnalysis:
+    """Stop management recommendation for one position."""
+    ticker: str
+    entry_price: float
+    current_price: float
+    should_adjust_stop: bool = False
+    recommended_stop: Optional[float] = None
+    current_gain_pct: float = 0
+    rationale: str = ''
+    action: str = 'hold'  # trail_to_breakeven, trail_to_profit, take_partial_and_trail, ...
+    tax_treatment: str = 'unknown'  # short_term or long_term once entry date is known
+    warnings: List[str] = field(default_factory=list)
+    days_held: Optional[int] = None
+    phase: Optional[int] = None
+    sma_50: Optional[float] = None
+    recent_low: Optional[float] = None
+    partial_exit_pct: Optional[float] = None
+    locked_profit_pct: Optional[float] = None
+    quantity: Optional[float] = None
+
 
 class PositionManager:
     """Analyze positions and recommend stop loss adjustments.
@@ -42,6 +122,43 @@ class PositionManager:
         self.use_cache = use_cache
         self.git_fetcher = GitStorageFetcher() if use_cache else None
         self.fundamentals_dir = Path("./data/fundamentals_cache")
+        self.price_cache = FileCache('./data/cache/api/prices', enabled=use_cache)
+        self._levels_cache: Dict[tuple, tuple] = {}
+
+    def clear_cache(self) -> int:
+        """Delete cached yfinance price history and memoized phase levels.
+
+        Returns:
+            Number of price entries removed
+        """
+        self._levels_cache.clear()
+        return self.price_cache.clear()
+
+    def _get_levels(self, ticker: str, price_data: pd.DataFrame, current_price: float) -> tuple:
+        """phase_levels for the price history, memoized per ticker and bar.
+
+        Re-analyzing a ticker whose history has not gained a bar (or had its
+        last bar revised) at the same current price reuses the earlier result.
+
+        Returns:
+            Tuple of (phase, sma_50, sma_200, recent_low)
+        """
+        last = price_data.iloc[-1]
+        key = (
+            ticker, price_data.index[-1], len(price_data),
+            float(last['Low']), float(last['Close']), float(current_price)
+        )
+        levels = self._levels_cache.get(key)
+        if levels is None:
+            levels = phase_levels(
+                price_data['Low'].to_numpy(dtype=np.float64),
+                price_data['Close'].to_numpy(dtype=np.float64),
+                float(current_price)
+            )
+            if len(self._levels_cache) >= LEVELS_CACHE_SIZE:
+                self._levels_cache.clear()
+            self._levels_cache[key] = levels
+        return levels
 
     def _get_price_data(self, ticker: str) -> pd.DataFrame:
         """Get price data from cache or yfinance.
@@ -58,21 +175,95 @@ class PositionManager:
                 price_data = self.git_fetcher.fetch_price_fresh(ticker)
                 if not price_data.empty:
                     logger.debug(f"{ticker}: Using cached price data")
-                    return price_data
+                    return _slim_prices(price_data)
             except Exception as e:
                 logger.debug(f"{ticker}: Cache fetch failed, falling back to yfinance: {e}")
 
+        cache_key = FileCache.make_key(ticker, 'history_1y', PRICE_TTL)
+        price_data = self.price_cache.get(cache_key, PRICE_TTL)
+        if price_data is not None:
+            logger.debug(f"{ticker}: Using file-cached price data")
+            return price_data
+
         # Fallback to yfinance
         try:
-            stock = yf.Ticker(ticker)
-            price_data = stock.history(period='1y', interval='1d')
+            stock = _get_ticker(ticker)
+            price_data = stock.history(period='1y', interval='1d', actions=False)
             if not price_data.empty:
                 logger.debug(f"{ticker}: Fetched fresh price data from yfinance")
+                price_data = _slim_prices(price_data)
+                self.price_cache.set(cache_key, price_data)
             return price_data
         except Exception as e:
             logger.error(f"{ticker}: Failed to fetch price data: {e}")
             return pd.DataFrame()
 
+    def _prefetch_price_data(self, tickers: List[str]) -> Dict[str, pd.DataFrame]:
+        """Get price data for many tickers, downloading cache misses together.
+
+        Tickers found in the git or file cache are used as-is; the rest are
+        fetched with one yf.download call instead of one request per ticker.
+        Tickers missing from the download are left out, and analyze_position
+        fetches them individually.
+
+        Args:
+            tickers: Stock tickers
+
+        Returns:
+            Dict of {ticker: price DataFrame}
+        """
+        price_data = {}
+        to_download = []
+
+        for ticker in tickers:
+            if self.use_cache and self.git_fetcher:
+                try:
+                    cached = self.git_fetcher.fetch_price_fresh(ticker)
+                    if not cached.empty:
+                        price_data[ticker] = _slim_prices(cached)
+                        continue
+                except Exception as e:
+                    logger.debug(f"{ticker}: Cache fetch failed, falling back to yfinance: {e}")
+            cached = self.price_cache.get(FileCache.make_key(ticker, 'history_1y', PRICE_TTL), PRICE_TTL)
+            if cached is not None:
+                price_data[ticker] = cached
+                continue
+            to_download.append(ticker)
+
+        # A single ticker gains nothing from the batch call
+        if len(to_download) < 2:
+            return price_data
+
+        try:
+            data = yf.download(
+                to_download,
+                period='1y',
+                interval='1d',
+                group_by='ticker',
+                threads=True,
+                progress=False,
+                actions=False,
+                session=_SHARED_SESSION
+            )
+        except Exception as e:
+            logger.warning(f"Batch download failed for {len(to_download)} tickers: {e}")
+            return price_data
+
+        if data is None or data.empty or not isinstance(data.columns, pd.MultiIndex):
+            return price_data
+
+        available = set(data.columns.get_level_values(0))
+        for ticker in to_download:
+            if ticker in available:
+                hist = data[ticker].dropna(how='all')
+                if not hist.empty:
+                    hist = _slim_prices(hist)
+                    price_data[ticker] = hist
+                    self.price_cache.set(FileCache.make_key(ticker, 'history_1y', PRICE_TTL), hist)
+
+        logger.debug(f"Batch download: {len(price_data)}/{len(tickers)} tickers with price data")
+        return price_data
+
     def _get_cached_fundamentals(self, ticker: str) -> Dict:
         """Get cached fundamentals if available.
 
@@ -102,8 +293,12 @@ class PositionManager:
         ticker: str,
         entry_price: float,
         current_price: float,
-        entry_date: Optional[datetime] = None
-    ) -> Dict:
+        entry_date: Optional[datetime] = None,
+        price_data: Optional[pd.DataFrame] = None,
+        now: Optional[datetime] = None,
+        skip_technicals: bool = False,
+        verbose: bool = True
+    ) -> PositionAnalysis:
         """Analyze a single position and recommend stop management.
 
         Args:
@@ -111,88 +306,80 @@ class PositionManager:
             entry_price: Your average entry price
             current_price: Current market price
             entry_date: When you entered (optional, for tax treatment check)
+            price_data: Pre-fetched price history (optional, fetched if None)
+            now: Reference time for days held (defaults to datetime.now())
+            skip_technicals: Only classify gain and tax treatment (no price
+                data fetch, no stop recommendation)
+            verbose: Build the rationale text; callers that only read the
+                structured fields (action, recommended_stop, ...) can skip it
 
         Returns:
-            Dict with recommendations:
-            - should_adjust_stop: bool
-            - recommended_stop: float (new stop level)
-            - current_gain_pct: float
-            - rationale: str (why adjust)
-            - action: str (trail_to_breakeven, trail_to_profit, take_partial, hold)
-            - tax_treatment: str (short_term or long_term)
+            PositionAnalysis with the recommendation (should_adjust_stop,
+            recommended_stop, action, rationale, tax_treatment, ...)
         """
-        result = {
-            'ticker': ticker,
-            'entry_price': entry_price,
-            'current_price': current_price,
-            'should_adjust_stop': False,
-            'recommended_stop': None,
-            'current_gain_pct': 0,
-            'rationale': '',
-            'action': 'hold',
-            'tax_treatment': 'unknown',
-            'warnings': []
-        }
+        result = PositionAnalysis(ticker, entry_price, current_price)
 
         # Validate prices
         if entry_price <= 0:
-            result['warnings'].append('Invalid entry price (zero or negative) - cannot analyze')
-            result['rationale'] = f"Cannot analyze - invalid entry price: ${entry_price:.2f}"
+            result.warnings.append('Invalid entry price (zero or negative) - cannot analyze')
+            result.rationale = f"Cannot analyze - invalid entry price: ${entry_price:.2f}"
             return result
 
         if current_price <= 0:
-            result['warnings'].append('Invalid current price (zero or negative) - cannot analyze')
-            result['rationale'] = f"Cannot analyze - invalid current price: ${current_price:.2f}"
+            result.warnings.append('Invalid current price (zero or negative) - cannot analyze')
+            result.rationale = f"Cannot analyze - invalid current price: ${current_price:.2f}"
             return result
 
         # Calculate current gain
         gain_pct = ((current_price - entry_price) / entry_price) * 100
-        result['current_gain_pct'] = round(gain_pct, 2)
+        result.current_gain_pct = round(gain_pct, 2)
 
         # Check tax treatment
         if entry_date:
-            days_held = (datetime.now() - entry_date).days
+            days_held = ((now or datetime.now()) - entry_date).days
             if days_held >= 365:
-                result['tax_treatment'] = 'long_term'
-                result['rationale'] = f"LONG-TERM HOLD ({days_held} days) - Preserve long-term capital gains tax rate. No stop adjustment recommended."
+                result.tax_treatment = 'long_term'
+                if verbose:
+                    result.rationale = f"LONG-TERM HOLD ({days_held} days) - Preserve long-term capital gains tax rate. No stop adjustment recommended."
                 return result
             else:
-                result['tax_treatment'] = 'short_term'
-                result['days_held'] = days_held
+                result.tax_treatment = 'short_term'
+                result.days_held = days_held
+
+        if skip_technicals:
+            return result
 
         # Fetch price data and analyze (uses cache by default)
         try:
-            price_data = self._get_price_data(ticker)
+            if price_data is None:
+                price_data = self._get_price_data(ticker)
 
             if price_data.empty or len(price_data) < 50:
-                result['warnings'].append('Insufficient price data for analysis')
+                result.warnings.append('Insufficient price data for analysis')
                 return result
 
-            # Calculate phase and technical levels
-            phase_info = classify_phase(price_data, current_price)
-            phase = phase_info['phase']
-
-            sma_50 = phase_info.get('sma_50', 0)
-            sma_200 = phase_info.get('sma_200', 0)
+            # Calculate phase, technical levels and recent swing low (last 10 days)
+            phase, sma_50, sma_200, recent_low = self._get_levels(ticker, price_data, current_price)
+            # classify_phase reports the SMAs rounded to cents
+            sma_50 = round(sma_50, 2) if phase else 0
+            sma_200 = round(sma_200, 2) if phase else 0
 
-            # Recent swing low (last 10 days)
-            recent_low = price_data['Low'].iloc[-10:].min()
-
-            result['phase'] = phase
-            result['sma_50'] = round(sma_50, 2)
-            result['recent_low'] = round(recent_low, 2)
+            result.phase = phase
+            result.sma_50 = round(sma_50, 2)
+            result.recent_low = round(recent_low, 2)
 
             # STOP LOSS ADJUSTMENT LOGIC - LINEAR FORMULAS (NO BUCKETS)
             # Based on continuous gain percentage scaling
 
             if gain_pct < 5:
                 # Small gain - don't adjust yet
-                result['action'] = 'hold'
-                result['rationale'] = f"Position up {gain_pct:.1f}% - hold initial stop. Wait for 5%+ gain before adjusting."
+                result.action = 'hold'
+                if verbose:
+                    result.rationale = f"Position up {gain_pct:.1f}% - hold initial stop. Wait for 5%+ gain before adjusting."
 
             else:
                 # Gains of 5%+ trigger stop adjustments
-                result['should_adjust_stop'] = True
+                result.should_adjust_stop = True
 
                 # CALCULATE PROFIT-BASED STOP (scales linearly with gain)
                 # Formula: entry * (1 + min(gain_pct - 3, gain_pct * 0.5) / 100)
@@ -217,15 +404,15 @@ class PositionManager:
 
                 # USE WHICHEVER STOP IS HIGHER (more conservative)
                 if sma_based_stop and sma_based_stop > profit_based_stop:
-                    result['recommended_stop'] = round(sma_based_stop, 2)
+                    result.recommended_stop = round(sma_based_stop, 2)
                     stop_type = "SMA-based"
-                    sma_buffer_pct = ((sma_50 - result['recommended_stop']) / sma_50) * 100
+                    sma_buffer_pct = ((sma_50 - result.recommended_stop) / sma_50) * 100
                 else:
-                    result['recommended_stop'] = round(profit_based_stop, 2)
+                    result.recommended_stop = round(profit_based_stop, 2)
                     stop_type = "profit-based"
 
                 # Calculate what % profit is locked in
-                locked_profit = ((result['recommended_stop'] / entry_price) - 1) * 100
+                locked_profit = ((result.recommended_stop / entry_price) - 1) * 100
 
                 # DETERMINE ACTION AND PARTIAL EXIT % (scales linearly)
                 # Formula for partial exit: min(50, max(0, (gain_pct - 15) * 2.5))
@@ -236,77 +423,134 @@ class PositionManager:
                 # - 35% gain → 50% partial exit (capped)
                 partial_exit_pct = min(50, max(0, (gain_pct - 15) * 2.5))
 
-                if partial_exit_pct > 35:
-                    result['action'] = 'take_major_partial_and_trail_tight'
-                    action_desc = f"SELL {partial_exit_pct:.0f}%"
-                elif partial_exit_pct > 10:
-                    result['action'] = 'take_partial_and_trail'
-                    action_desc = f"CONSIDER SELLING {partial_exit_pct:.0f}%"
-                elif gain_pct >= 10:
-                    result['action'] = 'trail_to_profit'
-                    action_desc = "TRAIL TO PROFIT"
-                else:
-                    result['action'] = 'trail_to_breakeven'
-                    action_desc = "TRAIL TO BREAKEVEN"
-
-                # BUILD RATIONALE
-                rationale_lines = []
-                rationale_lines.append(f"Position up {gain_pct:.1f}% - {action_desc}")
-                rationale_lines.append("")
-
-                if partial_exit_pct > 0:
-                    remaining_pct = 100 - partial_exit_pct
-                    rationale_lines.append(f"  RECOMMENDED ACTION:")
-                    rationale_lines.append(f"    • Sell {partial_exit_pct:.0f}% at ${current_price:.2f} (lock in ${(current_price - entry_price) * partial_exit_pct / 100:.2f}/share)")
-                    rationale_lines.append(f"    • Trail remaining {remaining_pct:.0f}% with stop at ${result['recommended_stop']:.2f}")
-                    rationale_lines.append(f"    • Effective: locks minimum +{locked_profit:.1f}% on full position")
-                else:
-                    rationale_lines.append(f"  NEW STOP LOSS: ${result['recommended_stop']:.2f}")
-                    rationale_lines.append(f"    • Locks in minimum +{locked_profit:.1f}% profit")
-                    rationale_lines.append(f"    • Stop type: {stop_type}")
-
-                rationale_lines.append("")
-                rationale_lines.append(f"  Technical: Phase {phase} | 50 SMA: ${sma_50:.2f}")
-
-                # Add Phase 3 warning for big winners
-                if phase == 3 and gain_pct >= 20:
-                    rationale_lines.append(f"  ⚠️ WARNING: Stock in Phase 3 (distribution). Consider tighter exit.")
-
-                result['rationale'] = "\n".join(rationale_lines)
-                result['partial_exit_pct'] = round(partial_exit_pct, 1)
-                result['locked_profit_pct'] = round(locked_profit, 2)
+                _, result.action, action_desc = _STOP_TIERS[
+                    bisect.bisect_right(_STOP_TIER_CUTOFFS, gain_pct) - 1
+                ]
+                if verbose:
+                    action_desc = action_desc.format(partial_exit_pct)
+
+                    # BUILD RATIONALE
+                    rationale_lines = []
+                    rationale_lines.append(f"Position up {gain_pct:.1f}% - {action_desc}")
+                    rationale_lines.append("")
+
+                    if partial_exit_pct > 0:
+                        remaining_pct = 100 - partial_exit_pct
+                        rationale_lines.append(f"  RECOMMENDED ACTION:")
+                        rationale_lines.append(f"    • Sell {partial_exit_pct:.0f}% at ${current_price:.2f} (lock in ${(current_price - entry_price) * partial_exit_pct / 100:.2f}/share)")
+                        rationale_lines.append(f"    • Trail remaining {remaining_pct:.0f}% with stop at ${result.recommended_stop:.2f}")
+                        rationale_lines.append(f"    • Effective: locks minimum +{locked_profit:.1f}% on full position")
+                    else:
+                        rationale_lines.append(f"  NEW STOP LOSS: ${result.recommended_stop:.2f}")
+                        rationale_lines.append(f"    • Locks in minimum +{locked_profit:.1f}% profit")
+                        rationale_lines.append(f"    • Stop type: {stop_type}")
+
+                    rationale_lines.append("")
+                    rationale_lines.append(f"  Technical: Phase {phase} | 50 SMA: ${sma_50:.2f}")
+
+                    # Add Phase 3 warning for big winners
+                    if phase == 3 and gain_pct >= 20:
+                        rationale_lines.append(f"  ⚠️ WARNING: Stock in Phase 3 (distribution). Consider tighter exit.")
+
+                    result.rationale = "\n".join(rationale_lines)
+                result.partial_exit_pct = round(partial_exit_pct, 1)
+                result.locked_profit_pct = round(locked_profit, 2)
 
             # Additional checks
             if phase == 3 or phase == 4:
-                result['warnings'].append(
+                result.warnings.append(
                     f'⚠️ Stock in Phase {phase} (distribution/decline). Consider tighter stops or exit.'
                 )
 
             if current_price < sma_50 and sma_50 > 0:
-                result['warnings'].append(
+                result.warnings.append(
                     f'⚠️ Price broke below 50 SMA (${sma_50:.2f}). Trend weakening - review position.'
                 )
 
         except Exception as e:
             logger.error(f"Error analyzing {ticker}: {e}")
-            result['warnings'].append(f'Analysis error: {str(e)}')
+            result.warnings.append(f'Analysis error: {str(e)}')
 
         return result
 
+    @staticmethod
+    def analyze_portfolio_vectorized(
+        tickers: List[str],
+        entry_prices: np.ndarray,
+        current_prices: np.ndarray,
+        sma_50: np.ndarray
+    ) -> pd.DataFrame:
+        """Stop recommendations for many positions at once with NumPy.
+
+        Applies the same gain-scaled formulas as analyze_position across whole
+        arrays, without the rationale text or tax-treatment check (drop
+        long-term holdings before calling). Meant for large candidate lists
+        where per-position Python dominates.
+
+        Args:
+            tickers: Position tickers (result index)
+            entry_prices: Average entry prices
+            current_prices: Current prices
+            sma_50: 50-day SMA per position (0 if unknown)
+
+        Returns:
+            DataFrame indexed by ticker with gain_pct, should_adjust_stop,
+            recommended_stop, stop_type, partial_exit_pct, locked_profit_pct
+            and action. Stops are NaN for holds and invalid prices; rounding
+            uses np.round, so a stop can differ from the scalar path by a
+            cent on exact half-cent ties.
+        """
+        entry = np.asarray(entry_prices, dtype=np.float64)
+        current = np.asarray(current_prices, dtype=np.float64)
+        sma = np.asarray(sma_50, dtype=np.float64)
+        valid = (entry > 0) & (current > 0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            gain = np.where(valid, ((current - entry) / entry) * 100, np.nan)
+
+            # Profit-based and SMA-based stops; the higher one wins
+            profit_stop = entry * (1 + np.minimum(gain - 3, gain * 0.5) / 100)
+            sma_buffer = np.maximum(0.5, 1.5 - gain / 50)
+            sma_stop = sma * (1 - sma_buffer / 100)
+            use_sma = (sma > 0) & (sma < current) & (sma_stop > profit_stop)
+
+            adjust = gain >= 5
+            stop = np.where(adjust, np.round(np.where(use_sma, sma_stop, profit_stop), 2), np.nan)
+            locked = ((stop / entry) - 1) * 100
+
+        partial = np.minimum(50, np.maximum(0, (gain - 15) * 2.5))
+        tier = np.searchsorted(_STOP_TIER_CUTOFFS, np.where(valid, gain, -np.inf), side='right')
+
+        return pd.DataFrame({
+            'gain_pct': np.round(gain, 2),
+            'should_adjust_stop': adjust,
+            'recommended_stop': stop,
+            'stop_type': np.where(adjust, np.where(use_sma, 'SMA-based', 'profit-based'), None),
+            'partial_exit_pct': np.where(adjust, np.round(partial, 1), np.nan),
+            'locked_profit_pct': np.round(locked, 2),
+            'action': _TIER_ACTIONS[tier]
+        }, index=pd.Index(tickers, name='ticker'))
+
     def analyze_portfolio(
         self,
         positions: List[Dict],
-        entry_dates: Optional[Dict[str, datetime]] = None
+        entry_dates: Optional[Dict[str, datetime]] = None,
+        skip_technicals: bool = False,
+        verbose: bool = True
     ) -> Dict:
         """Analyze all positions and generate comprehensive report.
 
         Args:
             positions: List of position dicts from RobinhoodPositionFetcher
             entry_dates: Optional dict of {ticker: entry_date} for tax treatment
+            skip_technicals: Only classify gains and tax treatment, without
+                fetching any price history
+            verbose: Build per-position rationale text (needed for
+                format_portfolio_report)
 
         Returns:
             Dict with:
-            - position_analyses: List of individual position analyses
+            - position_analyses: List of PositionAnalysis, in input order
             - summary: Portfolio-level stats
             - urgent_actions: List of positions needing immediate attention
         """
@@ -318,9 +562,19 @@ class PositionManager:
             }
 
         entry_dates = entry_dates or {}
-        analyses = []
 
-        for pos in positions:
+        # One reference time for days held, the prefetch filter and the timestamp
+        now = datetime.now()
+
+        # Fetch price history up front for every position that will need it
+        # (long-term holds and invalid prices return before the technicals)
+        price_data = {} if skip_technicals else self._prefetch_price_data([
+            pos['ticker'] for pos in positions
+            if pos['average_buy_price'] > 0 and pos['current_price'] > 0
+            and not (entry_dates.get(pos['ticker']) and (now - entry_dates[pos['ticker']]).days >= 365)
+        ])
+
+        def analyze(pos: Dict) -> PositionAnalysis:
             ticker = pos['ticker']
             entry_date = entry_dates.get(ticker)
 
@@ -330,23 +584,51 @@ class PositionManager:
                 ticker=ticker,
                 entry_price=pos['average_buy_price'],
                 current_price=pos['current_price'],
-                entry_date=entry_date
+                entry_date=entry_date,
+                price_data=price_data.get(ticker),
+                now=now,
+                skip_technicals=skip_technicals,
+                verbose=verbose
             )
 
-            analysis['quantity'] = pos['quantity']
-            analyses.append(analysis)
+            analysis.quantity = pos['quantity']
+            return analysis
 
-        # Generate summary
-        total_positions = len(analyses)
-        positions_to_adjust = sum(1 for a in analyses if a['should_adjust_stop'])
-        short_term_positions = sum(
-            1 for a in analyses if a['tax_treatment'] == 'short_term'
-        )
-        long_term_positions = sum(
-            1 for a in analyses if a['tax_treatment'] == 'long_term'
-        )
+        # Positions are independent; fallback fetches overlap across threads.
+        # map() yields results in input order.
+        with ThreadPoolExecutor(max_workers=min(16, len(positions))) as executor:
+            analyses = list(executor.map(analyze, positions))
 
-        avg_gain = sum(a['current_gain_pct'] for a in analyses) / total_positions if total_positions > 0 else 0
+        # Summary counts and urgent actions in one pass
+        # (Phase 3/4 warnings, big winners, breakdowns)
+        positions_to_adjust = short_term_positions = long_term_positions = 0
+        total_gain = 0.0
+        urgent = []
+        for analysis in analyses:
+            if analysis.should_adjust_stop:
+                positions_to_adjust += 1
+            tax_treatment = analysis.tax_treatment
+            if tax_treatment == 'short_term':
+                short_term_positions += 1
+            elif tax_treatment == 'long_term':
+                long_term_positions += 1
+            total_gain += analysis.current_gain_pct
+
+            if analysis.warnings:
+                urgent.append({
+                    'ticker': analysis.ticker,
+                    'reason': analysis.warnings,
+                    'current_gain': analysis.current_gain_pct
+                })
+            elif analysis.action in ['take_partial_and_trail', 'take_partial_and_trail_tight']:
+                urgent.append({
+                    'ticker': analysis.ticker,
+                    'reason': 'Big winner - consider taking partial profits',
+                    'current_gain': analysis.current_gain_pct
+                })
+
+        total_positions = len(analyses)
+        avg_gain = total_gain / total_positions if total_positions > 0 else 0
 
         summary = {
             'total_positions': total_positions,
@@ -356,27 +638,11 @@ class PositionManager:
             'average_gain_pct': round(avg_gain, 2)
         }
 
-        # Urgent actions (Phase 3/4 warnings, big winners, breakdowns)
-        urgent = []
-        for analysis in analyses:
-            if analysis['warnings']:
-                urgent.append({
-                    'ticker': analysis['ticker'],
-                    'reason': analysis['warnings'],
-                    'current_gain': analysis['current_gain_pct']
-                })
-            elif analysis.get('action') in ['take_partial_and_trail', 'take_partial_and_trail_tight']:
-                urgent.append({
-                    'ticker': analysis['ticker'],
-                    'reason': 'Big winner - consider taking partial profits',
-                    'current_gain': analysis['current_gain_pct']
-                })
-
         return {
             'position_analyses': analyses,
             'summary': summary,
             'urgent_actions': urgent,
-            'timestamp': datetime.now()
+            'timestamp': now
         }
 
     def format_portfolio_report(self, analysis_result: Dict) -> str:
@@ -391,18 +657,15 @@ class PositionManager:
         lines = []
         lines.append("="*80)
         lines.append("POSITION MANAGEMENT REPORT - STOP LOSS RECOMMENDATIONS")
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        generated = analysis_result.get('timestamp') or datetime.now()
+        lines.append(f"Generated: {generated.strftime('%Y-%m-%d %H:%M:%S')}")
         lines.append("="*80)
         lines.append("")
 
         summary = analysis_result['summary']
         lines.append("PORTFOLIO SUMMARY")
         lines.append("-"*80)
-        lines.append(f"Total Positions: {summary['total_positions']}")
-        lines.append(f"Need Stop Adjustment: {summary['positions_need_adjustment']}")
-        lines.append(f"Short-term (<1 year): {summary['short_term_positions']}")
-        lines.append(f"Long-term (1+ years): {summary['long_term_positions']}")
-        lines.append(f"Average Gain: {summary['average_gain_pct']:+.2f}%")
+        lines.append(_SUMMARY_BLOCK.format_map(summary))
         lines.append("")
 
         # Urgent actions
@@ -423,37 +686,33 @@ class PositionManager:
         lines.append("="*80)
 
         for i, analysis in enumerate(analysis_result['position_analyses'], 1):
-            lines.append(f"\n{'#'*80}")
-            lines.append(f"POSITION #{i}: {analysis['ticker']}")
-            lines.append(f"{'#'*80}")
-
-            lines.append(f"Entry: ${analysis['entry_price']:.2f} | Current: ${analysis['current_price']:.2f} | Gain: {analysis['current_gain_pct']:+.2f}%")
+            lines.append(_POSITION_HEADER.format(i, analysis))
 
-            if analysis['tax_treatment'] != 'unknown':
-                lines.append(f"Tax Treatment: {analysis['tax_treatment'].upper()}")
-                if 'days_held' in analysis:
-                    lines.append(f"Days Held: {analysis['days_held']}")
+            if analysis.tax_treatment != 'unknown':
+                lines.append(f"Tax Treatment: {analysis.tax_treatment.upper()}")
+                if analysis.days_held is not None:
+                    lines.append(f"Days Held: {analysis.days_held}")
 
             lines.append("")
-            lines.append(f"ACTION: {analysis['action'].replace('_', ' ').upper()}")
+            lines.append(f"ACTION: {analysis.action.replace('_', ' ').upper()}")
             lines.append("")
 
-            if analysis['should_adjust_stop']:
-                lines.append(f"✓ RECOMMENDED STOP LOSS: ${analysis['recommended_stop']:.2f}")
+            if analysis.should_adjust_stop:
+                lines.append(f"✓ RECOMMENDED STOP LOSS: ${analysis.recommended_stop:.2f}")
                 lines.append("")
 
             lines.append("RATIONALE:")
-            lines.append(analysis['rationale'])
+            lines.append(analysis.rationale)
 
-            if analysis.get('phase'):
-                tech_line = f"\nTechnical: Phase {analysis['phase']}"
-                if analysis.get('sma_50'):
-                    tech_line += f" | 50 SMA: ${analysis['sma_50']:.2f}"
+            if analysis.phase:
+                tech_line = f"\nTechnical: Phase {analysis.phase}"
+                if analysis.sma_50:
+                    tech_line += f" | 50 SMA: ${analysis.sma_50:.2f}"
                 lines.append(tech_line)
 
-            if analysis['warnings']:
+            if analysis.warnings:
                 lines.append("\nWARNINGS:")
-                for warning in analysis['warnings']:
+                for warning in analysis.warnings:
                     lines.append(f"  {warning}")
 
             lines.append("")
@@ -0,0 +1,143 @@
+"""
+Persistent on-disk cache for API responses (price history, fundamentals).
+
+Entries are keyed by (ticker, endpoint, date bucket) and stored as one pickle
+file per key, so a warm re-run of the same tickers skips the network and does
+not consume the FMP daily call budget. Files older than the longest TTL can
+no longer be read and are deleted when a cache is opened.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default time-to-live per data type
+PRICE_TTL = timedelta(days=1)
+FUNDAMENTALS_TTL = timedelta(days=7)
+MAX_TTL = max(PRICE_TTL, FUNDAMENTALS_TTL)
+
+
+class FileCache:
+    """Pickle-file cache with a per-lookup TTL.
+
+    get/set may be called from several threads.
+    """
+
+    def __init__(self, cache_dir: str = "./data/cache/api", enabled: bool = True,
+                 max_age: timedelta = MAX_TTL):
+        """
+        Initialize cache and delete expired files.
+
+        Args:
+            cache_dir: Directory holding the cache files
+            enabled: If False, get() always misses and set() is a no-op
+            max_age: Longest TTL any lookup uses; older files are pruned
+        """
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if enabled:
+            self.prune()
+
+    @staticmethod
+    def make_key(ticker: str, endpoint: str, ttl: timedelta) -> str:
+        """Build the cache key for ticker/endpoint in the current TTL window.
+
+        The date bucket is the first day of the current ttl-long window, so a
+        7-day TTL shares one key for the whole week rather than rolling daily.
+        """
+        days = max(1, ttl.days)
+        bucket = date.fromordinal(date.today().toordinal() // days * days)
+        return f"{ticker}:{endpoint}:{bucket:%Y%m%d}"
+
+    def _path(self, key: str) -> Path:
+        """File location for a key."""
+        return self.cache_dir / f"{hashlib.md5(key.encode()).hexdigest()}.pkl"
+
+    def get(self, key: str, ttl: timedelta) -> Optional[Any]:
+        """Return the cached value for key if younger than ttl, else None."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime < ttl.total_seconds():
+                with open(path, 'rb') as f:
+                    value = pickle.load(f)
+                with self._lock:
+                    self.hits += 1
+                return value
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Could not read cache entry {key}: {e}")
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key (atomic write)."""
+        if not self.enabled:
+            return
+        path = self._path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write cache entry {key}: {e}")
+
+    def prune(self) -> int:
+        """Delete cache files (and stray temp files) older than max_age.
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        cutoff = time.time() - self.max_age.total_seconds()
+        try:
+            entries = os.scandir(self.cache_dir)
+        except FileNotFoundError:
+            return 0
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(('.pkl', '.tmp')):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+                except OSError as e:
+                    logger.debug(f"Could not prune cache file {entry.path}: {e}")
+        if removed:
+            logger.debug(f"Pruned {removed} expired cache files from {self.cache_dir}")
+        return removed
+
+    def clear(self) -> int:
+        """Delete all cache files.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob('*.pkl'):
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError as e:
+                    logger.warning(f"Could not remove cache file {path}: {e}")
+        logger.info(f"Cleared {removed} cache entries from {self.cache_dir}")
+        return removed
@@ -12,8 +12,13 @@ Strategy:
 
 import logging
 import os
-from typing import Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
+import requests
+
+from .cache import FileCache, FUNDAMENTALS_TTL
 from .fmp_fetcher import FMPFetcher
 from .fundamentals_fetcher import (
     fetch_quarterly_financials,
@@ -21,18 +26,29 @@ from .fundamentals_fetcher import (
     analyze_fundamentals_for_signal
 )
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# FMP requests per stock in fetch_comprehensive_fundamentals
+FMP_CALLS_PER_STOCK = 4
+
+# Concurrent tickers in fetch_quarterly_data_batch
+FMP_BATCH_WORKERS = 8
+
 
 class EnhancedFundamentalsFetcher:
     """Unified fundamentals fetcher using FMP + yfinance."""
 
-    def __init__(self):
-        """Initialize fetcher with FMP if API key available."""
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        use_cache: bool = True
+    ):
+        """Initialize fetcher with FMP if API key available.
+
+        Args:
+            session: Optional shared HTTP session for FMP requests
+            use_cache: Reuse FMP responses from the on-disk cache (7-day TTL)
+        """
         self.fmp_available = False
         self.fmp_fetcher = None
 
@@ -40,7 +56,7 @@ class EnhancedFundamentalsFetcher:
         fmp_api_key = os.getenv('FMP_API_KEY')
         if fmp_api_key:
             try:
-                self.fmp_fetcher = FMPFetcher(api_key=fmp_api_key)
+                self.fmp_fetcher = FMPFetcher(api_key=fmp_api_key, session=session)
                 self.fmp_available = True
                 logger.info("FMP available - will use for enhanced fundamentals")
             except Exception as e:
@@ -50,6 +66,23 @@ class EnhancedFundamentalsFetcher:
 
         self.fmp_call_count = 0
         self.fmp_daily_limit = 250
+        self._fmp_lock = threading.Lock()
+        self.cache = FileCache('./data/cache/api/fundamentals', enabled=use_cache)
+        # Raw FMP payloads behind fetch_quarterly_data results, so create_snapshot
+        # needs no second fetch even with the disk cache disabled
+        self._fmp_raw: Dict[str, Dict] = {}
+
+    def _reserve_fmp(self, n: int = FMP_CALLS_PER_STOCK) -> bool:
+        """Atomically claim n FMP calls from the daily budget.
+
+        Returns:
+            True if the calls fit under fmp_daily_limit (and were counted)
+        """
+        with self._fmp_lock:
+            if self.fmp_call_count + n > self.fmp_daily_limit:
+                return False
+            self.fmp_call_count += n
+            return True
 
     def fetch_quarterly_data(
         self,
@@ -67,13 +100,21 @@ class EnhancedFundamentalsFetcher:
         """
         # If FMP requested and available, use it
         if use_fmp and self.fmp_available:
-            if self.fmp_call_count < self.fmp_daily_limit:
+            cache_key = FileCache.make_key(ticker, 'fmp_fundamentals', FUNDAMENTALS_TTL)
+            data = self.cache.get(cache_key, FUNDAMENTALS_TTL)
+            if data is not None:
+                logger.debug(f"Using cached FMP data for {ticker}")
+                self._fmp_raw[ticker] = data
+                return self._convert_fmp_to_standard(data)
+
+            if self._reserve_fmp():
                 try:
                     data = self.fmp_fetcher.fetch_comprehensive_fundamentals(ticker)
-                    self.fmp_call_count += 4  # 4 API calls per stock
 
                     if data and data.get('income_statement'):
                         logger.debug(f"Using FMP data for {ticker}")
+                        self.cache.set(cache_key, data)
+                        self._fmp_raw[ticker] = data
                         return self._convert_fmp_to_standard(data)
                     else:
                         logger.warning(f"FMP returned no data for {ticker}, falling back to yfinance")
@@ -85,6 +126,36 @@ class EnhancedFundamentalsFetcher:
         # Fall back to yfinance
         return fetch_quarterly_financials(ticker)
 
+    def fetch_quarterly_data_batch(
+        self,
+        tickers: List[str],
+        use_fmp: bool = True
+    ) -> Dict[str, Dict]:
+        """Fetch quarterly data for several tickers concurrently.
+
+        Each ticker goes through fetch_quarterly_data, so cached tickers cost
+        nothing and tickers past the FMP daily limit fall back to yfinance.
+        Wall time is roughly one ticker's round trips per FMP_BATCH_WORKERS
+        tickers instead of one per ticker.
+
+        Args:
+            tickers: Stock tickers (e.g. top buy candidates; duplicates are fetched once)
+            use_fmp: If True and FMP available, use FMP for detailed data
+
+        Returns:
+            Dict of {ticker: quarterly data}
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if not tickers:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(FMP_BATCH_WORKERS, len(tickers))) as executor:
+            results = executor.map(
+                lambda ticker: self.fetch_quarterly_data(ticker, use_fmp=use_fmp),
+                tickers
+            )
+            return dict(zip(tickers, results))
+
     def _convert_fmp_to_standard(self, fmp_data: Dict) -> Dict[str, any]:
         """Convert FMP data format to standard format used by signal engine.
 
@@ -109,69 +180,64 @@ class EnhancedFundamentalsFetcher:
             'data_source': 'fmp'
         }
 
-        # Latest quarter
-        latest_income = income[0]
-        prev_income = income[1] if len(income) > 1 else {}
-        latest_balance = balance[0] if len(balance) > 0 else {}
-        prev_balance = balance[1] if len(balance) > 1 else {}
+        # Latest quarter (bound .get methods: one attribute lookup per dict)
+        latest_get = income[0].get
+        prev_get = income[1].get if len(income) > 1 else {}.get
+        yoy_get = income[4].get if len(income) >= 5 else None
+        latest_balance_get = balance[0].get if len(balance) > 0 else {}.get
+        prev_balance_get = balance[1].get if len(balance) > 1 else {}.get
 
         # Revenue
-        revenue = latest_income.get('revenue', 0)
-        prev_revenue = prev_income.get('revenue', 0)
+        revenue = latest_get('revenue', 0)
 
         if revenue:
             result['latest_revenue'] = revenue
+            prev_revenue = prev_get('revenue', 0)
             if prev_revenue:
                 result['revenue_qoq_change'] = ((revenue - prev_revenue) / prev_revenue * 100)
 
         # YoY revenue (4 quarters ago)
-        if len(income) >= 5:
-            yoy_revenue = income[4].get('revenue', 0)
+        if yoy_get is not None:
+            yoy_revenue = yoy_get('revenue', 0)
             if yoy_revenue:
                 result['revenue_yoy_change'] = ((revenue - yoy_revenue) / yoy_revenue * 100)
 
         # EPS
-        eps = latest_income.get('eps', 0)
-        prev_eps = prev_income.get('eps', 0)
+        eps = latest_get('eps', 0)
 
         if eps:
             result['latest_eps'] = eps
-            if prev_eps and prev_eps != 0:
+            prev_eps = prev_get('eps', 0)
+            if prev_eps:
                 result['eps_qoq_change'] = ((eps - prev_eps) / abs(prev_eps) * 100)
 
         # YoY EPS
-        if len(income) >= 5:
-            yoy_eps = income[4].get('eps', 0)
-            if yoy_eps and yoy_eps != 0:
+        if yoy_get is not None:
+            yoy_eps = yoy_get('eps', 0)
+            if yoy_eps:
                 result['eps_yoy_change'] = ((eps - yoy_eps) / abs(yoy_eps) * 100)
 
         # NET MARGIN (not available in yfinance!)
-        net_margin = latest_income.get('netIncomeRatio', 0) * 100
-        prev_net_margin = prev_income.get('netIncomeRatio', 0) * 100
-
+        net_margin = latest_get('netIncomeRatio', 0) * 100
         result['net_margin'] = round(net_margin, 2)
-        result['net_margin_change'] = round(net_margin - prev_net_margin, 2)
+        result['net_margin_change'] = round(net_margin - prev_get('netIncomeRatio', 0) * 100, 2)
 
         # OPERATING MARGIN (not available in yfinance!)
-        operating_margin = latest_income.get('operatingIncomeRatio', 0) * 100
-        result['operating_margin'] = round(operating_margin, 2)
+        result['operating_margin'] = round(latest_get('operatingIncomeRatio', 0) * 100, 2)
 
         # Gross margin
-        gross_margin = latest_income.get('grossProfitRatio', 0) * 100
-        prev_gross_margin = prev_income.get('grossProfitRatio', 0) * 100
-
+        gross_margin = latest_get('grossProfitRatio', 0) * 100
         result['gross_margin'] = round(gross_margin, 2)
-        result['margin_change'] = round(gross_margin - prev_gross_margin, 2)
+        result['margin_change'] = round(gross_margin - prev_get('grossProfitRatio', 0) * 100, 2)
 
         # Inventory (detailed in FMP)
-        inventory = latest_balance.get('inventory', 0)
-        prev_inventory = prev_balance.get('inventory', 0)
+        inventory = latest_balance_get('inventory', 0)
 
         if inventory:
             result['latest_inventory'] = inventory
+            prev_inventory = prev_balance_get('inventory', 0)
             if prev_inventory:
-                inv_change = ((inventory - prev_inventory) / prev_inventory * 100)
-                result['inventory_qoq_change'] = round(inv_change, 2)
+                result['inventory_qoq_change'] = round((inventory - prev_inventory) / prev_inventory * 100, 2)
 
             if revenue:
                 result['inventory_to_sales_ratio'] = round(inventory / revenue, 3)
@@ -202,8 +268,16 @@ class EnhancedFundamentalsFetcher:
         if (quarterly_data.get('data_source') == 'fmp' and
             self.fmp_available and
             self.fmp_fetcher):
-            # Re-fetch FMP data for enhanced snapshot
-            fmp_data = self.fmp_fetcher.fetch_comprehensive_fundamentals(ticker)
+            # Use the raw FMP payload fetch_quarterly_data already paid for;
+            # only tickers this instance never fetched go to cache/network
+            fmp_data = self._fmp_raw.get(ticker)
+            if fmp_data is None:
+                cache_key = FileCache.make_key(ticker, 'fmp_fundamentals', FUNDAMENTALS_TTL)
+                fmp_data = self.cache.get(cache_key, FUNDAMENTALS_TTL)
+                if fmp_data is None and self._reserve_fmp():
+                    fmp_data = self.fmp_fetcher.fetch_comprehensive_fundamentals(ticker)
+                    if fmp_data and fmp_data.get('income_statement'):
+                        self.cache.set(cache_key, fmp_data)
             if fmp_data:
                 return self.fmp_fetcher.create_enhanced_snapshot(ticker, fmp_data)
 
@@ -241,7 +315,8 @@ class EnhancedFundamentalsFetcher:
             'fmp_available': self.fmp_available,
             'fmp_calls_used': self.fmp_call_count,
             'fmp_daily_limit': self.fmp_daily_limit,
-            'fmp_calls_remaining': max(0, self.fmp_daily_limit - self.fmp_call_count)
+            'fmp_calls_remaining': max(0, self.fmp_daily_limit - self.fmp_call_count),
+            'fmp_cache_hits': self.cache.hits
         }
 
         # Add bandwidth stats if FMP is available
@@ -253,5 +328,15 @@ class EnhancedFundamentalsFetcher:
 
     def reset_usage_counter(self):
         """Reset FMP usage counter (call at start of new day)."""
-        self.fmp_call_count = 0
+        with self._fmp_lock:
+            self.fmp_call_count = 0
         logger.info("FMP usage counter reset")
+
+    def clear_cache(self) -> int:
+        """Delete cached FMP responses.
+
+        Returns:
+            Number of entries removed
+        """
+        self._fmp_raw.clear()
+        return self.cache.clear()
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
+import requests
 import yfinance as yf
 
 # Configure logging
@@ -48,7 +49,8 @@ class YahooFinanceFetcher:
         cache_dir: str = "./data/cache",
         cache_expiry_hours: int = 24,
         max_retries: int = 3,
-        retry_delay: int = 2
+        retry_delay: int = 2,
+        session: Optional[requests.Session] = None
     ) -> None:
         """Initialize the YahooFinanceFetcher.
 
@@ -57,12 +59,14 @@ class YahooFinanceFetcher:
             cache_expiry_hours: Hours before cached data expires.
             max_retries: Maximum retry attempts for failed API calls.
             retry_delay: Seconds to wait between retries.
+            session: Optional shared HTTP session for connection reuse.
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_expiry_hours = cache_expiry_hours
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.session = session
         logger.info(f"YahooFinanceFetcher initialized with cache_dir: {cache_dir}")
 
     def _get_cache_path(self, ticker: str, data_type: str) -> Path:
@@ -143,7 +147,7 @@ class YahooFinanceFetcher:
         """
         for attempt in range(self.max_retries):
             try:
-                stock = yf.Ticker(ticker)
+                stock = yf.Ticker(ticker, session=self.session) if self.session else yf.Ticker(ticker)
                 # Test if ticker is valid by accessing info
                 _ = stock.info
                 return stock
@@ -34,12 +34,18 @@ logger = logging.getLogger(__name__)
 class FMPFetcher:
     """Fetch detailed quarterly fundamentals from Financial Modeling Prep."""
 
-    def __init__(self, api_key: Optional[str] = None, cache_dir: str = "./data/cache"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: str = "./data/cache",
+        session: Optional[requests.Session] = None
+    ):
         """Initialize FMP fetcher.
 
         Args:
             api_key: FMP API key (or set FMP_API_KEY env variable)
             cache_dir: Directory for caching responses
+            session: Optional shared HTTP session for connection reuse
         """
         self.api_key = api_key or os.getenv('FMP_API_KEY')
 
@@ -50,6 +56,7 @@ class FMPFetcher:
             )
 
         self.base_url = "https://financialmodelingprep.com/api/v3"
+        self.session = session
         self.cache_dir = Path(cache_dir) / "fmp"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
@@ -140,7 +147,8 @@ class FMPFetcher:
             # Rate limiting - be respectful
             time.sleep(0.1)  # 10 requests/second max
 
-            response = requests.get(url, params=params, timeout=10)
+            http = self.session or requests
+            response = http.get(url, params=params, timeout=10)
             response.raise_for_status()
 
             # Track bandwidth usage
@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Dict, Optional
 
 import pandas as pd
+import requests
 import yfinance as yf
 
 logging.basicConfig(
@@ -30,14 +31,20 @@ logger = logging.getLogger(__name__)
 class GitStorageFetcher:
     """Fetcher with Git-based fundamental storage and fresh price data."""
 
-    def __init__(self, fundamentals_dir: str = "./data/fundamentals_cache"):
+    def __init__(
+        self,
+        fundamentals_dir: str = "./data/fundamentals_cache",
+        session: Optional[requests.Session] = None
+    ):
         """Initialize fetcher.
 
         Args:
             fundamentals_dir: Directory for fundamental storage (tracked in Git)
+            session: Optional shared HTTP session for connection reuse
         """
         self.fundamentals_dir = Path(fundamentals_dir)
         self.fundamentals_dir.mkdir(parents=True, exist_ok=True)
+        self.session = session
 
         self.metadata_file = self.fundamentals_dir / "metadata.json"
         logger.info(f"GitStorageFetcher initialized: {fundamentals_dir}")
@@ -54,7 +61,7 @@ class GitStorageFetcher:
             DataFrame with ~250 days of price data (DatetimeIndex)
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = yf.Ticker(ticker, session=self.session)
             # Always fetch 1 year (250 trading days) - not 2 years!
             data = stock.history(period='1y', interval='1d')
 
@@ -0,0 +1,51 @@
+"""Shared HTTP session factory for yfinance and FMP requests.
+
+Worker threads that each open their own connection pay a TCP + TLS handshake
+per ticker. A single pooled session keeps connections alive so every worker
+reuses them instead.
+"""
+
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+def create_pooled_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 32,
+    total_retries: int = 3,
+    backoff_factor: float = 0.5
+) -> requests.Session:
+    """Create a requests.Session with a keep-alive connection pool.
+
+    Args:
+        pool_connections: Number of host pools to cache (usually worker count)
+        pool_maxsize: Max connections kept alive per host
+        total_retries: Retries for connection errors and 5xx responses
+        backoff_factor: Exponential backoff factor between retries
+
+    Returns:
+        Session with the pooled adapter mounted for http and https
+    """
+    retry = Retry(
+        total=total_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD'])
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    logger.debug(f"HTTP session pool: {pool_connections} hosts x {pool_maxsize} connections")
+    return session
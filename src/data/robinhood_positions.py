@@ -8,11 +8,18 @@ It does NOT:
 - Modify any positions
 - Access buying power or cash
 
-Authentication: Uses robin_stocks library with MFA support.
+Authentication: Uses robin_stocks library with MFA support. The OAuth token
+(never the password) is cached in ~/.cache/robinhood_session.json so repeat
+runs can skip the login + MFA round-trip while the token is valid.
 """
 
 import os
+import sys
+import json
+import time
+import select
 import logging
+from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
@@ -24,6 +31,33 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Cached OAuth token (never the password) so repeat runs skip login + MFA
+DEFAULT_SESSION_PATH = Path.home() / ".cache" / "robinhood_session.json"
+
+
+def _prompt_with_timeout(prompt: str, timeout: Optional[float]) -> Optional[str]:
+    """Read a line from stdin, giving up after timeout seconds.
+
+    Falls back to a plain blocking input() where stdin can't be polled
+    (e.g. Windows consoles).
+
+    Args:
+        prompt: Prompt text
+        timeout: Seconds to wait, or None to wait forever
+
+    Returns:
+        Stripped input, or None on timeout
+    """
+    if timeout is None or not hasattr(select, 'poll') or not sys.stdin.isatty():
+        return input(prompt).strip()
+
+    print(prompt, end='', flush=True)
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    if not ready:
+        print()
+        return None
+    return sys.stdin.readline().strip()
+
 
 class RobinhoodPositionFetcher:
     """Fetch current stock positions from Robinhood (read-only)."""
@@ -43,6 +77,7 @@ class RobinhoodPositionFetcher:
 
         self.username = os.getenv('ROBINHOOD_USERNAME')
         self.logged_in = False
+        self.session_path = DEFAULT_SESSION_PATH
 
         if not self.username:
             raise ValueError(
@@ -50,12 +85,93 @@ class RobinhoodPositionFetcher:
                 "Set with: export ROBINHOOD_USERNAME='your_email@example.com'"
             )
 
-    def login(self, password: Optional[str] = None, mfa_code: Optional[str] = None) -> bool:
+    def restore_session(self, session_path: Optional[Path] = None) -> bool:
+        """Reuse a cached OAuth token instead of logging in again.
+
+        The token is checked with one read-only positions request; an
+        expired or revoked token (401) returns False so the caller can fall
+        back to a full login.
+
+        Args:
+            session_path: Token cache file (default ~/.cache/robinhood_session.json)
+
+        Returns:
+            True if the cached session is valid and now active
+        """
+        path = Path(session_path or self.session_path)
+        if not path.exists():
+            return False
+
+        try:
+            with open(path, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Unreadable Robinhood session cache: {e}")
+            return False
+
+        if not (isinstance(cached, dict)
+                and isinstance(cached.get('token_type'), str)
+                and isinstance(cached.get('access_token'), str)
+                and isinstance(cached.get('expires_at', 0), (int, float))):
+            logger.debug("Malformed Robinhood session cache - full login required")
+            return False
+
+        if cached.get('username') != self.username or cached.get('expires_at', 0) <= time.time():
+            logger.info("Cached Robinhood session expired")
+            return False
+
+        rh.update_session('Authorization', f"{cached['token_type']} {cached['access_token']}")
+        rh.helper.set_login_state(True)
+
+        try:
+            res = rh.request_get(rh.urls.positions_url(), 'pagination', {'nonzero': 'true'}, jsonify_data=False)
+            res.raise_for_status()
+        except Exception as e:
+            logger.info(f"Cached Robinhood session rejected ({e}) - full login required")
+            rh.helper.set_login_state(False)
+            rh.update_session('Authorization', None)
+            return False
+
+        self.logged_in = True
+        logger.info("✓ Robinhood session restored from cache (no login/MFA needed)")
+        return True
+
+    def _save_session(self, login_result: Dict) -> None:
+        """Persist the OAuth token from a successful login (owner-only file)."""
+        if not isinstance(login_result, dict) or 'access_token' not in login_result:
+            return
+
+        try:
+            self.session_path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {
+                'username': self.username,
+                'token_type': login_result.get('token_type', 'Bearer'),
+                'access_token': login_result['access_token'],
+                'expires_at': time.time() + float(login_result.get('expires_in', 86400))
+            }
+            # A fresh temp file (O_EXCL) always gets mode 0o600, even when an
+            # older session file was created with wider permissions
+            tmp_path = self.session_path.with_name(self.session_path.name + '.tmp')
+            tmp_path.unlink(missing_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self.session_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not cache Robinhood session: {e}")
+
+    def login(
+        self,
+        password: Optional[str] = None,
+        mfa_code: Optional[str] = None,
+        mfa_timeout: Optional[float] = 120
+    ) -> bool:
         """Login to Robinhood with interactive password and SMS MFA.
 
         Args:
             password: Password (will prompt if not provided)
             mfa_code: SMS MFA code (will prompt if needed)
+            mfa_timeout: Seconds to wait for the SMS code (None = wait forever)
 
         Returns:
             True if login successful
@@ -74,6 +190,7 @@ class RobinhoodPositionFetcher:
 
                 if login_result:
                     self.logged_in = True
+                    self._save_session(login_result)
                     logger.info("✓ Robinhood login successful (no MFA required)")
                     return True
 
@@ -86,7 +203,10 @@ class RobinhoodPositionFetcher:
 
                     # Prompt for SMS code if not provided
                     if not mfa_code:
-                        mfa_code = input("Enter SMS code from Robinhood: ").strip()
+                        mfa_code = _prompt_with_timeout("Enter SMS code from Robinhood: ", mfa_timeout)
+                        if not mfa_code:
+                            logger.error("✗ No MFA code entered")
+                            return False
 
                     # Try login with MFA
                     login_result = rh.login(
@@ -98,6 +218,7 @@ class RobinhoodPositionFetcher:
 
                     if login_result:
                         self.logged_in = True
+                        self._save_session(login_result)
                         logger.info("✓ Robinhood login successful with SMS MFA")
                         return True
                 else:
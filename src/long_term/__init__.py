@@ -10,6 +10,7 @@ Modules:
 - compounder_engine: Multi-year quality scoring
 - regime_classifier: Long-cycle regime classification
 - moat_scoring: Quantifiable business moat proxies
+- score_cache: Persistent memo of scores keyed by their inputs
 """
 
 __version__ = "1.0.0"
@@ -19,4 +20,5 @@ __all__ = [
     "compounder_engine",
     "regime_classifier",
     "moat_scoring",
+    "score_cache",
 ]
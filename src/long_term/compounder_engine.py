@@ -13,8 +13,120 @@ import logging
 from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
+from ..jit import njit
+
 logger = logging.getLogger(__name__)
 
+# Regime codes returned by _score_arrays
+REGIME_NAMES = ("STRUCTURAL_GROWTH", "MATURE_HOLD", "CAPITAL_DESTRUCTION")
+
+
+@njit(cache=True)
+def _scale(value: float, min_val: float, max_val: float, min_score: float, max_score: float) -> float:
+    """MetricsCalculator.scale_linear for min_val != max_val, no invert."""
+    normalized = (value - min_val) / (max_val - min_val)
+    normalized = max(min(normalized, 1.0), 0.0)
+    return min_score + (normalized * (max_score - min_score))
+
+
+@njit(cache=True)
+def _score_arrays(fund: np.ndarray, price: np.ndarray, scores: np.ndarray, regime: np.ndarray) -> None:
+    """Score every row with the CompounderEngine.score_stock rules.
+
+    Args:
+        fund: (N, 9) float64 columns in _FUND_COLUMNS order
+        price: (N, 9) float64 columns in _PRICE_COLUMNS order
+        scores: (N, 4) output: fundamental, rs_persistence, trend_durability, total
+        regime: (N,) int8 output: index into REGIME_NAMES
+    """
+    for i in range(fund.shape[0]):
+        # Fundamental dominance (60 points)
+        growth_quality = (
+            _scale(fund[i, 0], 0.0, 0.15, 0.0, 8.0) +
+            _scale(fund[i, 1], 0.0, 0.15, 0.0, 7.0) +
+            _scale(fund[i, 2], 0.0, 0.20, 0.0, 5.0)
+        )
+        capital_efficiency = (
+            _scale(fund[i, 3], 0.10, 0.25, 0.0, 10.0) +
+            _scale(fund[i, 4], 0.0, 0.15, 0.0, 5.0) +
+            _scale(fund[i, 5], 0.0, 0.20, 0.0, 5.0)
+        )
+        balance_sheet = (
+            max(0, _scale(fund[i, 6], 3.0, 1.0, 0.0, 5.0)) +
+            _scale(fund[i, 7], 3.0, 10.0, 0.0, 3.0) +
+            1.0
+        )
+        fundamental_score = min(60.0, growth_quality + capital_efficiency + 5.0 + balance_sheet)
+
+        # RS persistence (25 points)
+        rs_3yr_score = _scale(price[i, 1], -0.05, 0.15, 0.0, 10.0)
+        rs_persistence_score = (
+            _scale(price[i, 0], -0.10, 0.20, 0.0, 8.0) +
+            rs_3yr_score +
+            _scale(price[i, 2], -0.03, 0.12, 0.0, 7.0) +
+            _scale(price[i, 3] - price[i, 4], -0.20, 0.0, -5.0, 0.0)
+        )
+        rs_persistence_score = max(0, min(25.0, rs_persistence_score))
+
+        # Trend durability (15 points)
+        current_price = price[i, 5]
+        price_40w_ma = price[i, 6]
+        trend_strength = 0.0
+        if price_40w_ma > 0:
+            trend_strength = _scale((current_price - price_40w_ma) / price_40w_ma, 0.0, 0.20, 0.0, 5.0)
+        trend_durability_score = min(
+            15.0,
+            trend_strength +
+            _scale(price[i, 7], 0.0, 0.15, 0.0, 5.0) +
+            _scale(price[i, 8], 12.0, 36.0, 0.0, 5.0)
+        )
+
+        scores[i, 0] = fundamental_score
+        scores[i, 1] = rs_persistence_score
+        scores[i, 2] = trend_durability_score
+        scores[i, 3] = fundamental_score + rs_persistence_score + trend_durability_score + 0.0
+
+        # Regime (same conditions as _classify_regime)
+        growth_votes = (
+            int(current_price > price_40w_ma) + int(rs_3yr_score > 5.0) + int(fund[i, 0] > 0)
+        )
+        destruction_votes = (
+            int(current_price < price_40w_ma) + int(rs_3yr_score < 0.0) + int(fund[i, 8] > 4.0)
+        )
+        if growth_votes >= 2:
+            regime[i] = 0
+        elif destruction_votes >= 2:
+            regime[i] = 2
+        else:
+            regime[i] = 1
+
+
+# Column layouts for _score_arrays: (key, default when missing)
+_FUND_COLUMNS = (
+    ("revenue_cagr_3yr", 0.0),
+    ("revenue_cagr_5yr", 0.0),
+    ("eps_cagr_3yr", 0.0),
+    ("roic", 0.0),
+    ("roic_wacc_spread", 0.0),
+    ("fcf_margin", 0.0),
+    ("debt_to_ebitda", 5.0),
+    ("interest_coverage", 3.0),
+    ("debt_to_ebitda", 0.0),  # regime check uses a different default
+)
+_PRICE_COLUMNS = (
+    ("returns_1yr", 0.0),
+    ("returns_3yr", 0.0),
+    ("returns_5yr", 0.0),
+    ("max_drawdown_3yr", 0.0),
+    ("spy_max_drawdown_3yr", -0.15),
+    ("current_price", 0.0),
+    ("price_40w_ma", 0.0),
+    ("ma_slope_40w", 0.0),
+    ("months_uptrend", 12.0),
+)
+
 
 @dataclass
 class CompounderScore:
@@ -156,6 +268,52 @@ class CompounderEngine:
             logger.error(f"Error scoring {ticker}: {e}")
             return None
 
+    def score_stocks_batch(
+        self,
+        fundamentals: Dict[str, np.ndarray],
+        price_data: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Score many stocks at once from column arrays (one entry per stock).
+
+        Applies the same rules as score_stock in one compiled loop over all
+        stocks (see _score_arrays) instead of a per-ticker call. Keys
+        missing from the inputs take the same defaults as score_stock.
+        Thesis drivers and the detailed breakdown are not produced.
+
+        Args:
+            fundamentals: Column arrays keyed like score_stock's fundamentals dict
+            price_data: Column arrays keyed like score_stock's price_data dict
+
+        Returns:
+            Dict of arrays: valid (passes price filter), total_score, regime,
+            fundamental_score, rs_persistence_score, trend_durability_score,
+            moat_bonus. Scores for invalid rows are meaningless.
+        """
+        n = len(next(iter(price_data.values()))) if price_data else 0
+
+        def pack(data: Dict[str, np.ndarray], columns) -> np.ndarray:
+            block = np.empty((n, len(columns)), dtype=np.float64)
+            for j, (key, default) in enumerate(columns):
+                block[:, j] = data[key] if key in data else default
+            return block
+
+        prices = pack(price_data, _PRICE_COLUMNS)
+        scores = np.empty((n, 4), dtype=np.float64)
+        regime = np.empty(n, dtype=np.int8)
+        _score_arrays(pack(fundamentals, _FUND_COLUMNS), prices, scores, regime)
+
+        current_price = prices[:, 5]
+        return {
+            "valid": (current_price >= self.min_price) & (current_price <= self.max_price),
+            "total_score": scores[:, 3],
+            "regime": np.array(REGIME_NAMES)[regime],
+            "fundamental_score": scores[:, 0],
+            "rs_persistence_score": scores[:, 1],
+            "trend_durability_score": scores[:, 2],
+            "moat_bonus": np.zeros(n),
+        }
+
     def _score_fundamentals(
         self,
         score: CompounderScore,
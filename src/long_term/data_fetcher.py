@@ -6,14 +6,91 @@ for ROIC, WACC, growth metrics, and capital efficiency analysis.
 """
 
 import os
-import json
 import logging
-from datetime import datetime, timedelta
+import pickle
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Optional, Dict, List, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+
+import numpy as np
+import requests
+
+from ..jit import njit
+from ..json_io import load_file
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# zstd frame magic number (lets compressed and plain pickle cache files coexist)
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+ZSTD_LEVEL = 3
+
+# Statement fields kept from FMP responses (the ones _calculate_metrics reads,
+# plus the period date); FMP returns dozens more per quarter
+INCOME_STATEMENT_FIELDS = (
+    "date", "revenue", "netIncome", "grossProfitRatio", "interestExpense",
+    "incomeTaxExpense", "depreciationAndAmortization",
+)
+BALANCE_SHEET_FIELDS = ("date", "shortTermDebt", "longTermDebt")
+CASH_FLOW_FIELDS = ("date", "freeCashFlow")
+
+
+def _project(statements: List[Dict[str, Any]], fields: tuple) -> List[Dict[str, Any]]:
+    """Copy statements keeping only the given fields (absent fields stay absent)."""
+    return [{k: s[k] for k in fields if k in s} for s in statements]
+
+# Upper bound on simultaneous network fetches across all fetch_many workers
+# (keeps bursts under the FMP per-second limit)
+MAX_CONCURRENT_FETCHES = int(os.getenv('LONG_TERM_MAX_CONCURRENT_FETCHES', '8'))
+
+
+@njit(cache=True)
+def _growth_metrics(revenues: np.ndarray, gross_margins: np.ndarray):
+    """Revenue CAGRs and gross margin trend from oldest-first series.
+
+    Args:
+        revenues: Positive revenues
+        gross_margins: Non-zero gross margin ratios
+
+    Returns:
+        (revenue_cagr_3yr, revenue_cagr_5yr, gross_margin_trend), NaN where
+        there are too few points (4 for the 3yr CAGR and trend, 5 for 5yr)
+    """
+    cagr_3yr = np.nan
+    cagr_5yr = np.nan
+    if revenues.shape[0] >= 4:
+        # MetricsCalculator.calculate_cagr (4 data points = 3 years)
+        cagr_3yr = max((revenues[3] / revenues[0]) ** (1 / 3) - 1, -0.99)
+    if revenues.shape[0] >= 5:
+        cagr_5yr = max((revenues[4] / revenues[0]) ** (1 / 5) - 1, -0.99)
+
+    # MetricsCalculator.calculate_net_margin_trend over the last 12 points
+    trend = np.nan
+    n = min(12, gross_margins.shape[0])
+    if n >= 4:
+        start = gross_margins.shape[0] - n
+        sum_x = 0.0
+        sum_y = 0.0
+        sum_xy = 0.0
+        sum_x2 = 0.0
+        for i in range(n):
+            y = gross_margins[start + i]
+            sum_x += i
+            sum_y += y
+            sum_xy += i * y
+            sum_x2 += i * i
+        trend = ((n * sum_xy) - (sum_x * sum_y)) / ((n * sum_x2) - (sum_x * sum_x))
+    return cagr_3yr, cagr_5yr, trend
+
 
 @dataclass
 class LongTermFundamentals:
@@ -42,6 +119,10 @@ class LongTermFundamentals:
     fetched_at: str = ""
     data_quality_score: float = 0.0  # 0-100
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Field dict for caching (statements are shared, not deep-copied like asdict)."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
 
 class LongTermFundamentalsFetcher:
     """
@@ -54,7 +135,8 @@ class LongTermFundamentalsFetcher:
     def __init__(
         self,
         cache_dir: str = "data/long_term_fundamentals",
-        cache_expiry_days: int = 90
+        cache_expiry_days: int = 90,
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize fetcher.
@@ -62,22 +144,37 @@ class LongTermFundamentalsFetcher:
         Args:
             cache_dir: Directory to cache fundamental data
             cache_expiry_days: Days before cache expires (default 90)
+            session: Optional shared HTTP session for FMP requests (a pooled
+                keep-alive session is created if omitted)
         """
         # Only initialize FMP if API key exists - avoid wasting time on failed calls
         fmp_api_key = os.getenv('FMP_API_KEY')
         if fmp_api_key:
             from src.data.fmp_fetcher import FMPFetcher
-            self.fmp = FMPFetcher()  # Uses FMP_API_KEY env var
+            from src.data.http_session import create_pooled_session
+            # Uses FMP_API_KEY env var; one session so fetch_many workers reuse connections
+            self.fmp = FMPFetcher(session=session or create_pooled_session())
         else:
             self.fmp = None
             logger.info("FMP API key not found - will use yfinance for all fundamentals")
 
         self.cache_dir = cache_dir
         self.cache_expiry_days = cache_expiry_days
+        self._expiry_seconds = cache_expiry_days * 86400.0
 
         # Create cache directory if needed
         os.makedirs(cache_dir, exist_ok=True)
 
+        # Cache mtimes read once up front; freshness is then a dict lookup
+        # and a float compare instead of stat calls per ticker
+        self._mtime_index = self._scan_cache()
+        self._expiry_cutoff = time.time() - self._expiry_seconds
+
+        self._fetch_slots = threading.Semaphore(MAX_CONCURRENT_FETCHES)
+
+        # zstd (de)compressor objects are not thread-safe: one per thread
+        self._zstd_local = threading.local()
+
     def fetch(
         self,
         ticker: str,
@@ -114,9 +211,15 @@ class LongTermFundamentalsFetcher:
                 return self._fetch_from_yfinance(ticker)
 
             # Extract and organize data (note: keys are singular, not plural)
-            income_statements = fundamentals_data.get("income_statement", [])
-            balance_sheets = fundamentals_data.get("balance_sheet", [])
-            cash_flows = fundamentals_data.get("cash_flow", [])
+            income_statements = _project(
+                fundamentals_data.get("income_statement") or [], INCOME_STATEMENT_FIELDS
+            )
+            balance_sheets = _project(
+                fundamentals_data.get("balance_sheet") or [], BALANCE_SHEET_FIELDS
+            )
+            cash_flows = _project(
+                fundamentals_data.get("cash_flow") or [], CASH_FLOW_FIELDS
+            )
 
             if not income_statements or not balance_sheets or not cash_flows:
                 logger.debug(f"Incomplete FMP data for {ticker}, using yfinance fundamentals")
@@ -147,6 +250,56 @@ class LongTermFundamentalsFetcher:
             logger.warning(f"Error fetching from FMP for {ticker}: {e}, trying yfinance")
             return self._fetch_from_yfinance(ticker)
 
+    def fetch_many(
+        self,
+        tickers: List[str],
+        max_workers: int = 16
+    ) -> Dict[str, Optional[LongTermFundamentals]]:
+        """
+        Fetch fundamentals for many tickers concurrently.
+
+        Fresh cache entries are read directly; the remaining tickers are
+        fetched on a thread pool, with at most MAX_CONCURRENT_FETCHES network
+        fetches in flight at once.
+
+        Args:
+            tickers: Stock tickers (duplicates are fetched once)
+            max_workers: Thread pool size
+
+        Returns:
+            Dict mapping ticker to LongTermFundamentals (None if fetch failed)
+        """
+        results: Dict[str, Optional[LongTermFundamentals]] = {}
+        to_fetch = []
+
+        self._expiry_cutoff = time.time() - self._expiry_seconds
+
+        for ticker in dict.fromkeys(tickers):
+            cached = self._load_from_cache(ticker)
+            if cached:
+                results[ticker] = cached
+            else:
+                to_fetch.append(ticker)
+
+        if not to_fetch:
+            return results
+
+        logger.info(f"Fetching long-term fundamentals for {len(to_fetch)} tickers "
+                    f"({len(results)} cached)")
+
+        def fetch_one(ticker: str) -> Optional[LongTermFundamentals]:
+            with self._fetch_slots:
+                try:
+                    return self.fetch(ticker, force_refresh=True)
+                except Exception as e:
+                    logger.warning(f"Error fetching {ticker}: {e}")
+                    return None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(to_fetch)))) as executor:
+            results.update(zip(to_fetch, executor.map(fetch_one, to_fetch)))
+
+        return results
+
     def _fetch_from_yfinance(self, ticker: str) -> Optional[LongTermFundamentals]:
         """
         Fetch fundamentals from yfinance using quarterly historical data.
@@ -324,69 +477,53 @@ class LongTermFundamentalsFetcher:
 
         Populates ROIC, WACC, growth rates, and other metrics.
         """
-        from .metrics import MetricsCalculator
-
         try:
-            # Extract historical values (sorted oldest to newest)
-            revenues = [
-                s.get("revenue", 0) for s in fundamentals.income_statements
-                if s.get("revenue") and s.get("revenue") > 0
-            ]
-            net_incomes = [
-                s.get("netIncome", 0) for s in fundamentals.income_statements
-                if s.get("netIncome")
-            ]
-            gross_margins = [
-                s.get("grossProfitRatio", 0) for s in fundamentals.income_statements
-                if s.get("grossProfitRatio")
-            ]
+            # Extract historical values (sorted oldest to newest) in one pass
+            # over the statements; missing/None values become 0 and are
+            # masked out below
+            series = np.array(
+                [(s.get("revenue") or 0.0, s.get("grossProfitRatio") or 0.0)
+                 for s in fundamentals.income_statements],
+                dtype=np.float64
+            ).reshape(-1, 2)
+            revenues = series[:, 0][series[:, 0] > 0]
+            gross_margins = series[:, 1][series[:, 1] != 0]
+
+            cagr_3yr, cagr_5yr, trend = _growth_metrics(revenues, gross_margins)
 
             # Calculate CAGR metrics
             if len(revenues) >= 4:
-                # 3-year CAGR (4 data points = 3 years)
-                fundamentals.revenue_cagr_3yr = MetricsCalculator.calculate_cagr(
-                    revenues[0], revenues[3], 3
-                )
+                fundamentals.revenue_cagr_3yr = float(cagr_3yr)
 
             if len(revenues) >= 5:
-                # 5-year CAGR
-                fundamentals.revenue_cagr_5yr = MetricsCalculator.calculate_cagr(
-                    revenues[0], revenues[4], 5
-                )
+                fundamentals.revenue_cagr_5yr = float(cagr_5yr)
 
             # Calculate FCF margin (most recent)
-            if revenues and fundamentals.cash_flows:
+            if len(revenues) and fundamentals.cash_flows:
                 fcf = fundamentals.cash_flows[0].get("freeCashFlow", 0)
-                if revenues[-1] > 0:
-                    fundamentals.fcf_margin_3yr = fcf / revenues[-1]
+                fundamentals.fcf_margin_3yr = fcf / float(revenues[-1])
 
             # Calculate gross margin trend
             if len(gross_margins) >= 4:
-                fundamentals.gross_margin_trend = (
-                    MetricsCalculator.calculate_net_margin_trend(
-                        gross_margins, min(12, len(gross_margins))
-                    )
-                )
+                fundamentals.gross_margin_trend = float(trend)
 
             # Extract debt/equity metrics
             if fundamentals.balance_sheets and fundamentals.income_statements:
-                bs = fundamentals.balance_sheets[0]
-                is_stmt = fundamentals.income_statements[0]
+                # Missing fields read as 0.0
+                bs = defaultdict(float, fundamentals.balance_sheets[0])
+                is_stmt = defaultdict(float, fundamentals.income_statements[0])
 
-                total_debt = (
-                    bs.get("shortTermDebt", 0) + bs.get("longTermDebt", 0)
-                )
+                total_debt = bs["shortTermDebt"] + bs["longTermDebt"]
 
                 # Calculate EBITDA
+                interest_expense = is_stmt["interestExpense"]
                 ebitda = (
-                    is_stmt.get("netIncome", 0) +
-                    is_stmt.get("interestExpense", 0) +
-                    is_stmt.get("incomeTaxExpense", 0) +
-                    is_stmt.get("depreciationAndAmortization", 0)
+                    is_stmt["netIncome"] +
+                    interest_expense +
+                    is_stmt["incomeTaxExpense"] +
+                    is_stmt["depreciationAndAmortization"]
                 )
 
-                interest_expense = is_stmt.get("interestExpense", 0)
-
                 if ebitda > 0:
                     fundamentals.debt_to_ebitda = total_debt / ebitda
 
@@ -408,26 +545,66 @@ class LongTermFundamentalsFetcher:
             logger.error(f"Error calculating metrics for {fundamentals.ticker}: {e}")
             fundamentals.data_quality_score = 50.0
 
+    def _cache_path(self, ticker: str, suffix: str = ".pkl") -> str:
+        """Cache file location for a ticker (.json for the legacy format)."""
+        return os.path.join(self.cache_dir, f"{ticker}_fundamentals{suffix}")
+
+    def _scan_cache(self) -> Dict[str, float]:
+        """Map ticker -> mtime for every pickle cache file (one directory scan)."""
+        suffix = "_fundamentals.pkl"
+        index = {}
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(suffix):
+                        index[entry.name[:-len(suffix)]] = entry.stat().st_mtime
+        except OSError as e:
+            logger.debug(f"Could not scan cache directory {self.cache_dir}: {e}")
+        return index
+
+    def _is_fresh(self, cache_file: str) -> bool:
+        """True if the cache file is younger than cache_expiry_days."""
+        return os.path.getmtime(cache_file) >= self._expiry_cutoff
+
+    def _cache_mtime(self, ticker: str) -> Optional[float]:
+        """Pickle cache file mtime for ticker, or None if there is no file.
+
+        Served from the index built in __init__; tickers missing from it
+        (e.g. written by another process since) fall back to one stat call.
+        """
+        mtime = self._mtime_index.get(ticker)
+        if mtime is None:
+            try:
+                mtime = os.stat(self._cache_path(ticker)).st_mtime
+            except OSError:
+                return None
+            self._mtime_index[ticker] = mtime
+        return mtime
+
+    def _cache_fresh(self, ticker: str) -> bool:
+        """True if a fresh cache entry exists for ticker."""
+        mtime = self._cache_mtime(ticker)
+        return mtime is not None and mtime >= self._expiry_cutoff
+
     def _load_from_cache(self, ticker: str) -> Optional[LongTermFundamentals]:
         """Load fundamentals from cache if fresh."""
-        cache_file = os.path.join(self.cache_dir, f"{ticker}_fundamentals.json")
+        if self._cache_mtime(ticker) is None:
+            return self._migrate_json_cache(ticker)
 
-        if not os.path.exists(cache_file):
+        # Check cache age
+        if not self._cache_fresh(ticker):
+            logger.debug(f"Cache expired for {ticker}")
             return None
 
-        try:
-            # Check cache age
-            file_age = datetime.utcnow() - datetime.fromtimestamp(
-                os.path.getmtime(cache_file)
-            )
-
-            if file_age > timedelta(days=self.cache_expiry_days):
-                logger.debug(f"Cache expired for {ticker}")
-                return None
+        cache_file = self._cache_path(ticker)
 
+        try:
             # Load from cache
-            with open(cache_file, "r") as f:
-                data = json.load(f)
+            with open(cache_file, "rb") as f:
+                payload = f.read()
+            if payload.startswith(ZSTD_MAGIC):
+                payload = self._zstd().decompressor.decompress(payload)
+            data = pickle.loads(payload)
 
             logger.debug(f"Loaded {ticker} from cache")
 
@@ -437,16 +614,59 @@ class LongTermFundamentalsFetcher:
             logger.debug(f"Error loading cache for {ticker}: {e}")
             return None
 
+    def _migrate_json_cache(self, ticker: str) -> Optional[LongTermFundamentals]:
+        """Convert a fresh legacy JSON cache file to pickle (keeping its age)."""
+        legacy_file = self._cache_path(ticker, ".json")
+
+        if not os.path.exists(legacy_file):
+            return None
+
+        try:
+            if not self._is_fresh(legacy_file):
+                return None
+
+            fundamentals = self._dict_to_fundamentals(load_file(legacy_file))
+            if fundamentals is None:
+                return None
+
+            mtime = os.path.getmtime(legacy_file)
+            self._save_to_cache(fundamentals)
+            os.utime(self._cache_path(ticker), (mtime, mtime))
+            self._mtime_index[ticker] = mtime
+            os.remove(legacy_file)
+
+            logger.debug(f"Migrated {ticker} cache from JSON to pickle")
+
+            return fundamentals
+
+        except Exception as e:
+            logger.debug(f"Error migrating JSON cache for {ticker}: {e}")
+            return None
+
+    def _zstd(self):
+        """Per-thread zstd compressor/decompressor (created on first use)."""
+        local = self._zstd_local
+        if not hasattr(local, "compressor"):
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("cache file is zstd-compressed but zstandard is not installed")
+            local.compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+            local.decompressor = zstandard.ZstdDecompressor()
+        return local
+
     def _save_to_cache(self, fundamentals: LongTermFundamentals) -> None:
-        """Save fundamentals to cache."""
-        cache_file = os.path.join(
-            self.cache_dir,
-            f"{fundamentals.ticker}_fundamentals.json"
-        )
+        """Save fundamentals to cache (atomic pickle write, zstd if available)."""
+        cache_file = self._cache_path(fundamentals.ticker)
 
         try:
-            with open(cache_file, "w") as f:
-                json.dump(asdict(fundamentals), f, indent=2)
+            payload = pickle.dumps(fundamentals.to_dict(), protocol=pickle.HIGHEST_PROTOCOL)
+            if ZSTD_AVAILABLE:
+                payload = self._zstd().compressor.compress(payload)
+
+            tmp_file = f"{cache_file}.tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_file, cache_file)
+            self._mtime_index[fundamentals.ticker] = time.time()
 
             logger.debug(f"Cached {fundamentals.ticker}")
 
@@ -14,9 +14,22 @@ import logging
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
+import numpy as np
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
+def _cap(values: np.ndarray, limit: float) -> np.ndarray:
+    """Elementwise min(limit, value) with the builtin's NaN handling (NaN -> limit)."""
+    return np.where(values < limit, values, limit)
+
+
+def _floor(values: np.ndarray, floor: float) -> np.ndarray:
+    """Elementwise max(floor, value) with the builtin's NaN handling (NaN -> floor)."""
+    return np.where(values > floor, values, floor)
+
+
 @dataclass
 class ETFScore:
     """Container for ETF scoring results."""
@@ -147,6 +160,83 @@ class ETFEngine:
             logger.error(f"Error scoring {etf_metadata.get('ticker', 'unknown')}: {e}")
             return None
 
+    def score_etfs_batch(
+        self,
+        etfs: pd.DataFrame,
+        price_data: Optional[Dict[str, Any]] = None
+    ) -> pd.DataFrame:
+        """
+        Score many ETFs at once from a column-per-field table.
+
+        Applies the same rules as score_etf with one array expression per
+        component; caps and floors treat NaN like score_etf's builtin
+        min/max do. Thesis drivers and the detailed breakdown are not produced.
+
+        Args:
+            etfs: ETF metadata, one row per ETF (see ETFUniverse.get_etfs_by_theme_df)
+            price_data: Returns keyed like score_etf's price_data; each value
+                is either a scalar (shared by all rows) or one value per row
+
+        Returns:
+            DataFrame indexed by ticker with total_score, theme_purity_score,
+            rs_persistence_score, efficiency_score and tailwind_score
+        """
+        from .metrics import MetricsCalculator
+        scale = MetricsCalculator.scale_linear_array
+
+        n = len(etfs)
+
+        def col(key: str, default: float) -> np.ndarray:
+            if key in etfs:
+                return etfs[key].to_numpy(dtype=np.float64)
+            return np.full(n, default, dtype=np.float64)
+
+        # Theme purity (30 points)
+        theme_purity_score = _cap(
+            scale(col("top_10_concentration", 0), 0.30, 0.70, 0.0, 15.0) +
+            scale(col("sector_concentration", 0), 0.70, 0.95, 0.0, 15.0),
+            30.0
+        )
+
+        # RS persistence (40 points)
+        if price_data:
+            def returns(key: str) -> np.ndarray:
+                return np.broadcast_to(np.asarray(price_data.get(key, 0.0), dtype=np.float64), (n,))
+
+            rs_persistence_score = _floor(_cap(
+                scale(returns("return_1yr") - returns("spy_return_1yr"), -0.10, 0.20, 0.0, 12.0) +
+                scale(returns("return_3yr") - returns("spy_return_3yr"), -0.05, 0.15, 0.0, 16.0) +
+                scale(returns("return_5yr") - returns("spy_return_5yr"), -0.03, 0.12, 0.0, 12.0),
+                40.0
+            ), 0)
+        else:
+            rs_persistence_score = np.zeros(n)
+
+        # Efficiency (20 points)
+        efficiency_score = _cap(
+            _floor(scale(col("expense_ratio", 0.5), 0.0075, 0.0005, 0.0, 10.0), 0) +
+            _floor(_cap(scale(col("turnover", 50), 2.0, 0.20, 0.0, 10.0), 10.0), 0),
+            20.0
+        )
+
+        # Structural tailwind (10 points), looked up once per theme
+        theme_ids = etfs["theme_id"] if "theme_id" in etfs else pd.Series([""] * n, index=etfs.index)
+        tailwinds = {theme_id: self._tailwind(theme_id) for theme_id in theme_ids.unique()}
+        tailwind_score = theme_ids.map(tailwinds).to_numpy(dtype=np.float64)
+
+        total_score = theme_purity_score + rs_persistence_score + efficiency_score + tailwind_score
+
+        return pd.DataFrame(
+            {
+                "total_score": total_score,
+                "theme_purity_score": theme_purity_score,
+                "rs_persistence_score": rs_persistence_score,
+                "efficiency_score": efficiency_score,
+                "tailwind_score": tailwind_score,
+            },
+            index=etfs["ticker"] if "ticker" in etfs else None,
+        )
+
     def _score_theme_purity(
         self,
         score: ETFScore,
@@ -260,13 +350,15 @@ class ETFEngine:
         etf_metadata: Dict[str, Any]
     ) -> None:
         """Score structural tailwind (10 points max)."""
+        score.tailwind_score = self._tailwind(etf_metadata.get("theme_id", ""))
+
+    def _tailwind(self, theme_id: str) -> float:
+        """Tailwind points for a theme (10 max)."""
         if self.universe:
-            theme_id = etf_metadata.get("theme_id", "")
             tailwind = self.universe.get_tailwind_score(theme_id)
-            score.tailwind_score = min(10.0, tailwind)
+            return min(10.0, tailwind)
         else:
             # Default tailwinds if no universe provided
-            theme_id = etf_metadata.get("theme_id", "")
             tailwind_map = {
                 "ai_cloud": 10.0,
                 "defense": 7.0,
@@ -274,7 +366,7 @@ class ETFEngine:
                 "healthcare_innovation": 6.0,
                 "cybersecurity": 7.0,
             }
-            score.tailwind_score = tailwind_map.get(theme_id, 5.0)
+            return tailwind_map.get(theme_id, 5.0)
 
     def _generate_thesis(self, score: ETFScore) -> None:
         """Generate key thesis drivers for the score."""
@@ -5,11 +5,14 @@ Identifies and classifies thematic ETFs from major providers,
 filtering for structural themes and quality metrics.
 """
 
-import json
 import logging
 import os
 from typing import Optional, Dict, List, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+
+import pandas as pd
+
+from ..json_io import load_file
 
 logger = logging.getLogger(__name__)
 
@@ -60,8 +63,7 @@ class ETFUniverse:
                 logger.warning(f"Themes file not found: {self.themes_file}")
                 return self._default_themes_config()
 
-            with open(self.themes_file, "r") as f:
-                config = json.load(f)
+            config = load_file(self.themes_file)
 
             logger.info(f"Loaded {len(config.get('themes', []))} themes from {self.themes_file}")
             return config
@@ -377,6 +379,26 @@ class ETFUniverse:
 
         return theme_etfs
 
+    def get_etfs_by_theme_df(
+        self,
+        theme_id: str,
+        filtered: bool = True
+    ) -> pd.DataFrame:
+        """
+        Get all ETFs for a specific theme as a column-per-field table.
+
+        Args:
+            theme_id: Theme ID (ai_cloud, defense, etc.)
+            filtered: If True, apply quality filters
+
+        Returns:
+            DataFrame with one row per ETF and one column per ETFMetadata field
+        """
+        etfs = self.get_etfs_by_theme(theme_id, filtered=filtered)
+        return pd.DataFrame(
+            {field.name: [getattr(etf, field.name) for etf in etfs] for field in fields(ETFMetadata)}
+        )
+
     def get_theme_by_id(self, theme_id: str) -> Optional[Dict[str, Any]]:
         """Get theme configuration by ID."""
         themes = self.themes_config.get("themes", [])
@@ -13,6 +13,8 @@ from datetime import datetime, timedelta
 import statistics
 import math
 
+import numpy as np
+
 
 class MetricsCalculator:
     """Calculate long-term fundamental metrics for investment quality scoring."""
@@ -381,3 +383,37 @@ class MetricsCalculator:
         # Scale to output range
         score = min_score + (normalized * (max_score - min_score))
         return score
+
+    @staticmethod
+    def scale_linear_array(
+        values: np.ndarray,
+        min_val: float,
+        max_val: float,
+        min_score: float = 0.0,
+        max_score: float = 10.0,
+        invert: bool = False
+    ) -> np.ndarray:
+        """
+        Vectorized scale_linear over an array of metric values.
+
+        Args:
+            values: Metric values
+            min_val: Minimum metric value (maps to min_score)
+            max_val: Maximum metric value (maps to max_score)
+            min_score: Minimum output score
+            max_score: Maximum output score
+            invert: If True, reverse the mapping
+
+        Returns:
+            Array of scores between min_score and max_score
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if min_val == max_val:
+            return np.full(values.shape, (min_score + max_score) / 2)
+
+        normalized = np.clip((values - min_val) / (max_val - min_val), 0.0, 1.0)
+
+        if invert:
+            normalized = 1.0 - normalized
+
+        return min_score + (normalized * (max_score - min_score))
@@ -10,10 +10,12 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 import csv
-import json
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for CSV exports (an allocation model fits in one buffer)
+CSV_BUFFER_SIZE = 1 << 16
+
 
 @dataclass
 class InvalidationTrigger:
@@ -260,28 +262,13 @@ class ReportGenerator:
             True if successful
         """
         try:
-            with open(filepath, "w", newline="") as f:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=[
-                        "Rank",
-                        "Ticker",
-                        "Type",
-                        "Score",
-                        "Allocation (%)",
-                        "Sector/Theme",
-                        "Regime/Bucket",
-                        "Position Size ($1M portfolio)",
-                    ],
-                )
-                writer.writeheader()
-
-                sorted_allocations = sorted(
-                    portfolio.allocations.items(),
-                    key=lambda x: x[1],
-                    reverse=True,
-                )
+            sorted_allocations = sorted(
+                portfolio.allocations.items(),
+                key=lambda x: x[1],
+                reverse=True,
+            )
 
+            def rows():
                 for rank, (ticker, allocation) in enumerate(sorted_allocations, 1):
                     if ticker in etfs:
                         asset_type = "ETF"
@@ -290,24 +277,39 @@ class ReportGenerator:
                             if hasattr(portfolio, "theme_breakdown")
                             else "Thematic"
                         )
-                        regime_bucket = "Core" if ticker in portfolio.core_allocations else "Satellite"
                         score = etfs[ticker].get("score", 0)
                     else:
                         asset_type = "Stock"
                         sector_theme = stocks[ticker].get("sector", "Unknown")
-                        regime_bucket = "Core" if ticker in portfolio.core_allocations else "Satellite"
                         score = stocks[ticker].get("score", 0)
-
-                    writer.writerow({
-                        "Rank": rank,
-                        "Ticker": ticker,
-                        "Type": asset_type,
-                        "Score": f"{score:.1f}",
-                        "Allocation (%)": f"{allocation * 100:.2f}",
-                        "Sector/Theme": sector_theme,
-                        "Regime/Bucket": regime_bucket,
-                        "Position Size ($1M portfolio)": f"${allocation * 1_000_000:,.0f}",
-                    })
+                    regime_bucket = "Core" if ticker in portfolio.core_allocations else "Satellite"
+
+                    yield (
+                        rank,
+                        ticker,
+                        asset_type,
+                        f"{score:.1f}",
+                        f"{allocation * 100:.2f}",
+                        sector_theme,
+                        regime_bucket,
+                        f"${allocation * 1_000_000:,.0f}",
+                    )
+
+            # Rows are streamed straight to the writer as tuples; the large
+            # buffer lets the whole file go out in one write
+            with open(filepath, "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow([
+                    "Rank",
+                    "Ticker",
+                    "Type",
+                    "Score",
+                    "Allocation (%)",
+                    "Sector/Theme",
+                    "Regime/Bucket",
+                    "Position Size ($1M portfolio)",
+                ])
+                writer.writerows(rows())
 
             logger.info(f"✓ Allocation CSV written to {filepath}")
             return True
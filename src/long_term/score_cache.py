@@ -0,0 +1,158 @@
+"""
+Persistent memo of stock/ETF scores keyed by their exact inputs.
+
+Scoring is deterministic, so a re-run with identical fundamentals and price
+metrics can reuse the previous result. Entries are invalidated wholesale when
+the scoring engine source changes (fingerprint mismatch).
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Hashable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def source_fingerprint(*modules: ModuleType) -> str:
+    """Hash the source files of the given modules (engine version stand-in)."""
+    digest = hashlib.sha1()
+    for module in modules:
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def freeze(value: Any) -> Hashable:
+    """Convert nested dicts/lists into a hashable, order-independent key part."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def input_digest(value: Any) -> str:
+    """Short stable digest of nested scoring inputs (dict order ignored)."""
+    return hashlib.sha1(repr(freeze(value)).encode()).hexdigest()
+
+
+class ScoreCache:
+    """Pickle-backed score memo, loaded once and written back once per run.
+
+    get/put may be called from several threads.
+    """
+
+    def __init__(self, path: str, fingerprint: str):
+        """
+        Initialize cache.
+
+        Args:
+            path: Pickle file location
+            fingerprint: Engine fingerprint; a stored file with a different
+                fingerprint is discarded
+        """
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+        self.entries: Dict[Hashable, Any] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load entries from disk if present and built by the same engine."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'rb') as f:
+                stored = pickle.load(f)
+            if stored.get("fingerprint") == self.fingerprint:
+                self.entries = stored.get("entries", {})
+            else:
+                logger.info(f"Score cache {self.path.name} is stale (engine changed) - rebuilding")
+        except Exception as e:
+            logger.warning(f"Could not read score cache {self.path}: {e}")
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None."""
+        with self._lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value (persisted on save)."""
+        with self._lock:
+            self.entries[key] = value
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write entries back to disk if anything changed."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(
+                    {"fingerprint": self.fingerprint, "entries": self.entries},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"Could not write score cache {self.path}: {e}")
+
+
+class TickerScoreCache(ScoreCache):
+    """Score memo holding one entry per ticker: ticker -> (input digest, score).
+
+    A ticker re-scored with different inputs replaces its entry, so the file
+    stays bounded by the universe size.
+    """
+
+    def digest(self, ticker: str) -> Optional[str]:
+        """Input digest stored for ticker, or None."""
+        with self._lock:
+            entry = self.entries.get(ticker)
+        return entry[0] if entry is not None else None
+
+    def lookup(self, ticker: str, digest: str) -> Optional[Any]:
+        """Return the stored score for ticker if it was computed from digest."""
+        with self._lock:
+            entry = self.entries.get(ticker)
+            if entry is not None and entry[0] == digest:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        return None
+
+    def store(self, ticker: str, digest: str, value: Any) -> None:
+        """Store (replace) ticker's score and the digest of its inputs."""
+        with self._lock:
+            self.entries[ticker] = (digest, value)
+            self._dirty = True
+
+    def prune(self, tickers: Iterable[str]) -> int:
+        """Drop entries for tickers not in the given universe.
+
+        Returns:
+            Number of entries removed
+        """
+        keep = set(tickers)
+        with self._lock:
+            stale = [ticker for ticker in self.entries if ticker not in keep]
+            for ticker in stale:
+                del self.entries[ticker]
+            if stale:
+                self._dirty = True
+        return len(stale)
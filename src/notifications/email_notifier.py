@@ -9,7 +9,9 @@ import smtplib
 from datetime import datetime
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Dict, List, Optional
+from functools import lru_cache
+from string import Template
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 from dotenv import load_dotenv
@@ -25,217 +27,158 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-class EmailNotifier:
-    """Send screening results via email with HTML formatting.
-
-    Supports Gmail, Outlook, and custom SMTP servers. Uses environment
-    variables for configuration.
-
-    Environment Variables:
-        EMAIL_FROM: Sender email address
-        EMAIL_PASSWORD: Sender email password or app-specific password
-        EMAIL_TO: Recipient email address (comma-separated for multiple)
-        SMTP_SERVER: SMTP server (default: smtp.gmail.com for Gmail)
-        SMTP_PORT: SMTP port (default: 587)
-
-    Example:
-        >>> notifier = EmailNotifier()
-        >>> notifier.send_screening_results(results_df, top_n=10)
-    """
-
-    def __init__(
-        self,
-        smtp_server: Optional[str] = None,
-        smtp_port: Optional[int] = None,
-        email_from: Optional[str] = None,
-        email_password: Optional[str] = None,
-        email_to: Optional[str] = None
-    ) -> None:
-        """Initialize the email notifier.
-
-        Args:
-            smtp_server: SMTP server address. Defaults to env EMAIL_SMTP_SERVER or smtp.gmail.com.
-            smtp_port: SMTP port. Defaults to env EMAIL_SMTP_PORT or 587.
-            email_from: Sender email. Defaults to env EMAIL_FROM.
-            email_password: Sender password. Defaults to env EMAIL_PASSWORD.
-            email_to: Recipient email(s). Defaults to env EMAIL_TO.
-        """
-        self.smtp_server = smtp_server or os.getenv('EMAIL_SMTP_SERVER', 'smtp.gmail.com')
-        self.smtp_port = smtp_port or int(os.getenv('EMAIL_SMTP_PORT', '587'))
-        self.email_from = email_from or os.getenv('EMAIL_FROM')
-        self.email_password = email_password or os.getenv('EMAIL_PASSWORD')
-        self.email_to = email_to or os.getenv('EMAIL_TO')
-
-        if not self.email_from or not self.email_password:
-            logger.warning("Email credentials not configured. Set EMAIL_FROM and EMAIL_PASSWORD.")
-
-        logger.info(f"EmailNotifier initialized (SMTP: {self.smtp_server}:{self.smtp_port})")
-
-    def _format_html_table(self, df: pd.DataFrame) -> str:
-        """Format DataFrame as HTML table with styling.
-
-        Args:
-            df: DataFrame to format.
-
-        Returns:
-            HTML string with styled table.
-        """
-        html = '<table style="border-collapse: collapse; width: 100%; font-family: Arial, sans-serif;">\n'
-
-        # Header
-        html += '  <thead>\n    <tr style="background-color: #2c3e50; color: white;">\n'
-        for col in df.columns:
-            html += f'      <th style="padding: 12px; text-align: left; border: 1px solid #ddd;">{col}</th>\n'
-        html += '    </tr>\n  </thead>\n'
-
-        # Body
-        html += '  <tbody>\n'
-        for idx, row in df.iterrows():
-            bg_color = '#f9f9f9' if idx % 2 == 0 else 'white'
-            html += f'    <tr style="background-color: {bg_color};">\n'
-
-            for col in df.columns:
-                value = row[col]
-
-                # Format based on column type
-                if pd.isna(value):
-                    display = 'N/A'
-                elif col in ['buy_signal', 'value_score', 'support_score']:
-                    # Color code scores
-                    val = float(value)
-                    if val >= 80:
-                        color = '#27ae60'  # Green
-                    elif val >= 65:
-                        color = '#f39c12'  # Orange
-                    else:
-                        color = '#95a5a6'  # Gray
-                    display = f'<span style="color: {color}; font-weight: bold;">{val:.1f}</span>'
-                elif col == 'current_price':
-                    display = f'${float(value):.2f}'
-                elif col == 'rsi':
-                    val = float(value)
-                    if val < 30:
-                        color = '#e74c3c'  # Red (oversold)
-                    elif val < 70:
-                        color = '#000'  # Black
-                    else:
-                        color = '#c0392b'  # Dark red (overbought)
-                    display = f'<span style="color: {color};">{val:.1f}</span>'
-                elif isinstance(value, (int, float)):
-                    display = f'{value:.2f}'
-                else:
-                    display = str(value)
-
-                html += f'      <td style="padding: 10px; border: 1px solid #ddd;">{display}</td>\n'
-
-            html += '    </tr>\n'
-
-        html += '  </tbody>\n</table>'
-        return html
-
-    def _create_html_email(
-        self,
-        results: pd.DataFrame,
-        top_n: int = 10,
-        subject_prefix: str = "[Stock Screener]"
-    ) -> str:
-        """Create HTML email body with screening results.
-
-        Args:
-            results: DataFrame with screening results.
-            top_n: Number of top candidates to include.
-            subject_prefix: Prefix for email subject line.
-
-        Returns:
-            HTML email body as string.
-        """
-        today = datetime.now().strftime('%B %d, %Y')
-        total_candidates = len(results)
-
-        # Get top candidates
-        top_results = results.head(top_n)
-
-        # Select columns for email
-        email_cols = [
-            'ticker', 'buy_signal', 'value_score', 'support_score',
-            'current_price', 'rsi', 'pe_ratio', 'pb_ratio'
-        ]
-        display_df = top_results[email_cols].copy()
-
-        # Rename columns for display
-        display_df.columns = [
-            'Ticker', 'Buy Signal', 'Value', 'Support',
-            'Price', 'RSI', 'P/E', 'P/B'
-        ]
-
-        html = f"""
+def _fmt_score(value) -> str:
+    """Score cell, color coded by strength."""
+    val = float(value)
+    if val >= 80:
+        color = '#27ae60'  # Green
+    elif val >= 65:
+        color = '#f39c12'  # Orange
+    else:
+        color = '#95a5a6'  # Gray
+    return f'<span style="color: {color}; font-weight: bold;">{val:.1f}</span>'
+
+
+def _fmt_price(value) -> str:
+    """Price cell."""
+    return f'${float(value):.2f}'
+
+
+def _fmt_rsi(value) -> str:
+    """RSI cell, red when oversold or overbought."""
+    val = float(value)
+    if val < 30:
+        color = '#e74c3c'  # Red (oversold)
+    elif val < 70:
+        color = '#000'  # Black
+    else:
+        color = '#c0392b'  # Dark red (overbought)
+    return f'<span style="color: {color};">{val:.1f}</span>'
+
+
+def _fmt_default(value) -> str:
+    """Any other cell: numbers to 2 decimals, everything else as text."""
+    if isinstance(value, (int, float)):
+        return f'{value:.2f}'
+    return str(value)
+
+
+# Column name -> cell formatter used by _format_html_table
+_CELL_FORMATTERS = {
+    'buy_signal': _fmt_score,
+    'value_score': _fmt_score,
+    'support_score': _fmt_score,
+    'current_price': _fmt_price,
+    'rsi': _fmt_rsi,
+}
+
+# Fixed row/cell markup; a row renders as
+# _ROW_OPEN_* + _CELL_SEP.join(cells) + _ROW_CLOSE
+_CELL_OPEN = '      <td style="padding: 10px; border: 1px solid #ddd;">'
+_CELL_CLOSE = '</td>\n'
+_CELL_SEP = _CELL_CLOSE + _CELL_OPEN
+_ROW_OPEN_EVEN = '    <tr style="background-color: #f9f9f9;">\n' + _CELL_OPEN
+_ROW_OPEN_ODD = '    <tr style="background-color: white;">\n' + _CELL_OPEN
+_ROW_CLOSE = _CELL_CLOSE + '    </tr>\n'
+
+
+@lru_cache(maxsize=16)
+def _table_head(columns: Tuple[str, ...]) -> str:
+    """Opening <table> tag, header row and <tbody> tag for these columns."""
+    header_cells = ''.join(
+        f'      <th style="padding: 12px; text-align: left; border: 1px solid #ddd;">{col}</th>\n'
+        for col in columns
+    )
+    return (
+        '<table style="border-collapse: collapse; width: 100%; font-family: Arial, sans-serif;">\n'
+        '  <thead>\n    <tr style="background-color: #2c3e50; color: white;">\n'
+        f'{header_cells}'
+        '    </tr>\n  </thead>\n  <tbody>\n'
+    )
+
+
+# Result columns shown in the HTML email -> display header
+_EMAIL_COLUMNS = {
+    'ticker': 'Ticker',
+    'buy_signal': 'Buy Signal',
+    'value_score': 'Value',
+    'support_score': 'Support',
+    'current_price': 'Price',
+    'rsi': 'RSI',
+    'pe_ratio': 'P/E',
+    'pb_ratio': 'P/B',
+}
+
+# Static HTML for the results email, split around the table: the head is
+# a template, the tail is constant
+_EMAIL_HEAD_TEMPLATE = Template("""
 <!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <style>
-        body {{
+        body {
             font-family: Arial, sans-serif;
             line-height: 1.6;
             color: #333;
             max-width: 900px;
             margin: 0 auto;
             padding: 20px;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 30px;
             border-radius: 10px;
             margin-bottom: 30px;
             text-align: center;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             margin: 0;
             font-size: 28px;
-        }}
-        .summary {{
+        }
+        .summary {
             background-color: #f8f9fa;
             padding: 20px;
             border-radius: 8px;
             margin-bottom: 30px;
             border-left: 4px solid #667eea;
-        }}
-        .legend {{
+        }
+        .legend {
             background-color: #fff3cd;
             padding: 15px;
             border-radius: 8px;
             margin: 20px 0;
             border-left: 4px solid #ffc107;
-        }}
-        .footer {{
+        }
+        .footer {
             margin-top: 30px;
             padding-top: 20px;
             border-top: 2px solid #eee;
             font-size: 12px;
             color: #666;
-        }}
-        .signal-badge {{
+        }
+        .signal-badge {
             display: inline-block;
             padding: 4px 8px;
             border-radius: 4px;
             font-weight: bold;
             font-size: 12px;
-        }}
-        .strong-buy {{ background-color: #d4edda; color: #155724; }}
-        .buy {{ background-color: #fff3cd; color: #856404; }}
-        .consider {{ background-color: #d1ecf1; color: #0c5460; }}
+        }
+        .strong-buy { background-color: #d4edda; color: #155724; }
+        .buy { background-color: #fff3cd; color: #856404; }
+        .consider { background-color: #d1ecf1; color: #0c5460; }
     </style>
 </head>
 <body>
     <div class="header">
         <h1>📊 Daily Stock Screening Results</h1>
-        <p style="margin: 10px 0 0 0; font-size: 16px;">{today}</p>
+        <p style="margin: 10px 0 0 0; font-size: 16px;">$today</p>
     </div>
 
     <div class="summary">
         <h2 style="margin-top: 0;">Summary</h2>
-        <p><strong>{total_candidates}</strong> stocks screened today. Showing top <strong>{len(top_results)}</strong> candidates.</p>
+        <p><strong>$total_candidates</strong> stocks screened today. Showing top <strong>$shown</strong> candidates.</p>
         <p>
             <span class="signal-badge strong-buy">🔥 STRONG BUY (80+)</span>
             <span class="signal-badge buy">✅ BUY (65-79)</span>
@@ -243,9 +186,11 @@ class EmailNotifier:
         </p>
     </div>
 
-    <h2>Top {len(top_results)} Candidates</h2>
+    <h2>Top $shown Candidates</h2>
+
+    """)
 
-    {self._format_html_table(display_df)}
+_EMAIL_TAIL = """
 
     <div class="legend">
         <h3 style="margin-top: 0;">📈 What These Scores Mean</h3>
@@ -265,7 +210,163 @@ class EmailNotifier:
 </body>
 </html>
 """
-        return html
+
+
+@lru_cache(maxsize=4)
+def _email_head(today: str, total_candidates: int, shown: int) -> str:
+    """Email HTML up to the results table (repeat sends reuse it)."""
+    return _EMAIL_HEAD_TEMPLATE.substitute(
+        today=today, total_candidates=total_candidates, shown=shown
+    )
+
+
+class EmailNotifier:
+    """Send screening results via email with HTML formatting.
+
+    Supports Gmail, Outlook, and custom SMTP servers. Uses environment
+    variables for configuration.
+
+    Environment Variables:
+        EMAIL_FROM: Sender email address
+        EMAIL_PASSWORD: Sender email password or app-specific password
+        EMAIL_TO: Recipient email address (comma-separated for multiple)
+        SMTP_SERVER: SMTP server (default: smtp.gmail.com for Gmail)
+        SMTP_PORT: SMTP port (default: 587)
+
+    Example:
+        >>> notifier = EmailNotifier()
+        >>> notifier.send_screening_results(results_df, top_n=10)
+
+        Used as a context manager, one SMTP session (TLS + login) is shared by
+        every email sent inside the block:
+
+        >>> with EmailNotifier() as notifier:
+        ...     notifier.send_batch([("[Daily]", daily_df), ("[Weekly]", weekly_df)])
+    """
+
+    def __init__(
+        self,
+        smtp_server: Optional[str] = None,
+        smtp_port: Optional[int] = None,
+        email_from: Optional[str] = None,
+        email_password: Optional[str] = None,
+        email_to: Optional[str] = None
+    ) -> None:
+        """Initialize the email notifier.
+
+        Args:
+            smtp_server: SMTP server address. Defaults to env EMAIL_SMTP_SERVER or smtp.gmail.com.
+            smtp_port: SMTP port. Defaults to env EMAIL_SMTP_PORT or 587.
+            email_from: Sender email. Defaults to env EMAIL_FROM.
+            email_password: Sender password. Defaults to env EMAIL_PASSWORD.
+            email_to: Recipient email(s). Defaults to env EMAIL_TO.
+        """
+        self.smtp_server = smtp_server or os.getenv('EMAIL_SMTP_SERVER', 'smtp.gmail.com')
+        self.smtp_port = smtp_port or int(os.getenv('EMAIL_SMTP_PORT', '587'))
+        self.email_from = email_from or os.getenv('EMAIL_FROM')
+        self.email_password = email_password or os.getenv('EMAIL_PASSWORD')
+        self.email_to = email_to or os.getenv('EMAIL_TO')
+        self._server: Optional[smtplib.SMTP] = None
+
+        if not self.email_from or not self.email_password:
+            logger.warning("Email credentials not configured. Set EMAIL_FROM and EMAIL_PASSWORD.")
+
+        logger.info(f"EmailNotifier initialized (SMTP: {self.smtp_server}:{self.smtp_port})")
+
+    def __enter__(self) -> 'EmailNotifier':
+        """Open a persistent SMTP session for the sends inside the block."""
+        logger.info(f"Connecting to SMTP server: {self.smtp_server}:{self.smtp_port}")
+        self._server = self._connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the persistent SMTP session."""
+        server, self._server = self._server, None
+        if server is not None:
+            try:
+                server.quit()
+            except smtplib.SMTPException:
+                server.close()
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open an SMTP connection with STARTTLS and log in."""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            server.starttls()
+            server.login(self.email_from, self.email_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _format_html_table(
+        self,
+        df: pd.DataFrame,
+        headers: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Format DataFrame as HTML table with styling.
+
+        Args:
+            df: DataFrame to format.
+            headers: Optional column -> header text mapping (cell formatters
+                are looked up by header text).
+
+        Returns:
+            HTML string with styled table.
+        """
+        headers = headers or {}
+        columns = [headers.get(col, col) for col in df.columns]
+
+        # Format column by column against one NaN mask for the whole frame
+        nan_mask = df.isna().to_numpy()
+        cell_columns = []
+        for k, col in enumerate(columns):
+            fmt = _CELL_FORMATTERS.get(col, _fmt_default)
+            cell_columns.append([
+                'N/A' if missing else fmt(value)
+                for value, missing in zip(df.iloc[:, k].tolist(), nan_mask[:, k].tolist())
+            ])
+
+        # Header (built once per column set)
+        parts = [_table_head(tuple(columns))]
+
+        # Body: each row is one join of its pre-formatted cells
+        for idx, row in zip(df.index, zip(*cell_columns)):
+            parts.append(_ROW_OPEN_EVEN if idx % 2 == 0 else _ROW_OPEN_ODD)
+            parts.append(_CELL_SEP.join(row))
+            parts.append(_ROW_CLOSE)
+
+        parts.append('  </tbody>\n</table>')
+        return ''.join(parts)
+
+    def _create_html_email(
+        self,
+        results: pd.DataFrame,
+        top_n: int = 10,
+        subject_prefix: str = "[Stock Screener]"
+    ) -> str:
+        """Create HTML email body with screening results.
+
+        Args:
+            results: DataFrame with screening results.
+            top_n: Number of top candidates to include.
+            subject_prefix: Prefix for email subject line.
+
+        Returns:
+            HTML email body as string.
+        """
+        today = datetime.now().strftime('%B %d, %Y')
+        total_candidates = len(results)
+
+        # Top candidates, email columns only (display names applied in the table)
+        top_results = results.iloc[:top_n]
+        display_df = top_results[list(_EMAIL_COLUMNS)]
+
+        return (
+            _email_head(today, total_candidates, len(top_results))
+            + self._format_html_table(display_df, _EMAIL_COLUMNS)
+            + _EMAIL_TAIL
+        )
 
     def send_screening_results(
         self,
@@ -316,14 +417,14 @@ class EmailNotifier:
             msg.attach(MIMEText(text_body, 'plain'))
             msg.attach(MIMEText(html_body, 'html'))
 
-            # Send email
-            logger.info(f"Connecting to SMTP server: {self.smtp_server}:{self.smtp_port}")
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_from, self.email_password)
-
-                recipients = [r.strip() for r in self.email_to.split(',')]
-                server.sendmail(self.email_from, recipients, msg.as_string())
+            # Send email (reusing the open session inside a `with` block)
+            recipients = [r.strip() for r in self.email_to.split(',')]
+            if self._server is not None:
+                self._server.sendmail(self.email_from, recipients, msg.as_string())
+            else:
+                logger.info(f"Connecting to SMTP server: {self.smtp_server}:{self.smtp_port}")
+                with self._connect() as server:
+                    server.sendmail(self.email_from, recipients, msg.as_string())
 
             logger.info(f"✓ Email sent successfully to {self.email_to}")
             return True
@@ -338,6 +439,39 @@ class EmailNotifier:
             logger.error(f"Failed to send email: {e}")
             return False
 
+    def send_batch(
+        self,
+        messages: List[Tuple[str, pd.DataFrame]],
+        top_n: int = 10
+    ) -> List[bool]:
+        """Send several screening result emails over one SMTP session.
+
+        Args:
+            messages: (subject_prefix, results) pairs, sent in order.
+            top_n: Number of top candidates to include in each email.
+
+        Returns:
+            Per-message success flags, in the same order as messages.
+        """
+        if self._server is not None:
+            return [
+                self.send_screening_results(results, top_n, subject_prefix)
+                for subject_prefix, results in messages
+            ]
+
+        if not self.email_from or not self.email_password or not self.email_to:
+            logger.error("Email configuration incomplete. Check environment variables.")
+            return [False] * len(messages)
+
+        try:
+            with self:
+                return self.send_batch(messages, top_n)
+        except smtplib.SMTPAuthenticationError:
+            logger.error("SMTP authentication failed. Check email credentials.")
+        except Exception as e:
+            logger.error(f"Failed to open SMTP session: {e}")
+        return [False] * len(messages)
+
     def _create_text_fallback(self, results: pd.DataFrame, top_n: int) -> str:
         """Create plain text version of email for clients that don't support HTML.
 
@@ -349,33 +483,37 @@ class EmailNotifier:
             Plain text email body.
         """
         today = datetime.now().strftime('%B %d, %Y')
-        text = f"DAILY STOCK SCREENING RESULTS - {today}\n"
-        text += "=" * 60 + "\n\n"
-
-        text += f"Found {len(results)} candidates. Top {top_n} below:\n\n"
-
-        # Format as table
-        top_results = results.head(top_n)
-        text += f"{'Ticker':<8} {'Buy Signal':<12} {'Value':<8} {'Support':<10} {'Price':<10}\n"
-        text += "-" * 60 + "\n"
-
-        for _, row in top_results.iterrows():
-            text += f"{row['ticker']:<8} "
-            text += f"{row['buy_signal']:<12.1f} "
-            text += f"{row['value_score']:<8.1f} "
-            text += f"{row['support_score']:<10.1f} "
-            text += f"${row['current_price']:<9.2f}\n"
-
-        text += "\n" + "=" * 60 + "\n"
-        text += "\nLegend:\n"
-        text += "- Buy Signal: Combined score (70+ is actionable)\n"
-        text += "- Value Score: Fundamental valuation (80+ is excellent)\n"
-        text += "- Support Score: Technical setup (80+ is ready to buy)\n"
-
-        text += "\n" + "=" * 60 + "\n"
-        text += "\n⚠️ This is not financial advice. Always do your own research.\n"
+        rule = "=" * 60 + "\n"
+        parts = [
+            f"DAILY STOCK SCREENING RESULTS - {today}\n",
+            rule + "\n",
+            f"Found {len(results)} candidates. Top {top_n} below:\n\n",
+            # Format as table
+            f"{'Ticker':<8} {'Buy Signal':<12} {'Value':<8} {'Support':<10} {'Price':<10}\n",
+            "-" * 60 + "\n",
+        ]
 
-        return text
+        top_results = results.head(top_n)[
+            ['ticker', 'buy_signal', 'value_score', 'support_score', 'current_price']
+        ]
+        for ticker, buy_signal, value_score, support_score, price in top_results.itertuples(
+            index=False, name=None
+        ):
+            parts.append(
+                f"{ticker:<8} {buy_signal:<12.1f} {value_score:<8.1f} "
+                f"{support_score:<10.1f} ${price:<9.2f}\n"
+            )
+
+        parts += [
+            "\n" + rule,
+            "\nLegend:\n",
+            "- Buy Signal: Combined score (70+ is actionable)\n",
+            "- Value Score: Fundamental valuation (80+ is excellent)\n",
+            "- Support Score: Technical setup (80+ is ready to buy)\n",
+            "\n" + rule,
+            "\n⚠️ This is not financial advice. Always do your own research.\n",
+        ]
+        return "".join(parts)
 
     def test_connection(self) -> bool:
         """Test SMTP connection and authentication.
@@ -196,7 +196,7 @@ class BatchStockProcessor:
                     return None
 
             # Classify phase
-            phase_info = classify_phase(price_data, current_price)
+            phase_info = classify_phase(price_data, current_price, symbol=ticker)
 
             # Only analyze stocks in Phase 1 or 2 for buys
             # And Phase 3 or 4 for sells
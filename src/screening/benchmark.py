@@ -37,7 +37,7 @@ def analyze_spy_trend(spy_price_data: pd.DataFrame, current_spy_price: float) ->
         }
 
     # Classify SPY phase
-    phase_info = classify_phase(spy_price_data, current_spy_price)
+    phase_info = classify_phase(spy_price_data, current_spy_price, symbol='SPY')
 
     # Determine overall trend
     phase = phase_info['phase']
@@ -14,15 +14,22 @@ import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import requests
 import yfinance as yf
 
 from src.data.fetcher import YahooFinanceFetcher
 from src.data.fundamentals_fetcher import fetch_quarterly_financials, analyze_fundamentals_for_signal
 from src.data.git_storage_fetcher import GitStorageFetcher
-from ..screening.phase_indicators import classify_phase, calculate_relative_strength, detect_vcp_pattern
+from ..screening.phase_indicators import (
+    classify_phase,
+    classify_phase_batch,
+    calculate_relative_strength,
+    detect_vcp_pattern,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -41,7 +48,9 @@ class OptimizedBatchProcessor:
         max_workers: int = 3,  # Conservative: 3 workers
         rate_limit_delay: float = 0.5,  # 0.5 sec = 2 TPS per worker
         batch_size: int = 100,
-        use_git_storage: bool = False  # Use Git-based fundamental storage
+        use_git_storage: bool = False,  # Use Git-based fundamental storage
+        http_session: Optional[requests.Session] = None,
+        download_chunk_size: int = 100
     ):
         """Initialize optimized processor.
 
@@ -52,9 +61,12 @@ class OptimizedBatchProcessor:
             rate_limit_delay: Delay per worker (0.5 = 2 TPS)
             batch_size: Save progress frequency
             use_git_storage: Use Git-based storage for fundamentals (recommended)
+            http_session: Shared pooled session so workers reuse keep-alive connections
+            download_chunk_size: Tickers per multi-ticker yf.download request
         """
-        self.fetcher = YahooFinanceFetcher(cache_dir=cache_dir)
-        self.git_fetcher = GitStorageFetcher() if use_git_storage else None
+        self.http_session = http_session
+        self.fetcher = YahooFinanceFetcher(cache_dir=cache_dir, session=http_session)
+        self.git_fetcher = GitStorageFetcher(session=http_session) if use_git_storage else None
         self.use_git_storage = use_git_storage
         self.results_dir = Path(results_dir)
         self.results_dir.mkdir(parents=True, exist_ok=True)
@@ -62,6 +74,7 @@ class OptimizedBatchProcessor:
         self.max_workers = max_workers
         self.rate_limit_delay = rate_limit_delay
         self.batch_size = batch_size
+        self.download_chunk_size = download_chunk_size
 
         # Effective TPS = max_workers / rate_limit_delay
         effective_tps = max_workers / rate_limit_delay
@@ -72,6 +85,11 @@ class OptimizedBatchProcessor:
         self.processed_tickers = set()
         self.current_results = []
 
+        # Price histories from the current multi-ticker download, consumed per ticker
+        self._prefetched_prices: Dict[str, pd.DataFrame] = {}
+        # Filter verdicts computed for prefetched tickers (see _apply_filters)
+        self._prefiltered: Dict[str, Tuple[Optional[str], float, Optional[float]]] = {}
+
         # Rate limit tracking and adaptive backoff
         self.request_times = []
         self.error_count = 0
@@ -180,6 +198,132 @@ class OptimizedBatchProcessor:
             logger.error(f"Error fetching SPY: {e}")
             return False
 
+    def prefetch_price_histories(self, tickers: List[str], period: str = '5y') -> int:
+        """Download price history for many tickers in one request.
+
+        Yahoo's chart API accepts comma-separated symbols, so one
+        yf.download call replaces a whole chunk of per-ticker requests.
+        Results are stashed for analyze_single_stock; tickers missing from
+        the download fall back to the per-ticker fetch.
+
+        Args:
+            tickers: Tickers to download together
+            period: History period (5y covers the drawdown filter)
+
+        Returns:
+            Number of tickers with usable data
+        """
+        if not tickers:
+            return 0
+
+        self._wait_for_rate_limit()
+
+        try:
+            data = yf.download(
+                tickers,
+                period=period,
+                interval='1d',
+                group_by='ticker',
+                threads=False,
+                progress=False,
+                session=self.http_session
+            )
+        except Exception as e:
+            logger.warning(f"Batch download failed for {len(tickers)} tickers: {e}")
+            return 0
+
+        if data is None or data.empty or not isinstance(data.columns, pd.MultiIndex):
+            return 0
+
+        available = set(data.columns.get_level_values(0))
+        loaded = 0
+        for ticker in tickers:
+            if ticker not in available:
+                continue
+
+            hist = data[ticker].dropna(how='all')
+            if hist.empty or not isinstance(hist.index, pd.DatetimeIndex):
+                continue
+
+            hist.columns = [col.capitalize() for col in hist.columns]
+            hist = hist[[col for col in ['Open', 'High', 'Low', 'Close', 'Volume'] if col in hist.columns]]
+            self._prefetched_prices[ticker] = hist
+            loaded += 1
+
+        logger.debug(f"Batch download: {loaded}/{len(tickers)} tickers")
+        return loaded
+
+    def set_spy_data(self, spy_hist: pd.DataFrame) -> bool:
+        """Use pre-loaded SPY data (e.g. from a disk cache) instead of fetching.
+
+        Args:
+            spy_hist: SPY OHLCV DataFrame with DatetimeIndex
+
+        Returns:
+            True if the data was accepted
+        """
+        if spy_hist is None or spy_hist.empty or not isinstance(spy_hist.index, pd.DatetimeIndex):
+            logger.warning("Ignoring invalid pre-loaded SPY data")
+            return False
+
+        self.spy_data = spy_hist
+        self.spy_price = spy_hist['Close'].iloc[-1]
+        logger.info(f"SPY ready (pre-loaded): {len(spy_hist)} days, ${self.spy_price:.2f}")
+        return True
+
+    @staticmethod
+    def _apply_filters(
+        long_hist: pd.DataFrame,
+        price_data: pd.DataFrame,
+        min_price: float,
+        max_price: float,
+        min_volume: int
+    ) -> Tuple[Optional[str], float, Optional[float]]:
+        """Run the cheap pre-classification filters (no side effects).
+
+        Args:
+            long_hist: Up to 5y of history (drawdown check)
+            price_data: Last year of history (analysis window)
+            min_price: Min price filter
+            max_price: Max price filter
+            min_volume: Min volume filter
+
+        Returns:
+            Tuple of (filter reason or None if the stock passes, 20-day
+            average volume, 5y max drawdown or None if not checked)
+        """
+        if price_data.empty or len(price_data) < 200:
+            return 'insufficient_data', 0, None
+
+        current_price = price_data['Close'].iloc[-1]
+
+        # Historical drawdown filter (using 5y data we already fetched)
+        # Exclude stocks that dropped >60% from any high in past 5 years
+        max_drawdown = None
+        if not long_hist.empty and len(long_hist) >= 252:  # At least 1 year
+            closes = long_hist['Close']
+            # Calculate max drawdown from any previous high
+            running_max = closes.expanding().max()
+            drawdown = (closes - running_max) / running_max
+            max_drawdown = drawdown.min()  # Most negative value
+
+            if max_drawdown < -0.60:  # Dropped more than 60%
+                return 'severe_drawdown_60pct', 0, max_drawdown
+
+        # Price filter
+        if current_price < min_price or current_price > max_price:
+            return 'price_range', 0, max_drawdown
+
+        # Volume filter
+        if 'Volume' in price_data.columns:
+            avg_volume = price_data['Volume'].iloc[-20:].mean()
+            if avg_volume < min_volume:
+                return 'low_volume', avg_volume, max_drawdown
+        else:
+            avg_volume = 0
+
+        return None, avg_volume, max_drawdown
+
     def analyze_single_stock(
         self,
         ticker: str,
@@ -199,17 +343,23 @@ class OptimizedBatchProcessor:
             Analysis dict or None
         """
         try:
+            prefetched = self._prefetched_prices.pop(ticker, None)
+
             # Thread-safe rate limiting (locks ensure only 1 request at a time)
-            self._wait_for_rate_limit()
+            # Prefetched prices were already paid for by the chunk download
+            if prefetched is None:
+                self._wait_for_rate_limit()
 
             self.total_requests += 1
 
             # Fetch price history (5 years to check drawdown, use last 1y for analysis)
             # This is more efficient than two separate fetches
-            if self.use_git_storage and self.git_fetcher:
+            if prefetched is not None:
+                long_hist = prefetched
+                price_data = long_hist.tail(252) if len(long_hist) > 252 else long_hist
+            elif self.use_git_storage and self.git_fetcher:
                 # Git fetcher only does 1y, fetch 5y for drawdown check first
-                import yfinance as yf
-                long_hist = yf.Ticker(ticker).history(period='5y', interval='1d')
+                long_hist = yf.Ticker(ticker, session=self.http_session).history(period='5y', interval='1d')
 
                 if not long_hist.empty:
                     # Use last 1 year for technical analysis
@@ -227,46 +377,22 @@ class OptimizedBatchProcessor:
                 else:
                     price_data = pd.DataFrame()
 
-            if price_data.empty or len(price_data) < 200:
+            # Prefetched tickers were already filtered by the chunk pre-pass
+            verdict = self._prefiltered.pop(ticker, None)
+            if verdict is None:
+                verdict = self._apply_filters(long_hist, price_data, min_price, max_price, min_volume)
+            reason, avg_volume, max_drawdown = verdict
+            if reason is not None:
                 self.filtered_count += 1
-                self.filter_reasons['insufficient_data'] = self.filter_reasons.get('insufficient_data', 0) + 1
-                return None
-
-            current_price = price_data['Close'].iloc[-1]
-
-            # Historical drawdown filter (using 5y data we already fetched)
-            # Exclude stocks that dropped >60% from any high in past 5 years
-            if not long_hist.empty and len(long_hist) >= 252:  # At least 1 year
-                closes = long_hist['Close']
-                # Calculate max drawdown from any previous high
-                running_max = closes.expanding().max()
-                drawdown = (closes - running_max) / running_max
-                max_drawdown = drawdown.min()  # Most negative value
-
-                if max_drawdown < -0.60:  # Dropped more than 60%
-                    self.filtered_count += 1
-                    self.filter_reasons['severe_drawdown_60pct'] = self.filter_reasons.get('severe_drawdown_60pct', 0) + 1
+                self.filter_reasons[reason] = self.filter_reasons.get(reason, 0) + 1
+                if reason == 'severe_drawdown_60pct':
                     logger.debug(f"{ticker}: Filtered - {max_drawdown*100:.1f}% max drawdown in 5y")
-                    return None
-
-            # Price filter
-            if current_price < min_price or current_price > max_price:
-                self.filtered_count += 1
-                self.filter_reasons['price_range'] = self.filter_reasons.get('price_range', 0) + 1
                 return None
 
-            # Volume filter
-            if 'Volume' in price_data.columns:
-                avg_volume = price_data['Volume'].iloc[-20:].mean()
-                if avg_volume < min_volume:
-                    self.filtered_count += 1
-                    self.filter_reasons['low_volume'] = self.filter_reasons.get('low_volume', 0) + 1
-                    return None
-            else:
-                avg_volume = 0
+            current_price = price_data['Close'].iloc[-1]
 
             # Phase classification
-            phase_info = classify_phase(price_data, current_price)
+            phase_info = classify_phase(price_data, current_price, symbol=ticker)
             phase = phase_info['phase']
 
             if phase not in [1, 2, 3, 4]:
@@ -280,6 +406,9 @@ class OptimizedBatchProcessor:
                 self.spy_data['Close'],
                 period=63
             )
+            # RS thresholds are coarse (e.g. slope > 0.05); float32 halves the
+            # memory and pickling cost of carrying the series to scoring
+            rs_series = rs_series.astype(np.float32)
 
             # VCP pattern detection (only for Phase 1/2 - base building or breakout)
             vcp_data = {}
@@ -292,6 +421,9 @@ class OptimizedBatchProcessor:
             fundamental_analysis = {}
 
             if phase in [1, 2]:
+                if prefetched is not None:
+                    self._wait_for_rate_limit()
+
                 # Use Git-based storage if enabled
                 if self.use_git_storage and self.git_fetcher:
                     quarterly_data = self.git_fetcher.fetch_fundamentals_smart(ticker)
@@ -379,8 +511,8 @@ class OptimizedBatchProcessor:
         logger.info(f"Est. time: {len(tickers) * self.rate_limit_delay / self.max_workers / 3600:.1f} hours")
         logger.info("="*60)
 
-        # Fetch SPY
-        if not self.fetch_spy_data():
+        # Fetch SPY (unless pre-loaded via set_spy_data)
+        if self.spy_data is None and not self.fetch_spy_data():
             return {'error': 'Failed to fetch SPY'}
 
         # Load progress
@@ -397,68 +529,87 @@ class OptimizedBatchProcessor:
         all_analyses = self.current_results.copy()
         phase_results = []
 
-        # Process in parallel batches
+        # Process in parallel batches: one multi-ticker download per chunk,
+        # then the per-ticker analysis runs on the prefetched frames
+        completed = 0
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_ticker = {
-                executor.submit(
-                    self.analyze_single_stock,
-                    ticker,
-                    min_price,
-                    max_price,
-                    min_volume
-                ): ticker
-                for ticker in remaining
-            }
-
-            # Process completions
-            completed = 0
-            for future in as_completed(future_to_ticker):
-                ticker = future_to_ticker[future]
-                completed += 1
-
-                try:
-                    analysis = future.result()
-
-                    if analysis:
-                        all_analyses.append(analysis)
-                        phase_results.append({
-                            'ticker': ticker,
-                            'phase': analysis['phase_info']['phase']
-                        })
-
-                        # Success - reset consecutive errors and reduce backoff
-                        self.consecutive_errors = 0
-                        if self.backoff_delay > 0:
-                            self.backoff_delay = max(0, self.backoff_delay - 0.1)  # Slowly reduce
-
-                    self.processed_tickers.add(ticker)
-
-                    # Progress logging
-                    if completed % 50 == 0 or completed == 1:
-                        elapsed = time.time() - start_time
-                        rate = completed / elapsed if elapsed > 0 else 0
-                        remaining_count = len(remaining) - completed
-                        eta_seconds = remaining_count / rate if rate > 0 else 0
-                        eta = str(timedelta(seconds=int(eta_seconds)))
-
-                        error_rate = self.error_count / max(self.total_requests, 1) * 100
-                        filter_rate = self.filtered_count / max(self.total_requests, 1) * 100
-
-                        logger.info(
-                            f"Progress: {len(self.processed_tickers)}/{len(tickers)} "
-                            f"({len(self.processed_tickers)/len(tickers)*100:.1f}%) | "
-                            f"Rate: {rate:.1f}/sec | "
-                            f"Filtered: {filter_rate:.1f}% | Errors: {error_rate:.1f}% | "
-                            f"ETA: {eta}"
-                        )
-
-                    # Save progress
-                    if completed % self.batch_size == 0:
-                        self.save_progress(tickers, all_analyses)
-
-                except Exception as e:
-                    logger.error(f"Error processing {ticker}: {e}")
+            for chunk_start in range(0, len(remaining), self.download_chunk_size):
+                chunk = remaining[chunk_start:chunk_start + self.download_chunk_size]
+                self.prefetch_price_histories(chunk)
+
+                # Filter the prefetched frames first, then classify only the
+                # survivors in one compiled pass; analyze_single_stock reuses
+                # the verdicts and its classify_phase calls hit the memo
+                survivors = {}
+                for ticker in chunk:
+                    long_hist = self._prefetched_prices.get(ticker)
+                    if long_hist is None:
+                        continue
+                    price_data = long_hist.tail(252)
+                    verdict = self._apply_filters(long_hist, price_data, min_price, max_price, min_volume)
+                    self._prefiltered[ticker] = verdict
+                    if verdict[0] is None:
+                        survivors[ticker] = price_data
+                classify_phase_batch(survivors)
+
+                future_to_ticker = {
+                    executor.submit(
+                        self.analyze_single_stock,
+                        ticker,
+                        min_price,
+                        max_price,
+                        min_volume
+                    ): ticker
+                    for ticker in chunk
+                }
+
+                # Process completions
+                for future in as_completed(future_to_ticker):
+                    ticker = future_to_ticker[future]
+                    completed += 1
+
+                    try:
+                        analysis = future.result()
+
+                        if analysis:
+                            all_analyses.append(analysis)
+                            phase_results.append({
+                                'ticker': ticker,
+                                'phase': analysis['phase_info']['phase']
+                            })
+
+                            # Success - reset consecutive errors and reduce backoff
+                            self.consecutive_errors = 0
+                            if self.backoff_delay > 0:
+                                self.backoff_delay = max(0, self.backoff_delay - 0.1)  # Slowly reduce
+
+                        self.processed_tickers.add(ticker)
+
+                        # Progress logging
+                        if completed % 50 == 0 or completed == 1:
+                            elapsed = time.time() - start_time
+                            rate = completed / elapsed if elapsed > 0 else 0
+                            remaining_count = len(remaining) - completed
+                            eta_seconds = remaining_count / rate if rate > 0 else 0
+                            eta = str(timedelta(seconds=int(eta_seconds)))
+
+                            error_rate = self.error_count / max(self.total_requests, 1) * 100
+                            filter_rate = self.filtered_count / max(self.total_requests, 1) * 100
+
+                            logger.info(
+                                f"Progress: {len(self.processed_tickers)}/{len(tickers)} "
+                                f"({len(self.processed_tickers)/len(tickers)*100:.1f}%) | "
+                                f"Rate: {rate:.1f}/sec | "
+                                f"Filtered: {filter_rate:.1f}% | Errors: {error_rate:.1f}% | "
+                                f"ETA: {eta}"
+                            )
+
+                        # Save progress
+                        if completed % self.batch_size == 0:
+                            self.save_progress(tickers, all_analyses)
+
+                    except Exception as e:
+                        logger.error(f"Error processing {ticker}: {e}")
 
         # Final save
         self.save_progress(tickers, all_analyses)
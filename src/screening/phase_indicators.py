@@ -10,11 +10,22 @@ This module implements all technical indicators required for the Phase system:
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
 from datetime import datetime
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ..jit import njit
+
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
 
 logging.basicConfig(
     level=logging.INFO,
@@ -27,9 +38,58 @@ def calculate_sma(prices: pd.Series, period: int) -> pd.Series:
     """Calculate Simple Moving Average."""
     if len(prices) < period:
         return pd.Series([np.nan] * len(prices), index=prices.index)
+    if BOTTLENECK_AVAILABLE:
+        # C moving window; same NaN semantics as rolling(min_periods=period)
+        values = bn.move_mean(prices.to_numpy(dtype=np.float64), window=period, min_count=period)
+        return pd.Series(values, index=prices.index)
     return prices.rolling(window=period, min_periods=period).mean()
 
 
+def _column(price_data: pd.DataFrame, name: str) -> np.ndarray:
+    """Optional column as a float64 ndarray (empty if the column is missing)."""
+    if name not in price_data:
+        return np.empty(0)
+    return price_data[name].to_numpy(dtype=np.float64)
+
+
+def _nanmean(values: np.ndarray) -> float:
+    """Mean skipping NaN (NaN if nothing is left), as Series.mean() gives."""
+    if BOTTLENECK_AVAILABLE:
+        return float(bn.nanmean(values))
+    valid = values[~np.isnan(values)]
+    return float(valid.mean()) if len(valid) else np.nan
+
+
+def _nanmax(values: np.ndarray) -> float:
+    """Max skipping NaN (NaN if nothing is left), as Series.max() gives."""
+    if BOTTLENECK_AVAILABLE:
+        return float(bn.nanmax(values))
+    valid = values[~np.isnan(values)]
+    return float(valid.max()) if len(valid) else np.nan
+
+
+def _nanmin(values: np.ndarray) -> float:
+    """Min skipping NaN (NaN if nothing is left), as Series.min() gives."""
+    if BOTTLENECK_AVAILABLE:
+        return float(bn.nanmin(values))
+    valid = values[~np.isnan(values)]
+    return float(valid.min()) if len(valid) else np.nan
+
+
+# n -> (x - mean(x), sum of squares) for x = 0..n-1, shared by calculate_slope
+_X_CACHE: Dict[int, Tuple[np.ndarray, float]] = {}
+
+
+def _centered_x(n: int) -> Tuple[np.ndarray, float]:
+    """Centered regression x vector for n points and its sum of squares."""
+    cached = _X_CACHE.get(n)
+    if cached is None:
+        x_dev = np.arange(n, dtype=np.float64) - (n - 1) / 2.0
+        x_dev.flags.writeable = False
+        cached = _X_CACHE[n] = (x_dev, n * (n * n - 1) / 12.0)
+    return cached
+
+
 def calculate_slope(series: pd.Series, periods: int = 20) -> float:
     """Calculate the slope of a series over recent periods.
 
@@ -47,14 +107,10 @@ def calculate_slope(series: pd.Series, periods: int = 20) -> float:
     if len(recent) < 2:
         return 0.0
 
-    # Linear regression slope
-    x = np.arange(len(recent))
-    y = recent.values
-
-    if np.std(x) == 0:
-        return 0.0
-
-    slope = np.polyfit(x, y, 1)[0]
+    # Linear regression slope (closed-form least squares, same fit as polyfit deg 1)
+    y = recent.to_numpy(dtype=np.float64)
+    x_dev, x_ss = _centered_x(len(recent))
+    slope = np.dot(x_dev, y - y.mean()) / x_ss
 
     # Convert to percentage per day
     avg_price = np.mean(y)
@@ -66,6 +122,45 @@ def calculate_slope(series: pd.Series, periods: int = 20) -> float:
     return slope_pct
 
 
+# Recent (SPY index, stock index, tz-naive stock index, SPY positions), newest
+# first; screening aligns every stock against the same SPY frame
+_SPY_ALIGN_CACHE: List[Tuple[pd.DatetimeIndex, pd.DatetimeIndex, pd.DatetimeIndex, np.ndarray]] = []
+_SPY_ALIGN_CACHE_SIZE = 4
+_SPY_ALIGN_CACHE_LOCK = threading.Lock()
+
+
+def _spy_alignment(stock_index: pd.DatetimeIndex,
+                   spy_index: pd.DatetimeIndex) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+    """Align SPY dates to stock dates, reusing recent alignments.
+
+    Returns:
+        Tuple of (tz-naive stock index, position of the last SPY date on or
+        before each stock date, -1 if none)
+    """
+    with _SPY_ALIGN_CACHE_LOCK:
+        for i, (spy, stock, naive_stock, positions) in enumerate(_SPY_ALIGN_CACHE):
+            # Entries hold their indexes, so identity cannot match a reused id;
+            # stock frames usually carry equal but distinct index objects
+            if spy is spy_index and stock.dtype == stock_index.dtype and stock.equals(stock_index):
+                if i:
+                    _SPY_ALIGN_CACHE.insert(0, _SPY_ALIGN_CACHE.pop(i))
+                return naive_stock, positions
+
+    # Remove timezone info if present (convert to timezone-naive)
+    naive_stock = stock_index.tz_localize(None) if stock_index.tz is not None else stock_index
+    naive_spy = spy_index.tz_localize(None) if spy_index.tz is not None else spy_index
+
+    # Align by DATE (not position) - stocks and SPY trade on same days;
+    # same result as reindex(method='ffill') without an intermediate Series
+    positions = naive_spy.get_indexer(naive_stock, method='ffill')
+    positions.flags.writeable = False
+
+    with _SPY_ALIGN_CACHE_LOCK:
+        _SPY_ALIGN_CACHE.insert(0, (spy_index, stock_index, naive_stock, positions))
+        del _SPY_ALIGN_CACHE[_SPY_ALIGN_CACHE_SIZE:]
+    return naive_stock, positions
+
+
 def calculate_relative_strength(stock_prices: pd.Series, spy_prices: pd.Series,
                                   period: int = 63) -> pd.Series:
     """Calculate Relative Strength vs SPY.
@@ -85,41 +180,35 @@ def calculate_relative_strength(stock_prices: pd.Series, spy_prices: pd.Series,
 
     # Normalize indexes to timezone-naive DatetimeIndex to avoid comparison errors
     # yfinance sometimes returns timezone-aware data, sometimes naive, sometimes RangeIndex
-    stock_prices = stock_prices.copy()
-    spy_prices = spy_prices.copy()
+    stock_index = stock_prices.index
+    spy_index = spy_prices.index
 
     # Ensure both have DatetimeIndex (not RangeIndex)
-    if not isinstance(stock_prices.index, pd.DatetimeIndex):
-        logger.warning(f"Stock has non-DatetimeIndex: {type(stock_prices.index)}")
-        return pd.Series([np.nan] * len(stock_prices), index=stock_prices.index)
+    if not isinstance(stock_index, pd.DatetimeIndex):
+        logger.warning(f"Stock has non-DatetimeIndex: {type(stock_index)}")
+        return pd.Series([np.nan] * len(stock_prices), index=stock_index)
 
-    if not isinstance(spy_prices.index, pd.DatetimeIndex):
-        logger.warning(f"SPY has non-DatetimeIndex: {type(spy_prices.index)}")
-        return pd.Series([np.nan] * len(stock_prices), index=stock_prices.index)
+    if not isinstance(spy_index, pd.DatetimeIndex):
+        logger.warning(f"SPY has non-DatetimeIndex: {type(spy_index)}")
+        return pd.Series([np.nan] * len(stock_prices), index=stock_index)
 
-    # Remove timezone info if present (convert to timezone-naive)
-    if stock_prices.index.tz is not None:
-        stock_prices.index = stock_prices.index.tz_localize(None)
-
-    if spy_prices.index.tz is not None:
-        spy_prices.index = spy_prices.index.tz_localize(None)
-
-    # Align the series by DATE (not position) - stocks and SPY trade on same days
-    # Use reindex to align SPY to stock dates, then forward fill any gaps
-    spy_aligned = spy_prices.reindex(stock_prices.index, method='ffill')
+    stock_index, positions = _spy_alignment(stock_index, spy_index)
+    spy_aligned = spy_prices.to_numpy(dtype=np.float64)[positions]
+    spy_aligned[positions < 0] = np.nan
 
     # Check if we have valid aligned data
-    if spy_aligned.isna().all():
+    if np.isnan(spy_aligned).all():
         logger.warning("SPY alignment failed - all NaN after reindex")
-        return pd.Series([np.nan] * len(stock_prices), index=stock_prices.index)
+        return pd.Series([np.nan] * len(stock_prices), index=stock_index)
 
     # Calculate RS
-    rs = (stock_prices / spy_aligned) * 100
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs_values = stock_prices.to_numpy(dtype=np.float64) / spy_aligned * 100
 
-    # Fill any remaining NaN with forward fill
-    rs = rs.ffill()
+    name = stock_prices.name if stock_prices.name == spy_prices.name else None
 
-    return rs
+    # Fill any remaining NaN with forward fill
+    return pd.Series(rs_values, index=stock_index, name=name).ffill()
 
 
 def calculate_rs_slope(rs_series: pd.Series, periods: int = 15) -> float:
@@ -135,6 +224,63 @@ def calculate_rs_slope(rs_series: pd.Series, periods: int = 15) -> float:
     return calculate_slope(rs_series, periods)
 
 
+@njit(cache=True)
+def _rolling_std_slice(values: np.ndarray, window: int, start: int, end: int):
+    """Rolling sample std for the windows ending at values[start:end].
+
+    Slides Welford's running mean/M2 across the segment (no sum-of-squares
+    cancellation). As with rolling(window).std(), a window holding a NaN or
+    starting before the series is NaN, and a constant window is exactly 0.
+
+    Returns:
+        Tuple of (mean of the non-NaN stds or NaN, std of the last window)
+    """
+    first = max(start - window + 1, 0)
+    nobs = 0
+    missing = 0
+    mean = 0.0
+    m2 = 0.0
+    same = 0
+    total = 0.0
+    count = 0
+    std = np.nan
+    for i in range(first, end):
+        x = values[i]
+        if np.isnan(x):
+            missing += 1
+            same = 0
+        else:
+            nobs += 1
+            delta = x - mean
+            mean += delta / nobs
+            m2 += delta * (x - mean)
+            same = same + 1 if same > 0 and x == values[i - 1] else 1
+
+        if i - window >= first:
+            old = values[i - window]
+            if np.isnan(old):
+                missing -= 1
+            else:
+                nobs -= 1
+                if nobs == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = old - mean
+                    mean -= delta / nobs
+                    m2 -= delta * (old - mean)
+
+        if i < start:
+            continue
+        if i < window - 1 or missing > 0:
+            std = np.nan
+            continue
+        std = 0.0 if same >= window else np.sqrt(max(m2, 0.0) / (window - 1))
+        total += std
+        count += 1
+    return (total / count if count else np.nan), std
+
+
 def detect_volatility_contraction(prices: pd.Series, window: int = 20) -> Dict[str, any]:
     """Detect volatility contraction (squeeze).
 
@@ -150,25 +296,31 @@ def detect_volatility_contraction(prices: pd.Series, window: int = 20) -> Dict[s
     Returns:
         Dict with contraction metrics
     """
-    if len(prices) < window * 2:
+    return _volatility_contraction(prices.to_numpy(dtype=np.float64), window)
+
+
+def _volatility_contraction(values: np.ndarray, window: int) -> Dict[str, any]:
+    """detect_volatility_contraction on a float64 price array."""
+    if len(values) < window * 2:
         return {
             'is_contracting': False,
             'contraction_quality': 0.0,
             'current_volatility': 0.0
         }
 
-    # Calculate rolling standard deviation (volatility proxy)
-    volatility = prices.rolling(window=window).std()
-
-    if len(volatility.dropna()) < 2:
+    # Rolling standard deviation (volatility proxy); only the latest window and
+    # the `window` windows ending in [-2*window, -window) are needed
+    n = len(values)
+    missing = np.isnan(values)
+    if missing.any() and np.count_nonzero(~sliding_window_view(missing, window).any(axis=1)) < 2:
         return {
             'is_contracting': False,
             'contraction_quality': 0.0,
             'current_volatility': 0.0
         }
 
-    current_vol = volatility.iloc[-1]
-    avg_vol = volatility.iloc[-window*2:-window].mean()
+    _, current_vol = _rolling_std_slice(values, window, n - 1, n)
+    avg_vol, _ = _rolling_std_slice(values, window, n - 2 * window, n - window)
 
     # Contraction = current volatility is below average
     contraction_ratio = current_vol / avg_vol if avg_vol > 0 else 1.0
@@ -196,11 +348,7 @@ def find_base_high(prices: pd.Series, window: int = 60) -> Optional[float]:
     Returns:
         Base high price level
     """
-    if len(prices) < window:
-        return None
-
-    recent_high = prices.iloc[-window:].max()
-    return float(recent_high)
+    return _trailing_high(prices.to_numpy(dtype=np.float64), window)
 
 
 def find_pivot_high(prices: pd.Series, window: int = 20) -> Optional[float]:
@@ -213,11 +361,14 @@ def find_pivot_high(prices: pd.Series, window: int = 20) -> Optional[float]:
     Returns:
         Pivot high price level
     """
-    if len(prices) < window:
-        return None
+    return _trailing_high(prices.to_numpy(dtype=np.float64), window)
+
 
-    pivot = prices.iloc[-window:].max()
-    return float(pivot)
+def _trailing_high(values: np.ndarray, window: int) -> Optional[float]:
+    """Highest of the last `window` values, or None if the series is shorter."""
+    if len(values) < window:
+        return None
+    return _nanmax(values[-window:])
 
 
 def calculate_volume_ratio(volumes: pd.Series, period: int = 20) -> float:
@@ -258,7 +409,199 @@ def calculate_distance_from_sma(price: float, sma: float) -> float:
     return ((price - sma) / sma) * 100
 
 
-def classify_phase(price_data: pd.DataFrame, current_price: float) -> Dict[str, any]:
+@njit(cache=True)
+def _window_mean(values: np.ndarray, end: int, period: int) -> float:
+    """Mean of values[end - period:end] (NaN if any value is missing)."""
+    total = 0.0
+    for i in range(end - period, end):
+        total += values[i]
+    return total / period
+
+
+@njit(cache=True)
+def _has_full_window(values: np.ndarray, period: int) -> bool:
+    """True if some run of `period` consecutive values has no NaN."""
+    run = 0
+    for i in range(values.shape[0]):
+        if np.isnan(values[i]):
+            run = 0
+        else:
+            run += 1
+            if run >= period:
+                return True
+    return False
+
+
+@njit(cache=True)
+def _sma_tail(values: np.ndarray, period: int, periods: int):
+    """Latest SMA and calculate_slope of its last `periods` values, in one pass.
+
+    The trailing SMA windows are streamed with a running sum (NaN values are
+    counted, not summed, so a window is NaN only while it holds one).
+
+    Returns:
+        Tuple of (latest SMA or NaN, slope as percentage per day)
+    """
+    n = values.shape[0]
+    first_end = max(n - periods + 1, period)
+    if first_end > n:
+        return np.nan, 0.0
+
+    total = 0.0
+    missing = 0
+    for i in range(first_end - period, first_end):
+        if np.isnan(values[i]):
+            missing += 1
+        else:
+            total += values[i]
+
+    ys = np.empty(periods)
+    m = 0
+    sma = np.nan
+    for end in range(first_end, n + 1):
+        if end > first_end:
+            new = values[end - 1]
+            old = values[end - 1 - period]
+            if np.isnan(new):
+                missing += 1
+            else:
+                total += new
+            if np.isnan(old):
+                missing -= 1
+            else:
+                total -= old
+        if missing == 0:
+            sma = total / period
+            ys[m] = sma
+            m += 1
+        else:
+            sma = np.nan
+
+    if m < 2:
+        return sma, 0.0
+
+    x_mean = (m - 1) / 2.0
+    y_mean = 0.0
+    for i in range(m):
+        y_mean += ys[i]
+    y_mean /= m
+
+    num = 0.0
+    den = 0.0
+    for i in range(m):
+        dx = i - x_mean
+        num += dx * (ys[i] - y_mean)
+        den += dx * dx
+
+    if y_mean == 0:
+        return sma, 0.0
+    return sma, (num / den / y_mean) * 100
+
+
+@njit(cache=True)
+def phase_levels(low: np.ndarray, close: np.ndarray, current_price: float):
+    """Phase code, 50/200 SMAs and 10-day swing low in one pass.
+
+    Same phase as classify_phase (which also builds reasons, confidence and
+    volume/volatility stats) for callers that only need the levels.
+
+    Args:
+        low: Daily lows (float32 or float64; sums accumulate in float64)
+        close: Daily closes (float32 or float64)
+        current_price: Current stock price
+
+    Returns:
+        Tuple of (phase, sma_50, sma_200, recent_low); phase is 0 and the
+        SMAs 0.0 when there are fewer than 200 bars or no full SMA window.
+        recent_low skips NaN (NaN if all of the last 10 lows are missing).
+    """
+    n = close.shape[0]
+
+    recent_low = np.nan
+    for i in range(max(0, n - 10), n):
+        v = low[i]
+        if not np.isnan(v) and (np.isnan(recent_low) or v < recent_low):
+            recent_low = v
+
+    if n < 200:
+        return 0, 0.0, 0.0, recent_low
+
+    sma_50, slope_50 = _sma_tail(close, 50, 20)
+    sma_200 = _window_mean(close, n, 200)
+    if ((np.isnan(sma_50) and not _has_full_window(close, 50)) or
+            (np.isnan(sma_200) and not _has_full_window(close, 200))):
+        return 0, 0.0, 0.0, recent_low
+
+    if current_price < sma_50 and current_price < sma_200 and sma_50 < sma_200:
+        phase = 4
+    elif current_price > sma_50 and sma_50 > sma_200 and slope_50 > 0:
+        phase = 2
+    elif current_price > sma_50 and sma_50 != 0 and (current_price - sma_50) / sma_50 * 100 > 25:
+        phase = 3
+    else:
+        phase = 1
+
+    return phase, sma_50, sma_200, recent_low
+
+
+@njit(cache=True)
+def _phase_core(close: np.ndarray):
+    """Numeric core of classify_phase.
+
+    Args:
+        close: Daily closes as float64
+
+    Returns:
+        Tuple of (has_smas, sma_50, sma_150, sma_200, slope_50, slope_200):
+        latest SMA values (sma_150 is 0.0 without a full 150-bar window) and
+        calculate_slope of the last 20 SMA values. has_smas is False, with
+        everything else 0.0, when no full 50 or 200-bar window exists.
+    """
+    if not (_has_full_window(close, 50) and _has_full_window(close, 200)):
+        return False, 0.0, 0.0, 0.0, 0.0, 0.0
+
+    n = close.shape[0]
+    sma_50, slope_50 = _sma_tail(close, 50, 20)
+    sma_200, slope_200 = _sma_tail(close, 200, 20)
+    sma_150 = _window_mean(close, n, 150) if _has_full_window(close, 150) else 0.0
+    return True, sma_50, sma_150, sma_200, slope_50, slope_200
+
+
+@njit(cache=True)
+def _phase_core_batch(closes: np.ndarray, lengths: np.ndarray):
+    """_phase_core for every row of a (tickers, bars) matrix, in one call.
+
+    Row i holds its lengths[i] closes right-aligned (front-padded with NaN);
+    only those trailing values are passed to _phase_core.
+
+    Returns:
+        Tuple of (has_smas bool array, (tickers, 5) array of sma_50, sma_150,
+        sma_200, slope_50, slope_200)
+    """
+    n_rows, n_bars = closes.shape
+    has_smas = np.zeros(n_rows, dtype=np.bool_)
+    levels = np.zeros((n_rows, 5))
+    for i in range(n_rows):
+        ok, sma_50, sma_150, sma_200, slope_50, slope_200 = _phase_core(
+            closes[i, n_bars - lengths[i]:]
+        )
+        has_smas[i] = ok
+        levels[i, 0] = sma_50
+        levels[i, 1] = sma_150
+        levels[i, 2] = sma_200
+        levels[i, 3] = slope_50
+        levels[i, 4] = slope_200
+    return has_smas, levels
+
+
+# (symbol, last bar, bar count, current price) -> classify_phase result
+_PHASE_CACHE: "OrderedDict[Tuple[Hashable, ...], Dict[str, any]]" = OrderedDict()
+_PHASE_CACHE_SIZE = 4096
+_PHASE_CACHE_LOCK = threading.Lock()
+
+
+def classify_phase(price_data: pd.DataFrame, current_price: float,
+                   symbol: Optional[str] = None) -> Dict[str, any]:
     """Classify current market phase (1-4) based on price action rules.
 
     Phase 1: Base Building / Compression
@@ -288,10 +631,90 @@ def classify_phase(price_data: pd.DataFrame, current_price: float) -> Dict[str,
     Args:
         price_data: DataFrame with OHLCV data
         current_price: Current stock price
+        symbol: Ticker of price_data; when given, the result is memoized for
+            the process keyed on (symbol, last bar, bar count, current_price)
 
     Returns:
         Dict with phase info
     """
+    if symbol is None or len(price_data) < 200:
+        return _classify_phase(price_data, current_price)
+
+    key = (symbol, price_data.index[-1], len(price_data), current_price)
+    with _PHASE_CACHE_LOCK:
+        cached = _PHASE_CACHE.get(key)
+        if cached is not None:
+            _PHASE_CACHE.move_to_end(key)
+            return _copy_phase(cached)
+
+    result = _classify_phase(price_data, current_price)
+    _remember_phase(key, result)
+    return _copy_phase(result)
+
+
+def _copy_phase(result: Dict[str, any]) -> Dict[str, any]:
+    """Copy of a memoized result that callers may mutate, nested containers included."""
+    copied = dict(result)
+    copied['reasons'] = list(result['reasons'])
+    if 'volatility_contraction' in result:
+        copied['volatility_contraction'] = dict(result['volatility_contraction'])
+    return copied
+
+
+def _remember_phase(key: Tuple[Hashable, ...], result: Dict[str, any]) -> None:
+    """Store a classify_phase result in the LRU memo."""
+    with _PHASE_CACHE_LOCK:
+        _PHASE_CACHE[key] = result
+        _PHASE_CACHE.move_to_end(key)
+        if len(_PHASE_CACHE) > _PHASE_CACHE_SIZE:
+            _PHASE_CACHE.popitem(last=False)
+
+
+def classify_phase_batch(price_data: Dict[str, pd.DataFrame],
+                         current_prices: Optional[Dict[str, float]] = None
+                         ) -> Dict[str, Dict[str, any]]:
+    """Classify many tickers, running the numeric core in one compiled call.
+
+    Results match classify_phase(frame, price, symbol=ticker) and are stored
+    in the same memo, so later per-ticker calls with the same frame and price
+    are cache hits.
+
+    Args:
+        price_data: Ticker -> OHLCV DataFrame
+        current_prices: Ticker -> current price (default: last Close)
+
+    Returns:
+        Ticker -> phase info dict
+    """
+    prices = {
+        ticker: (current_prices[ticker] if current_prices and ticker in current_prices
+                 else frame['Close'].iloc[-1])
+        for ticker, frame in price_data.items()
+    }
+    eligible = [ticker for ticker, frame in price_data.items() if len(frame) >= 200]
+
+    cores = {}
+    if eligible:
+        lengths = np.array([len(price_data[t]) for t in eligible], dtype=np.int64)
+        closes = np.full((len(eligible), lengths.max()), np.nan)
+        for row, ticker in enumerate(eligible):
+            closes[row, closes.shape[1] - lengths[row]:] = price_data[ticker]['Close'].to_numpy(dtype=np.float64)
+        has_smas, levels = _phase_core_batch(closes, lengths)
+        for row, ticker in enumerate(eligible):
+            cores[ticker] = (bool(has_smas[row]), *levels[row].tolist())
+
+    results = {}
+    for ticker, frame in price_data.items():
+        result = _classify_phase(frame, prices[ticker], cores.get(ticker))
+        if ticker in cores:
+            _remember_phase((ticker, frame.index[-1], len(frame), prices[ticker]), result)
+        results[ticker] = _copy_phase(result)
+    return results
+
+
+def _classify_phase(price_data: pd.DataFrame, current_price: float,
+                    core: Optional[Tuple] = None) -> Dict[str, any]:
+    """classify_phase without memoization (core: precomputed _phase_core output)."""
     if len(price_data) < 200:
         return {
             'phase': 0,
@@ -300,17 +723,18 @@ def classify_phase(price_data: pd.DataFrame, current_price: float) -> Dict[str,
             'reasons': ['Need at least 200 days of data']
         }
 
-    close = price_data['Close']
-    high = price_data['High']
-    low = price_data['Low']
-    volume = price_data.get('Volume', pd.Series([]))
-
-    # Calculate SMAs (50, 150, 200 for Minervini Trend Template)
-    sma_50 = calculate_sma(close, 50)
-    sma_150 = calculate_sma(close, 150)
-    sma_200 = calculate_sma(close, 200)
-
-    if sma_50.isna().all() or sma_200.isna().all():
+    # Pull each column out of the frame once; everything below works on ndarrays
+    close = price_data['Close'].to_numpy(dtype=np.float64)
+    high = price_data['High'].to_numpy(dtype=np.float64)
+    low = price_data['Low'].to_numpy(dtype=np.float64)
+    volume = _column(price_data, 'Volume')
+
+    # Calculate SMAs (50, 150, 200 for Minervini Trend Template) and the
+    # 50/200 slopes in one compiled pass
+    if core is None:
+        core = _phase_core(close)
+    has_smas, sma_50_val, sma_150_val, sma_200_val, slope_50, slope_200 = core
+    if not has_smas:
         return {
             'phase': 0,
             'phase_name': 'Insufficient Data',
@@ -318,29 +742,21 @@ def classify_phase(price_data: pd.DataFrame, current_price: float) -> Dict[str,
             'reasons': ['Cannot calculate SMAs']
         }
 
-    sma_50_val = sma_50.iloc[-1]
-    sma_150_val = sma_150.iloc[-1] if not sma_150.isna().all() else 0
-    sma_200_val = sma_200.iloc[-1]
-
     # Calculate 52-week high/low for Minervini criteria
     if len(close) >= 252:  # ~1 year of trading days
-        week_52_high = high.iloc[-252:].max()
-        week_52_low = low.iloc[-252:].min()
+        week_52_high = _nanmax(high[-252:])
+        week_52_low = _nanmin(low[-252:])
     else:
-        week_52_high = high.max()
-        week_52_low = low.min()
-
-    # Calculate slopes
-    slope_50 = calculate_slope(sma_50, 20)
-    slope_200 = calculate_slope(sma_200, 20)
+        week_52_high = _nanmax(high)
+        week_52_low = _nanmin(low)
 
     # Volatility analysis
-    vol_data = detect_volatility_contraction(close, 20)
+    vol_data = _volatility_contraction(close, 20)
 
     # Volume analysis
     if len(volume) > 20:
-        avg_volume = volume.iloc[-20:].mean()
-        current_volume = volume.iloc[-1]
+        avg_volume = _nanmean(volume[-20:])
+        current_volume = volume[-1]
         volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
     else:
         volume_ratio = 1.0
@@ -825,12 +1241,12 @@ def detect_breakout(price_data: pd.DataFrame, current_price: float,
             'volume_confirmed': False
         }
 
-    close = price_data['Close']
-    volume = price_data.get('Volume', pd.Series([]))
+    close = price_data['Close'].to_numpy(dtype=np.float64)
+    volume = _column(price_data, 'Volume')
 
     # Find resistance levels
-    base_high = find_base_high(close, 60)
-    pivot_high = find_pivot_high(close, 20)
+    base_high = _trailing_high(close, 60)
+    pivot_high = _trailing_high(close, 20)
     sma_50 = phase_info.get('sma_50')
 
     breakout_level = None
@@ -840,8 +1256,8 @@ def detect_breakout(price_data: pd.DataFrame, current_price: float,
     # Check volume confirmation (Minervini requires 50-100%+ above average)
     volume_confirmed = False
     if len(volume) > 20:
-        avg_volume_20d = volume.iloc[-21:-1].mean()
-        current_volume = volume.iloc[-1]
+        avg_volume_20d = _nanmean(volume[-21:-1])
+        current_volume = volume[-1]
         volume_ratio = current_volume / avg_volume_20d if avg_volume_20d > 0 else 1.0
         volume_confirmed = volume_ratio >= 1.5  # 50%+ above average
 
@@ -870,7 +1286,7 @@ def detect_breakout(price_data: pd.DataFrame, current_price: float,
     # Check breakout above 50 SMA
     elif not is_breakout and sma_50 and current_price > sma_50:
         # Only count if recently crossed
-        if close.iloc[-2] < sma_50 < current_price:
+        if close[-2] < sma_50 < current_price:
             is_breakout = True
             breakout_level = sma_50
             breakout_type = '50 SMA Breakout'
@@ -105,7 +105,7 @@ class QuantAnalysisEngine:
             current_price = price_data['Close'].iloc[-1]
 
             # Classify phase
-            phase_info = classify_phase(price_data, current_price)
+            phase_info = classify_phase(price_data, current_price, symbol=ticker)
 
             # Calculate relative strength vs SPY
             rs_series = calculate_relative_strength(
@@ -10,6 +10,7 @@ from typing import Dict, List, Optional
 import numpy as np
 import pandas as pd
 
+from ..jit import njit
 from .phase_indicators import (
     calculate_volume_ratio,
     calculate_rs_slope,
@@ -26,6 +27,58 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True)
+def _up_down_volume(close: np.ndarray, volume: np.ndarray, days: int = 5):
+    """Average volume on up days vs down days over the last `days` sessions.
+
+    A session counts as an up day when its close is above the prior close;
+    everything else (including unchanged) counts as a down day.
+
+    Closes may be float32 or float64; volume sums accumulate in float64.
+
+    Returns:
+        Tuple of (avg_vol_up, avg_vol_down), 0.0 when no days of that kind
+    """
+    n = close.shape[0]
+    up_days = 0
+    down_days = 0
+    volume_on_up_days = 0.0
+    volume_on_down_days = 0.0
+
+    for j in range(n - days, n):
+        if close[j] - close[j - 1] > 0:
+            up_days += 1
+            volume_on_up_days += volume[j]
+        else:
+            down_days += 1
+            volume_on_down_days += volume[j]
+
+    avg_vol_up = volume_on_up_days / up_days if up_days > 0 else 0.0
+    avg_vol_down = volume_on_down_days / down_days if down_days > 0 else 0.0
+    return avg_vol_up, avg_vol_down
+
+
+@njit(cache=True)
+def _trailing_max(values: np.ndarray, window: int) -> float:
+    """NaN-skipping max of the last `window` values (NaN if all missing)."""
+    result = np.nan
+    for j in range(values.shape[0] - window, values.shape[0]):
+        v = values[j]
+        if not np.isnan(v) and (np.isnan(result) or v > result):
+            result = v
+    return result
+
+
+def _trailing_min(values: np.ndarray, window: int) -> float:
+    """NaN-skipping min of the last `window` values (all of them if fewer).
+
+    Plain NumPy on the raw array: pandas' Series slicing and reduction
+    dispatch cost far more than the arithmetic on a handful of values.
+    NaN if every value is missing.
+    """
+    return float(np.fmin.reduce(values[-window:], initial=np.nan))
+
+
 def calculate_stop_loss(
     price_data: pd.DataFrame,
     current_price: float,
@@ -53,10 +106,7 @@ def calculate_stop_loss(
     if phase == 2:
         # Stage 2: Use 50 SMA or recent swing low, whichever is higher (tighter stop)
         # Look for lowest low in last 10 days (recent pullback low)
-        if len(price_data) >= 10:
-            recent_low = price_data['Low'].iloc[-10:].min()
-        else:
-            recent_low = price_data['Low'].min()
+        recent_low = _trailing_min(price_data['Low'].to_numpy(), 10)
 
         # Stop should be below recent low with buffer (0.5%)
         swing_low_stop = recent_low * 0.995
@@ -77,10 +127,7 @@ def calculate_stop_loss(
     else:  # Phase 1
         # Stage 1: Stop below base/consolidation low
         # Use lowest low in last 30 days (base low)
-        if len(price_data) >= 30:
-            base_low = price_data['Low'].iloc[-30:].min()
-        else:
-            base_low = price_data['Low'].min()
+        base_low = _trailing_min(price_data['Low'].to_numpy(), 30)
 
         # Stop below base low with buffer (1%)
         stop_loss = base_low * 0.99
@@ -380,30 +427,11 @@ def score_buy_signal(
 
     if 'Volume' in price_data.columns and len(price_data) >= 30:
         # Look at last 5 days to understand volume context
-        recent_prices = price_data['Close'].iloc[-6:]  # 6 days to get 5 changes
-        recent_volume = price_data['Volume'].iloc[-5:]
-        avg_volume = price_data['Volume'].iloc[-30:-5].mean()
-
-        # Calculate price change context
-        up_days = 0
-        down_days = 0
-        volume_on_up_days = 0
-        volume_on_down_days = 0
-
-        for i in range(1, len(recent_prices)):
-            price_change = recent_prices.iloc[i] - recent_prices.iloc[i-1]
-            vol = recent_volume.iloc[i-1]
-
-            if price_change > 0:
-                up_days += 1
-                volume_on_up_days += vol
-            else:
-                down_days += 1
-                volume_on_down_days += vol
-
-        # Average volume on up vs down days
-        avg_vol_up = (volume_on_up_days / up_days) if up_days > 0 else 0
-        avg_vol_down = (volume_on_down_days / down_days) if down_days > 0 else 0
+        avg_vol_up, avg_vol_down = _up_down_volume(
+            price_data['Close'].to_numpy(),
+            # float64: share counts above 2**24 are inexact in float32
+            price_data['Volume'].to_numpy(dtype=np.float64)
+        )
 
         # Score based on volume ratio - LINEAR
         # Formula: 5 + (vol_ratio - 1) * 10, range 0-10
@@ -812,7 +840,7 @@ def score_sell_signal(
     # Check for failed breakout
     close = price_data['Close']
     if len(close) >= 20:
-        recent_high = close.iloc[-20:].max()
+        recent_high = _trailing_max(close.to_numpy(), 20)
         if recent_high > sma_50 and current_price < sma_50:
             score += 10
             reasons.append('Failed breakout - closed back inside base')
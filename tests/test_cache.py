@@ -0,0 +1,186 @@
+"""Tests for the on-disk API response cache."""
+
+import os
+import threading
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from src.data import cache as cache_module
+from src.data.cache import FUNDAMENTALS_TTL, MAX_TTL, PRICE_TTL, FileCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Cache directory that does not exist yet."""
+    return tmp_path / 'api'
+
+
+@pytest.fixture
+def cache(cache_dir):
+    """Enabled FileCache over a temporary directory."""
+    return FileCache(str(cache_dir))
+
+
+def _age(path, seconds):
+    """Set path's mtime to the given number of seconds ago."""
+    mtime = time.time() - seconds
+    os.utime(path, (mtime, mtime))
+
+
+def _today(monkeypatch, day):
+    """Patch date.today() as seen by the cache module."""
+    class FixedDate(date):
+        @classmethod
+        def today(cls):
+            return day
+    monkeypatch.setattr(cache_module, 'date', FixedDate)
+
+
+class TestMakeKey:
+    """Test suite for cache key date bucketing."""
+
+    def test_daily_key_rolls_each_day(self, monkeypatch):
+        """Test a 1-day TTL gives one key per day."""
+        _today(monkeypatch, date(2026, 3, 4))
+        key = FileCache.make_key('AAPL', 'history_1y', PRICE_TTL)
+        assert key == 'AAPL:history_1y:20260304'
+
+        _today(monkeypatch, date(2026, 3, 5))
+        assert FileCache.make_key('AAPL', 'history_1y', PRICE_TTL) != key
+
+    def test_weekly_key_shared_across_window(self, monkeypatch):
+        """Test a 7-day TTL shares one key for its whole window."""
+        keys = set()
+        start = date.fromordinal(date(2026, 3, 4).toordinal() // 7 * 7)
+        for offset in range(7):
+            _today(monkeypatch, start + timedelta(days=offset))
+            keys.add(FileCache.make_key('AAPL', 'fmp_fundamentals', FUNDAMENTALS_TTL))
+        assert keys == {f"AAPL:fmp_fundamentals:{start:%Y%m%d}"}
+
+        _today(monkeypatch, start + timedelta(days=7))
+        assert FileCache.make_key('AAPL', 'fmp_fundamentals', FUNDAMENTALS_TTL) not in keys
+
+    def test_sub_day_ttl_buckets_daily(self, monkeypatch):
+        """Test TTLs under a day still bucket by day."""
+        _today(monkeypatch, date(2026, 3, 4))
+        assert FileCache.make_key('AAPL', 'quote', timedelta(hours=1)).endswith(':20260304')
+
+
+class TestGetSet:
+    """Test suite for reads, writes and the TTL check."""
+
+    def test_round_trip(self, cache, cache_dir):
+        """Test a stored value is returned and the directory is created."""
+        cache.set('AAPL:x:1', {'close': [1.0, 2.0]})
+
+        assert cache_dir.is_dir()
+        assert cache.get('AAPL:x:1', PRICE_TTL) == {'close': [1.0, 2.0]}
+        assert cache.get('MSFT:x:1', PRICE_TTL) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_ttl_by_mtime(self, cache):
+        """Test entries older than the lookup TTL miss, younger ones hit."""
+        cache.set('AAPL:x:1', 1)
+        _age(cache._path('AAPL:x:1'), 2 * 86400)
+
+        assert cache.get('AAPL:x:1', PRICE_TTL) is None
+        assert cache.get('AAPL:x:1', FUNDAMENTALS_TTL) == 1
+
+    def test_set_replaces_atomically(self, cache, cache_dir):
+        """Test overwriting an entry leaves no temp files behind."""
+        cache.set('AAPL:x:1', 1)
+        cache.set('AAPL:x:1', 2)
+
+        assert cache.get('AAPL:x:1', PRICE_TTL) == 2
+        assert [p.suffix for p in cache_dir.iterdir()] == ['.pkl']
+
+    def test_failed_write_keeps_old_entry(self, cache):
+        """Test an unpicklable value does not clobber the stored one."""
+        cache.set('AAPL:x:1', 1)
+        cache.set('AAPL:x:1', lambda: None)
+
+        assert cache.get('AAPL:x:1', PRICE_TTL) == 1
+
+    def test_corrupt_entry_is_a_miss(self, cache):
+        """Test an unreadable file counts as a miss."""
+        cache.set('AAPL:x:1', 1)
+        cache._path('AAPL:x:1').write_bytes(b'not a pickle')
+
+        assert cache.get('AAPL:x:1', PRICE_TTL) is None
+        assert cache.misses == 1
+
+    def test_disabled(self, cache_dir):
+        """Test a disabled cache never writes or hits."""
+        cache = FileCache(str(cache_dir), enabled=False)
+        cache.set('AAPL:x:1', 1)
+
+        assert cache.get('AAPL:x:1', PRICE_TTL) is None
+        assert not cache_dir.exists()
+
+    def test_counters_are_thread_safe(self, cache):
+        """Test concurrent lookups count every hit and miss."""
+        cache.set('HIT', 1)
+
+        def lookups():
+            for _ in range(200):
+                cache.get('HIT', PRICE_TTL)
+                cache.get('MISS', PRICE_TTL)
+
+        threads = [threading.Thread(target=lookups) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert (cache.hits, cache.misses) == (1600, 1600)
+
+
+class TestPrune:
+    """Test suite for expiring old cache files."""
+
+    def test_prune_removes_expired_files(self, cache, cache_dir):
+        """Test files older than max_age (and stray temp files) are deleted."""
+        for key in ('OLD', 'NEW'):
+            cache.set(key, key)
+        stray_tmp = cache_dir / 'abc.pkl.123.tmp'
+        stray_tmp.write_bytes(b'')
+        other = cache_dir / 'notes.txt'
+        other.write_text('kept')
+        for path in (cache._path('OLD'), stray_tmp, other):
+            _age(path, MAX_TTL.total_seconds() + 60)
+
+        assert cache.prune() == 2
+        assert cache.get('NEW', MAX_TTL) == 'NEW'
+        assert not cache._path('OLD').exists()
+        assert not stray_tmp.exists()
+        assert other.exists()
+
+    def test_prune_on_open(self, cache, cache_dir):
+        """Test opening a cache prunes expired files."""
+        cache.set('OLD', 1)
+        _age(cache._path('OLD'), MAX_TTL.total_seconds() + 60)
+
+        FileCache(str(cache_dir))
+        assert not cache._path('OLD').exists()
+
+    def test_custom_max_age(self, cache_dir):
+        """Test max_age bounds what prune keeps."""
+        cache = FileCache(str(cache_dir), max_age=timedelta(hours=1))
+        cache.set('A', 1)
+        _age(cache._path('A'), 2 * 3600)
+
+        assert cache.prune() == 1
+
+    def test_prune_missing_directory(self, cache):
+        """Test pruning a cache that never wrote anything is a no-op."""
+        assert cache.prune() == 0
+
+    def test_clear(self, cache):
+        """Test clear removes every entry."""
+        cache.set('A', 1)
+        cache.set('B', 2)
+
+        assert cache.clear() == 2
+        assert cache.get('A', PRICE_TTL) is None
@@ -0,0 +1,93 @@
+"""Tests for the long-term compounder scoring engine."""
+
+import numpy as np
+import pytest
+
+from src.long_term.compounder_engine import CompounderEngine
+
+SCORE_FIELDS = (
+    'total_score', 'fundamental_score', 'rs_persistence_score',
+    'trend_durability_score', 'moat_bonus'
+)
+
+
+def _random_inputs(n, seed):
+    """Column arrays spanning every scoring threshold, plus some bad prices."""
+    rng = np.random.default_rng(seed)
+    fundamentals = {
+        'revenue_cagr_3yr': rng.uniform(-0.2, 0.4, n),
+        'revenue_cagr_5yr': rng.uniform(-0.2, 0.4, n),
+        'eps_cagr_3yr': rng.uniform(-0.3, 0.5, n),
+        'roic': rng.uniform(-0.1, 0.5, n),
+        'roic_wacc_spread': rng.uniform(-0.1, 0.3, n),
+        'fcf_margin': rng.uniform(-0.1, 0.4, n),
+        'debt_to_ebitda': rng.uniform(0, 8, n),
+        'interest_coverage': rng.uniform(0, 25, n),
+    }
+    current_price = rng.uniform(1, 600, n)
+    current_price[::50] = 20000.0  # above max_price
+    price_data = {
+        'current_price': current_price,
+        'returns_1yr': rng.normal(0.1, 0.3, n),
+        'returns_3yr': rng.normal(0.08, 0.15, n),
+        'returns_5yr': rng.normal(0.08, 0.1, n),
+        'max_drawdown_3yr': rng.uniform(-0.7, 0, n),
+        'spy_max_drawdown_3yr': rng.uniform(-0.35, -0.1, n),
+        'price_40w_ma': current_price * rng.uniform(0.7, 1.3, n),
+        'ma_slope_40w': rng.uniform(-0.1, 0.25, n),
+        'months_uptrend': rng.uniform(0, 48, n),
+    }
+    return fundamentals, price_data
+
+
+def _row(columns, i):
+    """Row i of column arrays as a score_stock input dict."""
+    return {key: float(values[i]) for key, values in columns.items()}
+
+
+class TestScoreStocksBatch:
+    """Test suite for score_stocks_batch against score_stock."""
+
+    @pytest.mark.parametrize('missing_fundamentals, missing_prices', [
+        ((), ()),
+        # Defaults differ: debt_to_ebitda is 5.0 for scoring, 0.0 for regime
+        (('debt_to_ebitda', 'interest_coverage'), ()),
+        (('roic', 'eps_cagr_3yr'), ('spy_max_drawdown_3yr', 'months_uptrend', 'ma_slope_40w')),
+    ])
+    def test_matches_score_stock(self, missing_fundamentals, missing_prices):
+        """Test batch scores and regimes equal per-stock results."""
+        n = 1000
+        fundamentals, price_data = _random_inputs(n, seed=len(missing_fundamentals))
+        for key in missing_fundamentals:
+            del fundamentals[key]
+        for key in missing_prices:
+            del price_data[key]
+        engine = CompounderEngine()
+
+        batch = engine.score_stocks_batch(fundamentals, price_data)
+
+        assert batch['valid'].sum() < n
+        for i in range(n):
+            score = engine.score_stock(f'T{i}', _row(fundamentals, i), _row(price_data, i))
+            assert (score is not None) == batch['valid'][i], i
+            if score is None:
+                continue
+            assert batch['regime'][i] == score.regime, i
+            for field in SCORE_FIELDS:
+                assert batch[field][i] == pytest.approx(getattr(score, field), abs=1e-9), (i, field)
+
+    def test_all_regimes_covered(self):
+        """Test the random inputs exercise every regime."""
+        fundamentals, price_data = _random_inputs(1000, seed=0)
+        batch = CompounderEngine().score_stocks_batch(fundamentals, price_data)
+
+        assert set(batch['regime'][batch['valid']]) == {
+            'STRUCTURAL_GROWTH', 'MATURE_HOLD', 'CAPITAL_DESTRUCTION'
+        }
+
+    def test_empty(self):
+        """Test empty columns give empty results."""
+        batch = CompounderEngine().score_stocks_batch({}, {'current_price': np.array([])})
+
+        assert len(batch['total_score']) == 0
+        assert len(batch['valid']) == 0
@@ -0,0 +1,126 @@
+"""Tests for EnhancedFundamentalsFetcher batch fetching and the FMP budget."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from src.data import enhanced_fundamentals
+from src.data.enhanced_fundamentals import EnhancedFundamentalsFetcher, FMP_CALLS_PER_STOCK
+
+
+@pytest.fixture
+def yf_calls(monkeypatch):
+    """Record yfinance fallbacks instead of hitting the network."""
+    calls = []
+    lock = threading.Lock()
+
+    def fake_yfinance(ticker):
+        with lock:
+            calls.append(ticker)
+        return {'source': 'yfinance', 'ticker': ticker}
+
+    monkeypatch.setattr(enhanced_fundamentals, 'fetch_quarterly_financials', fake_yfinance)
+    return calls
+
+
+@pytest.fixture
+def fetcher(tmp_path, monkeypatch):
+    """Fetcher with a stub FMP client and no on-disk cache."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv('FMP_API_KEY', raising=False)
+    fetcher = EnhancedFundamentalsFetcher(use_cache=False)
+
+    fetcher.fmp_available = True
+    fetcher.fmp_fetcher = Mock()
+    fetcher.fmp_fetcher.fetch_comprehensive_fundamentals.side_effect = (
+        lambda ticker: {'income_statement': [{'symbol': ticker}]}
+    )
+    monkeypatch.setattr(
+        fetcher, '_convert_fmp_to_standard',
+        lambda data: {'source': 'fmp', 'ticker': data['income_statement'][0]['symbol']}
+    )
+    return fetcher
+
+
+class TestFetchQuarterlyDataBatch:
+    """Dedup and FMP daily-limit behaviour of fetch_quarterly_data_batch."""
+
+    def test_empty(self, fetcher, yf_calls):
+        assert fetcher.fetch_quarterly_data_batch([]) == {}
+
+    def test_duplicates_fetched_once(self, fetcher, yf_calls):
+        results = fetcher.fetch_quarterly_data_batch(['AAPL', 'MSFT', 'AAPL'])
+
+        assert list(results) == ['AAPL', 'MSFT']
+        assert fetcher.fmp_fetcher.fetch_comprehensive_fundamentals.call_count == 2
+        assert fetcher.fmp_call_count == 2 * FMP_CALLS_PER_STOCK
+        assert all(results[t] == {'source': 'fmp', 'ticker': t} for t in results)
+
+    def test_daily_limit_falls_back_to_yfinance(self, fetcher, yf_calls):
+        fetcher.fmp_daily_limit = 3 * FMP_CALLS_PER_STOCK
+        tickers = [f'T{i}' for i in range(10)]
+
+        results = fetcher.fetch_quarterly_data_batch(tickers)
+
+        assert list(results) == tickers
+        sources = [r['source'] for r in results.values()]
+        assert sources.count('fmp') == 3
+        assert sorted(yf_calls) == sorted(t for t in tickers if results[t]['source'] == 'yfinance')
+        assert fetcher.fmp_call_count == fetcher.fmp_daily_limit
+
+    def test_partial_budget_is_not_overspent(self, fetcher, yf_calls):
+        """A remaining budget smaller than one stock's calls is never used."""
+        fetcher.fmp_daily_limit = FMP_CALLS_PER_STOCK + 1
+
+        results = fetcher.fetch_quarterly_data_batch(['AAPL', 'MSFT'])
+
+        assert [r['source'] for r in results.values()].count('fmp') == 1
+        assert fetcher.fmp_call_count == FMP_CALLS_PER_STOCK
+
+    def test_without_fmp_uses_yfinance(self, fetcher, yf_calls):
+        results = fetcher.fetch_quarterly_data_batch(['AAPL', 'MSFT'], use_fmp=False)
+
+        assert sorted(yf_calls) == ['AAPL', 'MSFT']
+        assert fetcher.fmp_call_count == 0
+        fetcher.fmp_fetcher.fetch_comprehensive_fundamentals.assert_not_called()
+        assert results['AAPL']['source'] == 'yfinance'
+
+
+class TestCreateSnapshot:
+    """FMP payload reuse between fetch_quarterly_data and create_snapshot."""
+
+    def test_reuses_fetched_payload(self, fetcher, yf_calls):
+        """Test the snapshot uses the payload fetch_quarterly_data fetched."""
+        data = fetcher.fetch_quarterly_data('AAPL', use_fmp=True)
+        data['data_source'] = 'fmp'
+
+        fetcher.create_snapshot('AAPL', data)
+
+        fetcher.fmp_fetcher.fetch_comprehensive_fundamentals.assert_called_once_with('AAPL')
+        fetcher.fmp_fetcher.create_enhanced_snapshot.assert_called_once_with(
+            'AAPL', {'income_statement': [{'symbol': 'AAPL'}]}
+        )
+
+    def test_standard_format_has_no_raw_payload(self):
+        """Test the converted dict carries only standard-format fields."""
+        payload = {
+            'ticker': 'AAPL',
+            'fetch_date': '2024-11-01',
+            'income_statement': [{'revenue': 100.0, 'eps': 1.0, 'grossProfitRatio': 0.4}],
+            'balance_sheet': [],
+        }
+
+        data = EnhancedFundamentalsFetcher._convert_fmp_to_standard(None, payload)
+
+        assert data['data_source'] == 'fmp'
+        assert data['latest_revenue'] == 100.0
+        assert not any(key.startswith('_') for key in data)
+        assert payload not in data.values()
+
+    def test_unfetched_ticker_fetches_payload(self, fetcher, yf_calls):
+        """Test a ticker without a stored payload is fetched for the snapshot."""
+        fetcher.create_snapshot('MSFT', {'data_source': 'fmp', 'ticker': 'MSFT'})
+
+        fetcher.fmp_fetcher.fetch_comprehensive_fundamentals.assert_called_once_with('MSFT')
+        assert fetcher.fmp_call_count == FMP_CALLS_PER_STOCK
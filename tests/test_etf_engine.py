@@ -0,0 +1,89 @@
+"""Tests for the thematic ETF scoring engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.long_term.etf_engine import ETFEngine
+from src.long_term.etf_universe import ETFUniverse
+
+SCORE_FIELDS = (
+    'total_score', 'theme_purity_score', 'rs_persistence_score',
+    'efficiency_score', 'tailwind_score'
+)
+METADATA_FIELDS = ('top_10_concentration', 'sector_concentration', 'expense_ratio', 'turnover')
+RETURN_FIELDS = ('return_1yr', 'return_3yr', 'return_5yr')
+
+
+@pytest.fixture
+def universe(tmp_path):
+    """ETFUniverse on its built-in default themes."""
+    return ETFUniverse(themes_file=str(tmp_path / 'missing_themes.json'))
+
+
+def _random_etfs(universe, n, seed):
+    """Metadata table over every default theme plus an unknown one, with NaNs."""
+    rng = np.random.default_rng(seed)
+    theme_ids = [theme['id'] for theme in universe.themes_config['themes']] + ['unknown_theme']
+    etfs = pd.DataFrame({
+        'ticker': [f'E{i}' for i in range(n)],
+        'theme_id': rng.choice(theme_ids, n),
+        'top_10_concentration': rng.uniform(0.1, 0.9, n),
+        'sector_concentration': rng.uniform(0.5, 1.0, n),
+        'expense_ratio': rng.uniform(0, 0.01, n),
+        'turnover': rng.uniform(0, 3, n),
+    })
+    for j, key in enumerate(METADATA_FIELDS):
+        etfs.loc[j::17, key] = np.nan
+    price_data = {key: rng.normal(0.1, 0.2, n) for key in RETURN_FIELDS}
+    price_data['return_3yr'][5::23] = np.nan
+    price_data.update(spy_return_1yr=0.12, spy_return_3yr=0.09, spy_return_5yr=0.1)
+    return etfs, price_data
+
+
+def _row_price_data(price_data, i):
+    """Row i of score_etfs_batch price_data as a score_etf input dict."""
+    return {key: (value[i] if np.ndim(value) else value) for key, value in price_data.items()}
+
+
+class TestScoreETFsBatch:
+    """Test suite for score_etfs_batch against score_etf."""
+
+    @pytest.mark.parametrize('with_universe', [True, False])
+    @pytest.mark.parametrize('with_prices', [True, False])
+    def test_matches_score_etf(self, universe, with_universe, with_prices):
+        """Test batch scores equal per-ETF results, NaN metadata included."""
+        engine = ETFEngine(universe=universe if with_universe else None)
+        etfs, price_data = _random_etfs(universe, 600, seed=1)
+        if not with_prices:
+            price_data = None
+
+        batch = engine.score_etfs_batch(etfs, price_data)
+
+        assert list(batch.index) == list(etfs['ticker'])
+        for i, metadata in enumerate(etfs.to_dict('records')):
+            score = engine.score_etf(
+                metadata, _row_price_data(price_data, i) if price_data else None
+            )
+            for field in SCORE_FIELDS:
+                assert batch[field].iloc[i] == pytest.approx(getattr(score, field), abs=1e-9), \
+                    (metadata['ticker'], field)
+
+    def test_missing_columns_use_defaults(self, universe):
+        """Test absent metadata columns take score_etf's defaults."""
+        engine = ETFEngine(universe=universe)
+        etfs = pd.DataFrame({'ticker': ['A', 'B'], 'theme_id': ['ai_cloud', 'unknown_theme']})
+
+        batch = engine.score_etfs_batch(etfs)
+
+        for i, metadata in enumerate(etfs.to_dict('records')):
+            score = engine.score_etf(metadata)
+            for field in SCORE_FIELDS:
+                assert batch[field].iloc[i] == pytest.approx(getattr(score, field)), field
+
+    def test_unknown_theme_tailwind(self, universe):
+        """Test an unknown theme gets the neutral tailwind with or without a universe."""
+        etfs = pd.DataFrame({'ticker': ['X'], 'theme_id': ['unknown_theme']})
+
+        for engine in (ETFEngine(universe=universe), ETFEngine()):
+            assert engine.score_etfs_batch(etfs)['tailwind_score'].iloc[0] == 5.0
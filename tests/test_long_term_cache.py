@@ -0,0 +1,208 @@
+"""Tests for the LongTermFundamentalsFetcher on-disk cache and fetch_many."""
+
+import os
+import pickle
+import threading
+import time
+
+import pytest
+
+from src.json_io import dump_file
+from src.long_term import data_fetcher
+from src.long_term.data_fetcher import LongTermFundamentals, LongTermFundamentalsFetcher
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Temporary cache directory."""
+    return str(tmp_path / "long_term_cache")
+
+
+@pytest.fixture
+def fetcher(cache_dir, monkeypatch):
+    """Fetcher with a temporary cache and no FMP client."""
+    monkeypatch.delenv('FMP_API_KEY', raising=False)
+    return LongTermFundamentalsFetcher(cache_dir=cache_dir, cache_expiry_days=90)
+
+
+def make_fundamentals(ticker: str = "AAPL") -> LongTermFundamentals:
+    """Small LongTermFundamentals with statements and a few metrics set."""
+    return LongTermFundamentals(
+        ticker=ticker,
+        currency="USD",
+        income_statements=[{"date": "2024-09-30", "revenue": 391.0e9}],
+        balance_sheets=[{"date": "2024-09-30", "totalAssets": 365.0e9}],
+        cash_flows=[{"date": "2024-09-30", "freeCashFlow": 108.8e9}],
+        roic_3yr=0.55,
+        revenue_cagr_3yr=0.03,
+        fetched_at="2024-11-01T00:00:00",
+        data_quality_score=90.0,
+    )
+
+
+class TestCacheRoundTrip:
+    """Save and load through the pickle cache."""
+
+    def test_round_trip(self, fetcher):
+        original = make_fundamentals()
+        fetcher._save_to_cache(original)
+
+        assert os.path.exists(fetcher._cache_path("AAPL"))
+        assert fetcher._load_from_cache("AAPL") == original
+
+    def test_round_trip_new_instance(self, fetcher, cache_dir):
+        original = make_fundamentals()
+        fetcher._save_to_cache(original)
+
+        reopened = LongTermFundamentalsFetcher(cache_dir=cache_dir)
+        assert reopened._load_from_cache("AAPL") == original
+
+    def test_missing_ticker(self, fetcher):
+        assert fetcher._load_from_cache("MISSING") is None
+
+    def test_expired_entry(self, fetcher):
+        fetcher._save_to_cache(make_fundamentals())
+        old = time.time() - 100 * 86400
+        os.utime(fetcher._cache_path("AAPL"), (old, old))
+        fetcher._mtime_index.clear()
+
+        assert fetcher._load_from_cache("AAPL") is None
+
+    def test_file_written_after_init(self, fetcher, cache_dir):
+        """A .pkl created by another fetcher is found without rescanning."""
+        other = LongTermFundamentalsFetcher(cache_dir=cache_dir)
+        original = make_fundamentals("MSFT")
+        other._save_to_cache(original)
+
+        assert "MSFT" not in fetcher._mtime_index
+        assert fetcher._load_from_cache("MSFT") == original
+
+
+class TestJsonMigration:
+    """Legacy *_fundamentals.json files are converted to pickle on read."""
+
+    def test_migrates_and_keeps_mtime(self, fetcher):
+        original = make_fundamentals()
+        legacy_file = fetcher._cache_path("AAPL", ".json")
+        dump_file(original.to_dict(), legacy_file)
+        mtime = time.time() - 5 * 86400
+        os.utime(legacy_file, (mtime, mtime))
+
+        assert fetcher._load_from_cache("AAPL") == original
+
+        assert not os.path.exists(legacy_file)
+        cache_file = fetcher._cache_path("AAPL")
+        assert os.path.getmtime(cache_file) == pytest.approx(mtime)
+        assert fetcher._mtime_index["AAPL"] == pytest.approx(mtime)
+
+        # Second read comes from the pickle
+        assert fetcher._load_from_cache("AAPL") == original
+
+    def test_expired_legacy_file_is_ignored(self, fetcher):
+        legacy_file = fetcher._cache_path("AAPL", ".json")
+        dump_file(make_fundamentals().to_dict(), legacy_file)
+        old = time.time() - 100 * 86400
+        os.utime(legacy_file, (old, old))
+
+        assert fetcher._load_from_cache("AAPL") is None
+        assert os.path.exists(legacy_file)
+        assert not os.path.exists(fetcher._cache_path("AAPL"))
+
+
+class TestCompressedCache:
+    """zstd-compressed and plain pickle cache files coexist."""
+
+    def test_plain_pickle_written_without_zstd(self, fetcher, monkeypatch):
+        monkeypatch.setattr(data_fetcher, "ZSTD_AVAILABLE", False)
+        fetcher._save_to_cache(make_fundamentals())
+
+        with open(fetcher._cache_path("AAPL"), "rb") as f:
+            payload = f.read()
+        assert not payload.startswith(data_fetcher.ZSTD_MAGIC)
+        assert pickle.loads(payload)["ticker"] == "AAPL"
+
+    def test_plain_and_zstd_files_coexist(self, fetcher):
+        zstandard = pytest.importorskip("zstandard")
+
+        plain = make_fundamentals("PLAIN")
+        compressed = make_fundamentals("ZSTD")
+        with open(fetcher._cache_path("PLAIN"), "wb") as f:
+            f.write(pickle.dumps(plain.to_dict()))
+        with open(fetcher._cache_path("ZSTD"), "wb") as f:
+            f.write(zstandard.ZstdCompressor().compress(pickle.dumps(compressed.to_dict())))
+
+        assert fetcher._load_from_cache("PLAIN") == plain
+        assert fetcher._load_from_cache("ZSTD") == compressed
+
+    def test_zstd_file_without_zstandard(self, fetcher, monkeypatch):
+        """A compressed file is a cache miss, not a crash, without zstandard."""
+        monkeypatch.setattr(data_fetcher, "ZSTD_AVAILABLE", False)
+        with open(fetcher._cache_path("AAPL"), "wb") as f:
+            f.write(data_fetcher.ZSTD_MAGIC + b"\x00" * 16)
+
+        assert fetcher._load_from_cache("AAPL") is None
+
+
+class TestFetchMany:
+    """Concurrent batch fetching: dedup, cache reuse and the in-flight cap."""
+
+    @pytest.fixture
+    def recorded(self, fetcher, monkeypatch):
+        """Replace network fetches with a slow stub that records calls."""
+        calls = []
+        state = {"in_flight": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def fake_fetch(ticker, force_refresh=False):
+            with lock:
+                calls.append(ticker)
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            time.sleep(0.02)
+            with lock:
+                state["in_flight"] -= 1
+            return None if ticker == "FAIL" else make_fundamentals(ticker)
+
+        monkeypatch.setattr(fetcher, "fetch", fake_fetch)
+        return calls, state
+
+    def test_duplicates_fetched_once(self, fetcher, recorded):
+        calls, _ = recorded
+        results = fetcher.fetch_many(["AAPL", "MSFT", "AAPL", "MSFT", "NVDA"])
+
+        assert sorted(calls) == ["AAPL", "MSFT", "NVDA"]
+        assert list(results) == ["AAPL", "MSFT", "NVDA"]
+        assert all(results[t].ticker == t for t in results)
+
+    def test_fresh_cache_entries_not_fetched(self, fetcher, recorded):
+        calls, _ = recorded
+        cached = make_fundamentals("AAPL")
+        fetcher._save_to_cache(cached)
+
+        results = fetcher.fetch_many(["AAPL", "MSFT"])
+
+        assert calls == ["MSFT"]
+        assert results["AAPL"] == cached
+
+    def test_failed_fetch_maps_to_none(self, fetcher, recorded):
+        results = fetcher.fetch_many(["AAPL", "FAIL"])
+
+        assert results["FAIL"] is None
+        assert results["AAPL"].ticker == "AAPL"
+
+    def test_concurrent_fetches_capped(self, fetcher, recorded):
+        calls, state = recorded
+        fetcher._fetch_slots = threading.Semaphore(2)
+        tickers = [f"T{i}" for i in range(12)]
+
+        fetcher.fetch_many(tickers, max_workers=8)
+
+        assert sorted(calls) == sorted(tickers)
+        assert state["peak"] <= 2
+
+    def test_all_cached(self, fetcher, recorded):
+        calls, _ = recorded
+        fetcher._save_to_cache(make_fundamentals("AAPL"))
+
+        assert list(fetcher.fetch_many(["AAPL"])) == ["AAPL"]
+        assert calls == []
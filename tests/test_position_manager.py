@@ -0,0 +1,213 @@
+"""Tests for position stop-loss recommendations."""
+
+import math
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.position_manager import PositionAnalysis, PositionManager
+
+
+def _frame(n_bars, seed, last_close=100.0):
+    """Random-walk High/Low/Close frame ending at last_close."""
+    rng = np.random.default_rng(seed)
+    close = np.cumprod(1 + rng.normal(0.001, 0.02, n_bars))
+    close *= last_close / close[-1]
+    return pd.DataFrame({
+        'High': close * 1.01,
+        'Low': close * 0.99,
+        'Close': close,
+    }, index=pd.bdate_range('2024-01-02', periods=n_bars))
+
+
+def _ladder_action(gain_pct):
+    """Stop-adjustment action as the original if/elif ladder picked it."""
+    if gain_pct < 5:
+        return 'hold'
+    partial_exit_pct = min(50, max(0, (gain_pct - 15) * 2.5))
+    if partial_exit_pct > 35:
+        return 'take_major_partial_and_trail_tight'
+    if partial_exit_pct > 10:
+        return 'take_partial_and_trail'
+    if gain_pct >= 10:
+        return 'trail_to_profit'
+    return 'trail_to_breakeven'
+
+
+@pytest.fixture
+def manager():
+    """PositionManager that never touches the git or file caches."""
+    return PositionManager(use_cache=False)
+
+
+class TestStopTiers:
+    """Test suite for the gain -> stop-adjustment action tiers."""
+
+    @pytest.mark.parametrize('current_price, expected', [
+        (80.0, 'hold'),
+        (100.0, 'hold'),
+        (104.99, 'hold'),
+        (105.0, 'trail_to_breakeven'),
+        (110.0, 'trail_to_profit'),
+        (119.0, 'trail_to_profit'),
+        (120.0, 'take_partial_and_trail'),
+        (129.0, 'take_partial_and_trail'),
+        (130.0, 'take_major_partial_and_trail_tight'),
+        (160.0, 'take_major_partial_and_trail_tight'),
+    ])
+    def test_action_at_gain_edges(self, manager, current_price, expected):
+        """Test the action at 0/5/10/19/20/29/30% gain and a loss."""
+        result = manager.analyze_position(
+            'EDGE', 100.0, current_price,
+            price_data=_frame(260, seed=1, last_close=current_price), verbose=False
+        )
+
+        assert result.action == expected
+        assert result.should_adjust_stop == (expected != 'hold')
+
+    @pytest.mark.parametrize('edge', [105.0, 110.0, 119.0, 120.0, 129.0, 130.0])
+    def test_matches_ladder_around_edges(self, manager, edge):
+        """Test the tier table against the if/elif ladder one ulp either side."""
+        price_data = _frame(260, seed=2, last_close=edge)
+        for current_price in (math.nextafter(edge, -math.inf), edge, math.nextafter(edge, math.inf)):
+            gain_pct = ((current_price - 100.0) / 100.0) * 100
+            result = manager.analyze_position(
+                'EDGE', 100.0, current_price, price_data=price_data, verbose=False
+            )
+            assert result.action == _ladder_action(gain_pct), gain_pct
+
+    def test_rationale_uses_partial_exit(self, manager):
+        """Test the partial-exit percentage is filled into the description."""
+        result = manager.analyze_position(
+            'EDGE', 100.0, 125.0, price_data=_frame(260, seed=3, last_close=125.0)
+        )
+
+        assert result.rationale.startswith('Position up 25.0% - CONSIDER SELLING 25%')
+        assert result.partial_exit_pct == 25.0
+
+
+class TestVectorizedPortfolio:
+    """Test suite for analyze_portfolio_vectorized against analyze_position."""
+
+    def test_matches_analyze_position(self, manager):
+        """Test batch stops agree with the per-position path on random positions."""
+        rng = np.random.default_rng(7)
+        n = 300
+        entry_prices = rng.uniform(20, 500, n)
+        current_prices = entry_prices * (1 + rng.uniform(-0.3, 0.6, n))
+        # Exact tier edges, no-gain and invalid prices
+        current_prices[:6] = entry_prices[:6] * np.array([1.05, 1.10, 1.19, 1.20, 1.29, 1.30])
+        current_prices[6] = entry_prices[6]
+        entry_prices[7] = 0.0
+        current_prices[8] = 0.0
+        tickers = [f'T{i}' for i in range(n)]
+
+        scalar = []
+        for i, ticker in enumerate(tickers):
+            # Histories end within 10% of the current price, so both SMA-based
+            # and profit-based stops occur
+            last_close = max(current_prices[i], 1.0) * rng.uniform(0.9, 1.1)
+            scalar.append(manager.analyze_position(
+                ticker, entry_prices[i], current_prices[i],
+                price_data=_frame(260, seed=100 + i, last_close=last_close), verbose=False
+            ))
+        sma_50 = np.array([a.sma_50 or 0.0 for a in scalar])
+
+        batch = PositionManager.analyze_portfolio_vectorized(
+            tickers, entry_prices, current_prices, sma_50
+        )
+
+        assert list(batch.index) == tickers
+        assert (batch['stop_type'] == 'SMA-based').any()
+        assert (batch['stop_type'] == 'profit-based').any()
+        for analysis, (_, row) in zip(scalar, batch.iterrows()):
+            assert row['action'] == analysis.action, analysis.ticker
+            assert row['should_adjust_stop'] == analysis.should_adjust_stop, analysis.ticker
+            if not analysis.should_adjust_stop:
+                assert np.isnan(row['recommended_stop'])
+                continue
+            assert row['gain_pct'] == pytest.approx(analysis.current_gain_pct, abs=0.01)
+            assert row['partial_exit_pct'] == pytest.approx(analysis.partial_exit_pct, abs=0.1)
+            # np.round and round() may split a half-cent tie differently
+            assert row['recommended_stop'] == pytest.approx(analysis.recommended_stop, abs=0.01)
+            if row['recommended_stop'] == analysis.recommended_stop:
+                assert row['locked_profit_pct'] == pytest.approx(analysis.locked_profit_pct, abs=1e-9)
+
+    def test_invalid_prices_hold(self):
+        """Test zero or negative prices produce a hold without a stop."""
+        batch = PositionManager.analyze_portfolio_vectorized(
+            ['ZERO', 'NEG'], np.array([0.0, 100.0]), np.array([50.0, -1.0]), np.zeros(2)
+        )
+
+        assert list(batch['action']) == ['hold', 'hold']
+        assert not batch['should_adjust_stop'].any()
+        assert batch['recommended_stop'].isna().all()
+
+
+class TestPortfolioReport:
+    """Test suite for rendering analyze_portfolio results."""
+
+    @pytest.fixture
+    def result(self, manager, monkeypatch):
+        """analyze_portfolio over four positions with in-memory price data."""
+        frames = {
+            'AAPL': _frame(260, seed=11, last_close=125.0),
+            'MSFT': _frame(260, seed=12, last_close=102.0),
+        }
+        monkeypatch.setattr(manager, '_prefetch_price_data', lambda tickers: frames)
+        positions = [
+            {'ticker': 'AAPL', 'quantity': 10, 'average_buy_price': 100.0, 'current_price': 125.0},
+            {'ticker': 'MSFT', 'quantity': 5, 'average_buy_price': 100.0, 'current_price': 102.0},
+            {'ticker': 'LONG', 'quantity': 1, 'average_buy_price': 50.0, 'current_price': 80.0},
+            {'ticker': 'BAD', 'quantity': 1, 'average_buy_price': 0.0, 'current_price': 10.0},
+        ]
+        entry_dates = {
+            'AAPL': datetime.now() - timedelta(days=30),
+            'LONG': datetime.now() - timedelta(days=500),
+        }
+        return manager.analyze_portfolio(positions, entry_dates)
+
+    def test_returns_position_analyses(self, result):
+        """Test analyses come back as PositionAnalysis in input order."""
+        analyses = result['position_analyses']
+
+        assert all(isinstance(a, PositionAnalysis) for a in analyses)
+        assert [a.ticker for a in analyses] == ['AAPL', 'MSFT', 'LONG', 'BAD']
+        assert [a.quantity for a in analyses] == [10, 5, 1, 1]
+        assert analyses[0].action == 'take_partial_and_trail'
+        assert analyses[2].tax_treatment == 'long_term'
+
+    def test_summary(self, result):
+        """Test the summary counts are built from the analyses."""
+        assert result['summary'] == {
+            'total_positions': 4,
+            'positions_need_adjustment': 1,
+            'short_term_positions': 1,
+            'long_term_positions': 1,
+            'average_gain_pct': round((25.0 + 2.0 + 60.0 + 0.0) / 4, 2),
+        }
+        assert [u['ticker'] for u in result['urgent_actions']][-1] == 'BAD'
+
+    def test_format_report(self, manager, result):
+        """Test the summary block and each position render from PositionAnalysis."""
+        report = manager.format_portfolio_report(result)
+        aapl = result['position_analyses'][0]
+
+        assert (
+            "Total Positions: 4\n"
+            "Need Stop Adjustment: 1\n"
+            "Short-term (<1 year): 1\n"
+            "Long-term (1+ years): 1\n"
+            "Average Gain: +21.75%"
+        ) in report
+        assert "POSITION #1: AAPL" in report
+        assert "Entry: $100.00 | Current: $125.00 | Gain: +25.00%" in report
+        assert "Tax Treatment: SHORT_TERM\nDays Held: 30" in report
+        assert "ACTION: TAKE PARTIAL AND TRAIL" in report
+        assert f"✓ RECOMMENDED STOP LOSS: ${aapl.recommended_stop:.2f}" in report
+        assert "POSITION #3: LONG" in report
+        assert "LONG-TERM HOLD" in report
+        assert "Cannot analyze - invalid entry price: $0.00" in report
+        assert report.endswith("END OF REPORT\n" + "=" * 80)
@@ -0,0 +1,133 @@
+"""Tests for the persistent stock/ETF score memo."""
+
+import pickle
+
+import pytest
+
+from src.long_term import compounder_engine, etf_engine
+from src.long_term.score_cache import (
+    ScoreCache,
+    TickerScoreCache,
+    freeze,
+    input_digest,
+    source_fingerprint,
+)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """Score cache file inside a not-yet-created directory."""
+    return tmp_path / 'scores' / 'stock_scores.pkl'
+
+
+class TestKeys:
+    """Test suite for cache keys and fingerprints."""
+
+    def test_freeze_ignores_dict_order(self):
+        assert freeze({'a': 1, 'b': [1, {'c': 2}]}) == freeze({'b': [1, {'c': 2}], 'a': 1})
+        hash(freeze({'a': [1, 2], 'b': {'c': (3,)}}))
+
+    def test_input_digest(self):
+        digest = input_digest(({'ticker': 'AAPL'}, {'roic': 0.2, 'fcf_margin': 0.1}))
+
+        assert digest == input_digest(({'ticker': 'AAPL'}, {'fcf_margin': 0.1, 'roic': 0.2}))
+        assert digest != input_digest(({'ticker': 'AAPL'}, {'fcf_margin': 0.1, 'roic': 0.21}))
+
+    def test_source_fingerprint(self):
+        fingerprint = source_fingerprint(compounder_engine)
+
+        assert fingerprint == source_fingerprint(compounder_engine)
+        assert fingerprint != source_fingerprint(etf_engine)
+
+
+class TestScoreCache:
+    """Test suite for ScoreCache persistence and invalidation."""
+
+    def test_round_trip(self, cache_path):
+        cache = ScoreCache(cache_path, 'v1')
+        cache.put(('AAPL', 1.0), {'score': 80.0})
+        cache.save()
+
+        reopened = ScoreCache(cache_path, 'v1')
+        assert reopened.get(('AAPL', 1.0)) == {'score': 80.0}
+        assert reopened.get(('MSFT', 1.0)) is None
+        assert (reopened.hits, reopened.misses) == (1, 1)
+
+    def test_fingerprint_change_discards_entries(self, cache_path):
+        cache = ScoreCache(cache_path, 'v1')
+        cache.put('AAPL', 80.0)
+        cache.save()
+
+        assert ScoreCache(cache_path, 'v2').entries == {}
+
+    def test_save_is_atomic_and_skipped_when_clean(self, cache_path):
+        cache = ScoreCache(cache_path, 'v1')
+        cache.save()
+        assert not cache_path.exists()
+
+        cache.put('AAPL', 80.0)
+        cache.save()
+        assert not cache_path.with_name(cache_path.name + '.tmp').exists()
+        with open(cache_path, 'rb') as f:
+            assert pickle.load(f) == {'fingerprint': 'v1', 'entries': {'AAPL': 80.0}}
+
+        # Nothing changed since: the file is not rewritten
+        cache_path.write_bytes(b'sentinel')
+        cache.save()
+        assert cache_path.read_bytes() == b'sentinel'
+
+    def test_corrupt_file_starts_empty(self, cache_path):
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_bytes(b'not a pickle')
+
+        cache = ScoreCache(cache_path, 'v1')
+        assert cache.entries == {}
+        cache.put('AAPL', 80.0)
+        cache.save()
+        assert ScoreCache(cache_path, 'v1').get('AAPL') == 80.0
+
+
+class TestTickerScoreCache:
+    """Test suite for the one-entry-per-ticker score memo."""
+
+    def test_lookup_by_digest(self, cache_path):
+        cache = TickerScoreCache(cache_path, 'v1')
+        cache.store('AAPL', 'd1', {'score': 80.0})
+
+        assert cache.digest('AAPL') == 'd1'
+        assert cache.digest('MSFT') is None
+        assert cache.lookup('AAPL', 'd1') == {'score': 80.0}
+        assert cache.lookup('AAPL', 'd2') is None
+        assert cache.lookup('MSFT', 'd1') is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_store_replaces_entry(self, cache_path):
+        cache = TickerScoreCache(cache_path, 'v1')
+        cache.store('AAPL', 'd1', 80.0)
+        cache.store('AAPL', 'd2', 82.0)
+
+        assert len(cache.entries) == 1
+        assert cache.lookup('AAPL', 'd1') is None
+        assert cache.lookup('AAPL', 'd2') == 82.0
+
+    def test_prune(self, cache_path):
+        cache = TickerScoreCache(cache_path, 'v1')
+        for ticker in ('AAPL', 'MSFT', 'NVDA'):
+            cache.store(ticker, 'd', 1.0)
+        cache.save()
+
+        assert cache.prune(ticker for ticker in ('AAPL', 'NVDA', 'AMD')) == 1
+        assert set(cache.entries) == {'AAPL', 'NVDA'}
+        assert cache.prune(['AAPL', 'NVDA']) == 0
+
+        cache.save()
+        assert set(TickerScoreCache(cache_path, 'v1').entries) == {'AAPL', 'NVDA'}
+
+    def test_round_trip(self, cache_path):
+        cache = TickerScoreCache(cache_path, 'v1')
+        cache.store('AAPL', 'd1', {'score': 80.0, 'regime': 'STRUCTURAL_GROWTH'})
+        cache.save()
+
+        reopened = TickerScoreCache(cache_path, 'v1')
+        assert reopened.lookup('AAPL', 'd1') == {'score': 80.0, 'regime': 'STRUCTURAL_GROWTH'}
+        assert TickerScoreCache(cache_path, 'v2').digest('AAPL') is None
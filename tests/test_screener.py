@@ -23,6 +23,8 @@ from src.screening.indicators import (
     calculate_bollinger_bands,
     calculate_macd
 )
+from src.screening import phase_indicators
+from src.screening.phase_indicators import classify_phase, classify_phase_batch
 
 
 class TestValueScoring:
@@ -519,5 +521,85 @@ class TestEdgeCases:
             assert valid_rsi.iloc[-1] < 50
 
 
+class TestPhaseClassificationBatch:
+    """Test suite for batched phase classification."""
+
+    @staticmethod
+    def _frame(n_bars, seed, leading_nan=0):
+        """Random-walk OHLCV frame; the first leading_nan bars have no prices."""
+        rng = np.random.default_rng(seed)
+        close = 50 * np.cumprod(1 + rng.normal(0.001, 0.02, n_bars))
+        close[:leading_nan] = np.nan
+        return pd.DataFrame({
+            'Open': close,
+            'High': close * 1.01,
+            'Low': close * 0.99,
+            'Close': close,
+            'Volume': rng.integers(100_000, 1_000_000, n_bars).astype(float)
+        }, index=pd.bdate_range('2021-01-04', periods=n_bars))
+
+    @pytest.fixture(autouse=True)
+    def clear_phase_memo(self):
+        """Start and end each test with an empty classify_phase memo."""
+        phase_indicators._PHASE_CACHE.clear()
+        yield
+        phase_indicators._PHASE_CACHE.clear()
+
+    def test_batch_matches_per_symbol(self):
+        """Test batch results equal classify_phase on mixed-length histories."""
+        frames = {
+            'NORMAL': self._frame(300, seed=1),
+            'LONG': self._frame(252, seed=2),
+            'PADDED': self._frame(320, seed=3, leading_nan=80),
+            'SHORT': self._frame(150, seed=4),
+        }
+        prices = {'NORMAL': 60.0, 'PADDED': 45.0}
+
+        batch = classify_phase_batch(frames, prices)
+        phase_indicators._PHASE_CACHE.clear()
+
+        assert set(batch) == set(frames)
+        for ticker, frame in frames.items():
+            price = prices.get(ticker, frame['Close'].iloc[-1])
+            assert batch[ticker] == classify_phase(frame, price, symbol=ticker)
+
+    def test_short_history_is_insufficient(self):
+        """Test histories under 200 bars are reported, not classified."""
+        result = classify_phase_batch({'SHORT': self._frame(150, seed=5)})
+
+        assert result['SHORT']['phase'] == 0
+        assert result['SHORT']['phase_name'] == 'Insufficient Data'
+
+    def test_batch_fills_memo(self):
+        """Test batch results are served to later per-symbol calls."""
+        frame = self._frame(260, seed=6)
+        classify_phase_batch({'MEMO': frame})
+
+        assert len(phase_indicators._PHASE_CACHE) == 1
+        assert classify_phase(frame, frame['Close'].iloc[-1], symbol='MEMO') == \
+            classify_phase_batch({'MEMO': frame})['MEMO']
+
+    def test_memo_returns_independent_copies(self):
+        """Test mutating a returned result leaves the memoized one intact."""
+        frame = self._frame(260, seed=7)
+        price = frame['Close'].iloc[-1]
+        first = classify_phase_batch({'COPY': frame})['COPY']
+        expected_reasons = list(first['reasons'])
+        expected_vol = dict(first['volatility_contraction'])
+
+        first['reasons'].append('caller note')
+        first['volatility_contraction']['is_contracting'] = 'mutated'
+        second = classify_phase(frame, price, symbol='COPY')
+        second['reasons'].clear()
+        third = classify_phase(frame, price, symbol='COPY')
+
+        assert third['reasons'] == expected_reasons
+        assert third['volatility_contraction'] == expected_vol
+
+    def test_empty_batch(self):
+        """Test an empty mapping returns no results."""
+        assert classify_phase_batch({}) == {}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])